@@ -2,6 +2,7 @@ import math
 import psqe_bounds_correctly as psqe
 import psl_bounds_correctly as psl
 import sys
+import contextlib
 import copy
 import decimal as dec
 
@@ -14,18 +15,21 @@ class ProcData:
     The subproblem data used in algorithm
     """
 
-    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, quadratic: bool, counter=0, period_comp_lip=0):
+    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, quadratic: bool, counter=0, period_comp_lip=0,
+                 ends=None):
         """
         The constructor
         Args:
             sub_interval: the subproblem's interval
             split_point: the point to split interval
+            ends: enclosures at the interval's ends inherited from the parent, [(a, fa, dfa), (b, fb, dfb)]
         """
         self.sub_interval = sub_interval
         self.lip = lip
         self.counter = counter
         self.period_comp_lip = period_comp_lip
         self.quadratic = quadratic
+        self.ends = ends if ends is not None else [None, None]
 
 
 class ProcessorNew:
@@ -37,7 +41,8 @@ class ProcessorNew:
         Args:
             rec_v: record value
             rec_x: record point
-            problem: problem to solve
+            problem: problem to solve (correctly rounded, its backend attribute gives the interval arithmetics and
+                its context attribute the verified context the processing runs in, if any)
             eps: tolerance
             global_lipint: if True use global Lipschitz constant computed for the whole interval
             use_symm_lipint: if True use [-L,L], where L = max(|a|,|b|)
@@ -50,14 +55,18 @@ class ProcessorNew:
         self.rec_x = rec_x
         self.problem = problem
         self.eps = eps
-        self.ddi = problem.ddf(ival.Interval(dec.Decimal(problem.a), dec.Decimal(problem.b)))
-        self.di = problem.df(ival.Interval(dec.Decimal(problem.a), dec.Decimal(problem.b)))
+        self.backend = problem.backend
+        self.context = problem.context if problem.context is not None else contextlib.nullcontext()
+        self.a = self.backend.convert_to_interval(problem.a).a
+        self.b = self.backend.convert_to_interval(problem.b).b
+        self.ddi = problem.ddf(self.backend.Interval(self.a, self.b))
+        self.di = problem.df(self.backend.Interval(self.a, self.b))
+        self.fdf = problem.fused((0, 1))
         self.estimator = estimator
         self.reduction = reduction
         self.running = True
         self.adaptive = adaptive
-        self.sign_b = True if problem.objective(
-            ival.Interval(dec.Decimal(problem.b), dec.Decimal(problem.b))).b > 0 else False
+        self.sign_b = True if problem.objective(self.backend.Interval(self.b, self.b)).b > 0 else False
 
     def update_lipschitz(self, data: ProcData):
         """
@@ -68,32 +77,65 @@ class ProcessorNew:
             data.lip = self.problem.df(data.sub_interval)
             if self.use_symm_lipint:
                 L = max(-data.lip.a, data.lip.b)
-                data.lip = ival.Interval(-L, L)
+                data.lip = self.backend.Interval(-L, L)
         else:
             data.lip = self.problem.ddf(data.sub_interval)
             if self.use_symm_lipint:
                 L = max(-data.lip.a, data.lip.b)
-                data.lip = ival.Interval(-L, L)
+                data.lip = self.backend.Interval(-L, L)
+
+    def point_values(self, x, cached=None):
+        """
+        Encloses the objective (and its derivative for PSQE) at a point
+        Args:
+            x: the point (an end of the backend's intervals)
+            cached: the enclosures computed earlier (x, f, df) or None
+
+        Returns:
+            tuple (x, f, df), df is None for the Piyavskii estimator
+        """
+        if cached is not None and cached[0] == x and (self.estimator == 1 or cached[2] is not None):
+            return cached
+        ival_x = self.backend.Interval(x, x)
+        if self.estimator == 1:
+            return x, self.problem.objective(ival_x), None
+        ival_fx, ival_dfx = self.fdf(ival_x)
+        return x, ival_fx, ival_dfx
+
+    def end_values(self, data: ProcData):
+        """
+        Returns the enclosures at the ends of the subinterval reusing the ones inherited from the parent
+        Args:
+            data: data of sub_interval
+
+        Returns:
+            tuple (fa, fb, dfa, dfb)
+        """
+        left = self.point_values(data.sub_interval.a, data.ends[0])
+        right = self.point_values(data.sub_interval.b, data.ends[1])
+        data.ends = [left, right]
+        return left[1], right[1], left[2], right[2]
 
     def compute_bounds(self, data: ProcData, under: bool):
         a = data.sub_interval.a
         b = data.sub_interval.b
-        ival_a = ival.Interval(a, a)
-        ival_b = ival.Interval(b, b)
+        ival_fa, ival_fb, ival_dfa, ival_dfb = self.end_values(data)
         if self.estimator == 1:
-            return psl.PSL_Bounds(a, b, data.lip.a, data.lip.b, self.problem.objective(ival_a),
-                                  self.problem.objective(ival_b), under)
+            return psl.PSL_Bounds(a, b, data.lip.a, data.lip.b, ival_fa, ival_fb, under, backend=self.backend)
         else:
             assert self.estimator == 2
             return psqe.PSQE_Bounds(a=a, b=b, alp=data.lip.a, bet=data.lip.b,
-                                    ival_fa=self.problem.objective(ival_a),
-                                    ival_fb=self.problem.objective(ival_b),
-                                    ival_dfa=self.problem.df(ival_a), ival_dfb=self.problem.df(ival_b), under=under)
+                                    ival_fa=ival_fa, ival_fb=ival_fb,
+                                    ival_dfa=ival_dfa, ival_dfb=ival_dfb, under=under, backend=self.backend)
 
     def fzcp_process(self, data: ProcData):
         """
-        Process of branching
+        Process of branching (in the problem's verified context)
         """
+        with self.context:
+            return self._branch(data)
+
+    def _branch(self, data: ProcData):
         sub_interval = data.sub_interval
         lst = []
         obj = self.problem.objective
@@ -105,7 +147,7 @@ class ProcessorNew:
         #     return []
         if sub_interval.b > self.rec_x: return lst
         if self.rec_x - sub_interval.a <= self.eps:
-            self.res_list.append(ival.Interval(sub_interval.a, self.rec_x))
+            self.res_list.append(self.backend.Interval(sub_interval.a, self.rec_x))
             # print("(%lf,%lf),f(x_r)=%lf" % (sub_interval.a, self.rec_x, obj(self.rec_x)))
             self.running = False
             return lst
@@ -142,8 +184,8 @@ class ProcessorNew:
                 #         right_end = lower_estimator.get_right_end2()
                 if self.reduction == 1:
                     # if lower_estimator.get_fb() > 0:
-                    if ((sub_interval.b < dec.Decimal(self.problem.b) and sub_interval.b < self.rec_x) or
-                            (sub_interval.b == dec.Decimal(self.problem.b) and self.sign_b)):
+                    if ((sub_interval.b < self.b and sub_interval.b < self.rec_x) or
+                            (sub_interval.b == self.b and self.sign_b)):
                         right_end = lower_estimator.get_right_end_under_bound()
                         if right_end is None:
                             print('err')
@@ -162,7 +204,7 @@ class ProcessorNew:
             split_point = left_end + (right_end - left_end) / 2
             if right_end - left_end < self.eps:
                 # If width of the interval satisfies the precision requirement
-                res_ival = ival.Interval(left_end, right_end)
+                res_ival = self.backend.Interval(left_end, right_end)
                 self.res_list.append(res_ival)
                 # print("(%lf,%lf),lb=%lf,f(x2)=%lf" % (
                 #     left_end, right_end, lower_estimator.lower_bound_and_point()[1], obj(right_end)))
@@ -170,20 +212,73 @@ class ProcessorNew:
                 new_width = right_end - left_end
                 # print(new_width / width_of_interval)
                 if new_width / width_of_interval > 0.7:
-                    sub_1 = ival.Interval(left_end, split_point)
-                    if obj(ival.Interval(sub_1.b, sub_1.b)).b <= 0:
+                    sub_1 = self.backend.Interval(left_end, split_point)
+                    split_values = self.point_values(split_point)
+                    if split_values[1].b <= 0:
                         self.rec_x = sub_1.b
                     else:
-                        data2 = ProcData(sub_interval=ival.Interval(split_point, right_end),
+                        data2 = ProcData(sub_interval=self.backend.Interval(split_point, right_end),
                                          lip=copy.deepcopy(data.lip), counter=data.counter,
                                          quadratic=data.quadratic,
-                                         period_comp_lip=data.period_comp_lip)
+                                         period_comp_lip=data.period_comp_lip, ends=[split_values, data.ends[1]])
                         lst.append(data2)
 
                     data.sub_interval = sub_1
+                    data.ends = [data.ends[0], split_values]
                     lst.append(data)
                 else:
                     data.sub_interval.a = left_end
                     data.sub_interval.b = right_end
                     lst.append(data)
         return lst
+
+
+class ProcessorMixed(ProcessorNew):
+    """
+    Processor computing the bounds in binary64 intervals (interval_binary64) that re-evaluates the objective in
+    Decimal intervals at the points where the sign of the float enclosure is ambiguous, i.e. the enclosure
+    contains zero and a sign decision could not be made. Both enclosures are rigorous, so the result stays
+    certified while almost all evaluations run in floats.
+    """
+
+    def __init__(self, rec_v, rec_x, problem, checker, eps, **kwargs):
+        """
+        Initializes processor
+        Args:
+            rec_v: record value
+            rec_x: record point
+            problem: problem to solve on the binary64 backend
+            checker: the same problem on the decimal backend
+            eps: tolerance
+            kwargs: the other arguments of ProcessorNew
+        """
+        self.checker = checker
+        self.num_rechecks = 0
+        super().__init__(rec_v, rec_x, problem, eps, **kwargs)
+        fb = self.refine(self.b, problem.objective(self.backend.Interval(self.b, self.b)))
+        self.sign_b = True if fb.b > 0 else False
+
+    def refine(self, x, ival_fx):
+        """
+        Narrows the float enclosure of the objective at a point with the Decimal one if its sign is ambiguous
+        Args:
+            x: the point (float)
+            ival_fx: the float enclosure of the objective at x
+
+        Returns:
+            the enclosure to use
+        """
+        if not ival_fx.a <= 0 < ival_fx.b:
+            return ival_fx
+        self.num_rechecks += 1
+        d = dec.Decimal(x)
+        ival_dx = self.checker.objective(ival.Interval(d, d))
+        a = max(ival_fx.a, self.backend.convert_to_interval(ival_dx.a).a)
+        b = min(ival_fx.b, self.backend.convert_to_interval(ival_dx.b).b)
+        return self.backend.Interval(a, b)
+
+    def point_values(self, x, cached=None):
+        values = super().point_values(x, cached)
+        if values is cached:
+            return values
+        return x, self.refine(x, values[1]), values[2]
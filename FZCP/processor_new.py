@@ -16,16 +16,18 @@ class ProcData:
     The subproblem data used in algorithm
     """
 
-    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, counter: int):
+    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, counter: int, ends=None):
         """
         The constructor
         Args:
             sub_interval: the subproblem's interval
             split_point: the point to split interval
+            ends: values at the interval's ends inherited from the parent, [(a, fa, dfa), (b, fb, dfb)]
         """
         self.sub_interval = sub_interval
         self.lip = lip
         self.counter = counter
+        self.ends = ends if ends is not None else [None, None]
 
 
 class ProcessorNew:
@@ -52,6 +54,7 @@ class ProcessorNew:
         self.eps = eps
         self.ddi = problem.ddf(ival.Interval([problem.a, problem.b]))
         self.di = problem.df(ival.Interval([problem.a, problem.b]))
+        self.fdf = problem.fused((0, 1))
         self.estimator = estimator
         self.reduction = reduction
         self.running = True
@@ -73,16 +76,46 @@ class ProcessorNew:
                 L = max(-data.lip.x[0], data.lip.x[1])
                 data.lip = ival.Interval([-L, L])
 
+    def point_values(self, x, cached=None):
+        """
+        Evaluates the objective (and its derivative for PSQE) at a point
+        Args:
+            x: the point
+            cached: the values computed earlier (x, f, df) or None
+
+        Returns:
+            tuple (x, f, df), df is None for the Piyavskii estimator
+        """
+        if cached is not None and cached[0] == x and (self.estimator == 1 or cached[2] is not None):
+            return cached
+        if self.estimator == 1:
+            return x, self.problem.objective(x), None
+        fx, dfx = self.fdf(x)
+        return x, fx, dfx
+
+    def end_values(self, data: ProcData):
+        """
+        Returns the values at the ends of the subinterval reusing the ones inherited from the parent
+        Args:
+            data: data of sub_interval
+
+        Returns:
+            tuple (fa, fb, dfa, dfb)
+        """
+        left = self.point_values(data.sub_interval.x[0], data.ends[0])
+        right = self.point_values(data.sub_interval.x[1], data.ends[1])
+        data.ends = [left, right]
+        return left[1], right[1], left[2], right[2]
+
     def compute_bounds(self, data: ProcData, under: bool):
         a = data.sub_interval.x[0]
         b = data.sub_interval.x[1]
+        fa, fb, dfa, dfb = self.end_values(data)
         if self.estimator == 1:
-            return psl.PSL_Bounds(a, b, data.lip.x[0], data.lip.x[1], self.problem.objective(a),
-                                  self.problem.objective(b), under)
+            return psl.PSL_Bounds(a, b, data.lip.x[0], data.lip.x[1], fa, fb, under)
         else:
-            return psqe.PSQE_Bounds(a=a, b=b, alp=data.lip.x[0], bet=data.lip.x[1], fa=self.problem.objective(a),
-                                    fb=self.problem.objective(b),
-                                    dfa=self.problem.df(a), dfb=self.problem.df(b), under=under)
+            return psqe.PSQE_Bounds(a=a, b=b, alp=data.lip.x[0], bet=data.lip.x[1], fa=fa, fb=fb,
+                                    dfa=dfa, dfb=dfb, under=under)
 
     def fzcp_process(self, data: ProcData):
         """
@@ -148,14 +181,17 @@ class ProcessorNew:
                 # print(new_width / width_of_interval)
                 if new_width / width_of_interval > 0.7:
                     sub_1 = ival.Interval([left_end, split_point])
-                    if obj(sub_1.x[1]) <= 0:
+                    split_values = self.point_values(split_point)
+                    if split_values[1] <= 0:
                         self.rec_x = sub_1.x[1]
                     else:
                         data2 = ProcData(sub_interval=ival.Interval([split_point, right_end]),
-                                         lip=copy.deepcopy(data.lip), counter=data.counter)
+                                         lip=copy.deepcopy(data.lip), counter=data.counter,
+                                         ends=[split_values, data.ends[1]])
                         lst.append(data2)
 
                     data.sub_interval = sub_1
+                    data.ends = [data.ends[0], split_values]
                     lst.append(data)
                 else:
                     data.sub_interval.x[0] = left_end
@@ -15,7 +15,7 @@ class PSL_Bounds:
     """
 
     def __init__(self, a: dec.Decimal, b: dec.Decimal, alp: dec.Decimal, bet: dec.Decimal, ival_fa: int_arith.Interval,
-                 ival_fb: int_arith.Interval, under: bool):
+                 ival_fb: int_arith.Interval, under: bool, backend=int_arith):
         """
         The piecewise linear estimator constiructor
         Args:
@@ -25,7 +25,10 @@ class PSL_Bounds:
             bet: upper end of the Lipschitzian interval
             f: objective
             under: if True compute the under bound
+            backend: interval arithmetics module of the ends and enclosures (interval_arithmetics or
+                interval_binary64)
         """
+        self.backend = backend
         self.a = a
         self.b = b
         self.under = under
@@ -40,12 +43,12 @@ class PSL_Bounds:
             self.bet = -alp
             self.ival_fa = -ival_fa
             self.ival_fb = -ival_fb
-        self.ival_a = int_arith.Interval(self.a, self.a)
-        self.ival_b = int_arith.Interval(self.b, self.b)
+        self.ival_a = self.backend.Interval(self.a, self.a)
+        self.ival_b = self.backend.Interval(self.b, self.b)
         self.fa = self.ival_fa.a
         self.fb = self.ival_fb.a
-        self.ival_alp = int_arith.Interval(self.alp, self.alp)
-        self.ival_bet = int_arith.Interval(self.bet, self.bet)
+        self.ival_alp = self.backend.Interval(self.alp, self.alp)
+        self.ival_bet = self.backend.Interval(self.bet, self.bet)
 
         self.ival_c = (self.ival_fa - self.ival_fb + self.ival_bet * self.ival_b - self.ival_alp * self.ival_a) / (
                 self.ival_bet - self.ival_alp)
@@ -62,12 +65,12 @@ class PSL_Bounds:
         return True
 
     def estimator_l1(self, x: dec.Decimal):
-        ival_x = int_arith.Interval(x, x)
+        ival_x = self.backend.Interval(x, x)
         """ left part of linear estimator"""
         return self.ival_fa + self.ival_alp * (ival_x - self.ival_a)
 
     def estimator_l2(self, x: dec.Decimal):
-        ival_x = int_arith.Interval(x, x)
+        ival_x = self.backend.Interval(x, x)
         """ right part of linear estimator"""
         return self.ival_fb + self.ival_bet * (ival_x - self.ival_b)
 
@@ -104,7 +107,7 @@ class PSL_Bounds:
             record_x = self.b
             record_v = self.ival_fb.a
         else:
-            record_x = int_arith.mid(self.ival_c)
+            record_x = self.backend.mid(self.ival_c)
             record_v = self.estimator_l2(self.ival_c.b).a
         if not self.under:
             record_v = -record_v
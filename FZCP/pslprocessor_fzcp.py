@@ -11,15 +11,19 @@ class PSLData:
     The subproblem data used on PSL subproblems
     """
 
-    def __init__(self, ival, split_point):
+    def __init__(self, ival, split_point, fa=None, fb=None):
         """
         The constructor
         Args:
             ival: the subproblem's interval
             split_point: the point to split interval
+            fa: objective's value at the left end (None - not computed yet)
+            fb: objective's value at the right end (None - not computed yet)
         """
         self.ival = ival
         self.split_point = split_point
+        self.fa = fa
+        self.fb = fb
 
 
 class PSLProcessor:
@@ -55,8 +59,11 @@ class PSLProcessor:
         if self.use_symm_lipint:
             L = max(-di[0], di[1])
             di = ival.Interval([-L, L])
-
-        return ps.PSL_Bounds(sub.data.ival[0], sub.data.ival[1], di[0], di[1], self.problem.objective, under)
+        if sub.data.fa is None:
+            sub.data.fa = self.problem.objective(sub.data.ival[0])
+        if sub.data.fb is None:
+            sub.data.fb = self.problem.objective(sub.data.ival[1])
+        return ps.PSL_Bounds(sub.data.ival[0], sub.data.ival[1], di[0], di[1], sub.data.fa, sub.data.fb, under)
 
     def updateSplitAndBounds(self, sub):
         psqe_upper = self.compute_bounds(sub, False)
@@ -80,14 +87,17 @@ class PSLProcessor:
             if sub.data.ival.x[1] - sub.data.ival.x[0] < self.eps and obj(sub.data.ival.x[1]) <= 0:
                 self.res_list.append(sub.data.split_point)
             else:
+                fc = obj(sub.data.split_point)
                 sub_1 = sb.Sub(sub.level + 1, [0, 0],
-                               PSLData(ival.Interval([sub.data.ival.x[0], sub.data.split_point]), None))
+                               PSLData(ival.Interval([sub.data.ival.x[0], sub.data.split_point]), None,
+                                       sub.data.fa, fc))
                 self.updateSplitAndBounds(sub_1)
                 sub_2 = sb.Sub(sub.level + 1, [0, 0],
-                               PSLData(ival.Interval([sub.data.split_point, sub.data.ival.x[1]]), None))
+                               PSLData(ival.Interval([sub.data.split_point, sub.data.ival.x[1]]), None,
+                                       fc, sub.data.fb))
                 self.updateSplitAndBounds(sub_2)
                 lst.append(sub_2)
-                if obj(sub_1.data.ival[1]) <= 0 and sub_1.data.ival[1] < self.rec_x:
+                if fc <= 0 and sub_1.data.ival[1] < self.rec_x:
                     self.rec_x = sub_1.data.ival[1]
                 lst.append(sub_1)
         return lst
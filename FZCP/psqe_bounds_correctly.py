@@ -9,7 +9,8 @@ class PSQE_Bounds:
     """
 
     def __init__(self, a: dec.Decimal, b: dec.Decimal, alp: dec.Decimal, bet: dec.Decimal, ival_fa: int_arith.Interval,
-                 ival_fb: int_arith.Interval, ival_dfa: int_arith.Interval, ival_dfb: int_arith.Interval, under: bool):
+                 ival_fb: int_arith.Interval, ival_dfa: int_arith.Interval, ival_dfb: int_arith.Interval, under: bool,
+                 backend=int_arith):
         """
         The smooth piecewise quadratic estimator constiructor
         Args:
@@ -20,7 +21,10 @@ class PSQE_Bounds:
             f: objective
             df: objective's derivative
             under: if True compute the under bound
+            backend: interval arithmetics module of the ends and enclosures (interval_arithmetics or
+                interval_binary64)
         """
+        self.backend = backend
         self.a = a
         self.b = b
         self.under = under
@@ -47,11 +51,11 @@ class PSQE_Bounds:
             self.dfa = -ival_dfa.a
             self.dfb = -ival_dfb.b
 
-        self.ival_a = int_arith.Interval(self.a, self.a)
-        self.ival_b = int_arith.Interval(self.b, self.b)
+        self.ival_a = self.backend.Interval(self.a, self.a)
+        self.ival_b = self.backend.Interval(self.b, self.b)
 
-        self.ival_alp = int_arith.Interval(self.alp, self.alp)
-        self.ival_bet = int_arith.Interval(self.bet, self.bet)
+        self.ival_alp = self.backend.Interval(self.alp, self.alp)
+        self.ival_bet = self.backend.Interval(self.bet, self.bet)
 
         delt = (self.ival_dfb - self.ival_dfa - self.ival_alp * (self.ival_b - self.ival_a)) / (
                 self.ival_bet - self.ival_alp)
@@ -116,7 +120,7 @@ class PSQE_Bounds:
 
         Returns: underestimator's value
         """
-        ival_x = int_arith.Interval(x, x)
+        ival_x = self.backend.Interval(x, x)
         if x <= self.ival_c.b:
             res = self.estimator_q1(ival_x)
         elif x < self.ival_d.a:
@@ -276,7 +280,7 @@ class PSQE_Bounds:
 
         d1 = self.delta_first()
         if d1.b >= 0:
-            if d1.a < 0: d1.a = int_arith.c_zero
+            if d1.a < 0: d1.a = self.backend.c_zero
             rl = self.root_first_left(d1)
             rr = self.root_first_right(d1)
             res = self.root_first_left(d1).a
@@ -285,7 +289,7 @@ class PSQE_Bounds:
 
         d2 = self.delta_second()
         if d2.b >= 0:
-            if d2.a < 0: d2.a = int_arith.c_zero
+            if d2.a < 0: d2.a = self.backend.c_zero
             rl = self.root_second_left(d2)
             rr = self.root_second_right(d2)
             res = self.root_second_left(d2).a
@@ -294,7 +298,7 @@ class PSQE_Bounds:
 
         d3 = self.delta_third()
         if d3.b >= 0:
-            if d3.a < 0: d3.a = int_arith.c_zero
+            if d3.a < 0: d3.a = self.backend.c_zero
             rl = self.root_third_left(d3)
             rr = self.root_third_right(d3)
             res = self.root_third_left(d3).a
@@ -314,21 +318,21 @@ class PSQE_Bounds:
 
         d1 = self.delta_first()
         if d1.b >= 0:
-            if d1.a < 0: d1.a = int_arith.c_zero
+            if d1.a < 0: d1.a = self.backend.c_zero
             res = self.root_first_right(d1).b
             if self.a <= res <= self.ival_c.b:
                 return res
 
         d2 = self.delta_second()
         if d2.b >= 0:
-            if d2.a < 0: d2.a = int_arith.c_zero
+            if d2.a < 0: d2.a = self.backend.c_zero
             res = self.root_second_right(d2).b
             if self.ival_c.a <= res <= self.ival_d.b:
                 return res
 
         d3 = self.delta_third()
         if d3.b >= 0:
-            if d3.a < 0: d3.a = int_arith.c_zero
+            if d3.a < 0: d3.a = self.backend.c_zero
             res = self.root_third_right(d3).b
             if self.ival_d.a <= res <= self.b:
                 return res
@@ -342,7 +346,7 @@ class PSQE_Bounds:
             return self.b
         d3 = self.delta_third()
         if d3.b >= 0:
-            if d3.a < 0: d3.a = int_arith.c_zero
+            if d3.a < 0: d3.a = self.backend.c_zero
             res = self.root_third_right(d3)
             if res.b > self.b > res.a:
                 return self.b
@@ -350,7 +354,7 @@ class PSQE_Bounds:
                 return res.b
         d2 = self.delta_second()
         if d2.b >= 0:
-            if d2.a < 0: d2.a = int_arith.c_zero
+            if d2.a < 0: d2.a = self.backend.c_zero
             res = self.root_second_right(d2)
             if res.b > self.ival_d.a > res.a:
                 return self.ival_d.a
@@ -358,7 +362,7 @@ class PSQE_Bounds:
                 return res.b
         d1 = self.delta_first()
         if d1.b >= 0:
-            if d1.a < 0: d1.a = int_arith.c_zero
+            if d1.a < 0: d1.a = self.backend.c_zero
             res = self.root_first_right(d1)
             if res.b > self.ival_c.b > res.a:
                 return self.ival_c.b
@@ -11,15 +11,23 @@ class PSQEData:
     The subproblem data used on PSQE subproblems
     """
 
-    def __init__(self, ival, split_point):
+    def __init__(self, ival, split_point, fa=None, fb=None, dfa=None, dfb=None):
         """
         The constructor
         Args:
             ival: the subproblem's interval
             split_point: the point to split interval
+            fa: objective's value at the left end (None - not computed yet)
+            fb: objective's value at the right end (None - not computed yet)
+            dfa: derivative's value at the left end
+            dfb: derivative's value at the right end
         """
         self.ival = ival
         self.split_point = split_point
+        self.fa = fa
+        self.fb = fb
+        self.dfa = dfa
+        self.dfb = dfb
 
 
 class PSQEProcessor_FZCP:
@@ -46,6 +54,7 @@ class PSQEProcessor_FZCP:
         self.problem = problem
         self.eps = eps
         self.ddi = problem.ddf(ival.Interval([problem.a, problem.b]))
+        self.fdf = problem.fused((0, 1))
 
     def compute_bounds(self, sub, under):
         """
@@ -59,8 +68,13 @@ class PSQEProcessor_FZCP:
         if self.use_symm_lipint:
             L = max(-self.ddi.x[0], self.ddi.x[1])
             ddi = ival.Interval([-L, L])
-        return fps.PSQE_Bounds(sub.data.ival[0], sub.data.ival[1], ddi[0], ddi[1], self.problem.objective,
-                               self.problem.df, under)
+        data = sub.data
+        if data.fa is None:
+            data.fa, data.dfa = self.fdf(data.ival[0])
+        if data.fb is None:
+            data.fb, data.dfb = self.fdf(data.ival[1])
+        return fps.PSQE_Bounds(data.ival[0], data.ival[1], ddi[0], ddi[1], data.fa, data.fb, data.dfa, data.dfb,
+                               under)
 
     def updateSplitAndBounds(self, sub):
         psqe_upper = self.compute_bounds(sub, False)
@@ -87,14 +101,18 @@ class PSQEProcessor_FZCP:
                 # If width of the interval satisfies the precision requirement
                 self.res_list.append(sub.data.split_point)
             else:
+                data = sub.data
+                fc, dfc = self.fdf(data.split_point)
                 sub_left = sb.Sub(sub.level + 1, [0, 0],
-                                  PSQEData(ival.Interval([sub.data.ival.x[0], sub.data.split_point]), None))
+                                  PSQEData(ival.Interval([data.ival.x[0], data.split_point]), None,
+                                           data.fa, fc, data.dfa, dfc))
                 self.updateSplitAndBounds(sub_left)
-                if obj(sub_left.data.ival[1]) <= 0 and sub_left.data.ival[1] < self.rec_x:
+                if fc <= 0 and sub_left.data.ival[1] < self.rec_x:
                     self.rec_x = sub_left.data.ival[1]
                 else:
                     sub_right = sb.Sub(sub.level + 1, [0, 0],
-                                       PSQEData(ival.Interval([sub.data.split_point, sub.data.ival.x[1]]), None))
+                                       PSQEData(ival.Interval([data.split_point, data.ival.x[1]]), None,
+                                                fc, data.fb, dfc, data.dfb))
                     self.updateSplitAndBounds(sub_right)
                     lst.append(sub_right)
                 lst.append(sub_left)
@@ -112,6 +130,8 @@ class PSQEProcessor_FZCP:
             left_end = psqe_under.getNewTrialPoint()
             right_end = psqe_upper.getNewTrialPoint()
             sub.data.ival.x[0] = left_end
+            sub.data.fa = None
             if right_end < sub.data.ival.x[1]:
                 sub.data.ival.x[1] = right_end
+                sub.data.fb = None
             # print("[", sub.data.ival.x[0], ", ", sub.data.ival.x[1], "],", sub.data.split_point)
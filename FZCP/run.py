@@ -8,6 +8,7 @@ import numpy as np
 # import matplotlib.pyplot as plt
 import solv_fzcp as sfzcp
 import uvarprob as uvpr
+import probcache
 from line_profiler import LineProfiler
 import psl_bounds as psl
 test_file = "../tst3.csv"
@@ -26,16 +27,13 @@ skip = 1000
 legend_size = 2
 
 
-def log_point(x, points_list):
-    points_list.append(x)
-
-
 def read_problems(fname):
     data = pd.read_csv(fname, index_col='name', comment='#')
     return data
 
 
 points_db = {}
+problem_cache = probcache.ProblemCache()
 psl_lipint_points_list = []
 psl_lip_points_list = []
 psqe_lipint_points_list = []
@@ -48,9 +46,9 @@ def fun():
     print('test.Index,PC_N,PI_N,QC_N,QI_N,PC_R,PI_R,QC_R,QI_R')
     eps = 1e-5
     for test in df.itertuples():
-        points_db[test.Index] = {'bnb2_pslint_points_list': []}
         prob = uvpr.UniVarProblem(test.Index, test.objective, test.a, test.b, test.min_f, test.min_x,
-                                  lambda x: log_point(x, points_db[test.Index]['bnb2_pslint_points_list']))
+                                  cache=problem_cache)
+        points_db[test.Index] = prob.enable_accounting()
         T1 = time.perf_counter()
         PC_N = sfzcp.new_method(prob, symm=True, epsilon=eps, global_lipschitz_interval=True, estimator=1,
                                 reduction=True).nsteps
@@ -10,10 +10,8 @@ import processor_Casado as casproc
 
 sys.path.append("..")
 import interval as ival
-import interval_arithmetics as ival_corr
 import bnb as bnb
 import sub as sub
-import decimal as dec
 
 TestResult = namedtuple('TestResult', ['nsteps', 'first_crossing_zero_point'])
 
@@ -100,14 +98,11 @@ def new_method(prob, symm=True, max_steps=sys.maxsize, epsilon=1e-2, global_lips
     return TestResult(nsteps=steps, first_crossing_zero_point=psp.res_list)
 
 
-def correctly(prob, symm=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=False,
-              known_record=False, estimator=2, reduction=1, adaptive=False):
-    psp = corrproc.ProcessorNew(rec_v=get_initial_recval(prob, known_record), rec_x=dec.Decimal(prob.b), problem=prob,
-                                eps=epsilon, global_lipint=global_lipschitz_interval, use_symm_lipint=symm,
-                                estimator=estimator, reduction=reduction, adaptive=adaptive)
+def _verified_search(prob, psp, estimator, global_lipschitz_interval, max_steps):
+    backend = psp.backend
+    interval = backend.Interval(psp.a, psp.b)
     sl = []
-    interval = ival_corr.Interval(dec.Decimal(prob.a), dec.Decimal(prob.b))
-    data = corrproc.ProcData(sub_interval=interval, lip=ival_corr.Interval(dec.Decimal('0'), dec.Decimal('0')),
+    data = corrproc.ProcData(sub_interval=interval, lip=backend.Interval(backend.c_zero, backend.c_zero),
                              quadratic=True if estimator == 2 else False,
                              counter=0, period_comp_lip=0)
     psp.update_lipschitz(data)
@@ -121,3 +116,28 @@ def correctly(prob, symm=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipsc
     cnt = max_steps
     steps = bnb.bnb_fzcp(sl, cnt, psp)
     return TestResult(nsteps=steps, first_crossing_zero_point=psp.res_list)
+
+
+def correctly(prob, symm=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=False,
+              known_record=False, estimator=2, reduction=1, adaptive=False):
+    backend = prob.backend
+    psp = corrproc.ProcessorNew(rec_v=get_initial_recval(prob, known_record),
+                                rec_x=backend.convert_to_interval(prob.b).b, problem=prob,
+                                eps=epsilon, global_lipint=global_lipschitz_interval, use_symm_lipint=symm,
+                                estimator=estimator, reduction=reduction, adaptive=adaptive)
+    return _verified_search(prob, psp, estimator, global_lipschitz_interval, max_steps)
+
+
+def mixed(prob, symm=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=False,
+          known_record=False, estimator=2, reduction=1, adaptive=False):
+    """
+    Verified search in binary64 intervals re-evaluating the ambiguous signs of the objective in Decimal intervals
+    (see processor_correctly.ProcessorMixed), the arguments are the same as for correctly
+    """
+    fast = prob.with_backend("binary64")
+    psp = corrproc.ProcessorMixed(rec_v=get_initial_recval(prob, known_record),
+                                  rec_x=fast.backend.convert_to_interval(prob.b).b, problem=fast,
+                                  checker=prob.with_backend("decimal"), eps=epsilon,
+                                  global_lipint=global_lipschitz_interval, use_symm_lipint=symm,
+                                  estimator=estimator, reduction=reduction, adaptive=adaptive)
+    return _verified_search(fast, psp, estimator, global_lipschitz_interval, max_steps)
@@ -6,10 +6,7 @@ sys.path.append("..")
 import pandas as pd
 import solv_fzcp as sfzcp
 import uvarprob as uvpr
-
-
-def log_point(x, points_list):
-    points_list.append(x)
+import probcache
 
 
 def read_problems(fname):
@@ -18,6 +15,7 @@ def read_problems(fname):
 
 
 points_db = {}
+problem_cache = probcache.ProblemCache()
 psl_lipint_points_list = []
 psl_lip_points_list = []
 psqe_lipint_points_list = []
@@ -172,9 +170,9 @@ def test_alg2(df, eps, global_lip, repeat):
     for test in df.itertuples():
         it_list_row = [None] * 8
         time_list_row = [0.] * 8
-        points_db[test.Index] = {'bnb2_pslint_points_list': []}
         prob = uvpr.UniVarProblem(test.Index, test.objective, test.a, test.b, test.min_f, test.min_x,
-                                  lambda x: log_point(x, points_db[test.Index]['bnb2_pslint_points_list']), True)
+                                  preproc=True, cache=problem_cache)
+        points_db[test.Index] = prob.enable_accounting()
         T1 = time.perf_counter()
         for num in range(0, repeat):
             PC_N = sfzcp.new_method(prob, symm=True, epsilon=eps, global_lipschitz_interval=global_lip, estimator=1,
@@ -294,9 +292,9 @@ def test_casado(df, eps, repeat):
     for test in df.itertuples():
         it_list_row = [None] * 3
         time_list_row = [0.] * 3
-        points_db[test.Index] = {'bnb2_pslint_points_list': []}
         prob = uvpr.UniVarProblem(test.Index, test.objective, test.a, test.b, test.min_f, test.min_x,
-                                  lambda x: log_point(x, points_db[test.Index]['bnb2_pslint_points_list']), True)
+                                  preproc=True, cache=problem_cache)
+        points_db[test.Index] = prob.enable_accounting()
         for num in range(0, repeat):
             T1 = time.perf_counter()
             Cas = sfzcp.cas(prob=prob, sym=False, epsilon=eps).nsteps
@@ -363,9 +361,9 @@ def test_alg3(df, eps, global_lip, repeat):
         for test in df.itertuples():
             it_list_row = np.zeros(8, dtype=int)
             time_list_row = np.zeros(8, dtype=float)
-            points_db[test.Index] = {'bnb2_pslint_points_list': []}
             prob = uvpr.UniVarProblem(test.Index, test.objective, test.a, test.b, test.min_f, test.min_x,
-                                      lambda x: log_point(x, points_db[test.Index]['bnb2_pslint_points_list']), True)
+                                      preproc=True, cache=problem_cache)
+            points_db[test.Index] = prob.enable_accounting()
 
             T1 = time.perf_counter()
             PC_N = sfzcp.new_method(prob, symm=True, epsilon=eps, global_lipschitz_interval=global_lip, estimator=1,
@@ -497,9 +495,9 @@ def test_last(df, eps, repeat, global_lip=True):
             # eps = ep * (test.b - test.a)
             it_list_row = np.zeros(9, dtype=int)
             time_list_row = np.zeros(9, dtype=float)
-            points_db[test.Index] = {'bnb2_pslint_points_list': []}
             prob = uvpr.UniVarProblem(test.Index, test.objective, test.a, test.b, test.min_f, test.min_x,
-                                      lambda x: log_point(x, points_db[test.Index]['bnb2_pslint_points_list']), True)
+                                      preproc=True, cache=problem_cache)
+            points_db[test.Index] = prob.enable_accounting()
 
             T1 = time.perf_counter()
             Cas = sfzcp.cas(prob=prob, sym=False, epsilon=eps * (test.b - test.a)).nsteps
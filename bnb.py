@@ -1,21 +1,496 @@
-def bnb(subs, max_steps, processor):
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from sortedcontainers import SortedList
+
+# Selection policies of OpenList
+policies = ("best", "depth", "breadth", "hybrid")
+
+
+class OpenList:
+    """ Open subproblems of the Branch-and-Bound
+
+    The subproblems are selected by a policy: "best" - the smallest bound first, "depth" - the deepest (the
+    latest among the equally deep) first, "breadth" - the shallowest (the earliest among the equally deep) first,
+    "hybrid" - dives into the children of the last processed subproblem (choosing the one with the smallest bound)
+    for at most dive steps, then takes the subproblem with the smallest bound. Independently of the policy the
+    bounds are kept ordered, so the minimal bound over the open subproblems is available at every step and the
+    subproblems dominated by a new record are removed at once. All operations take O(log n) (per removed
+    subproblem for prune).
+
+    Attributes:
+        policy: the selection policy
+        dive: maximal number of consecutive dive steps of the hybrid policy
+        num_pruned: number of subproblems removed by prune
+    """
+
+    def __init__(self, policy="best", subs=(), dive=16):
+        """
+        Constructor
+        Args:
+            policy: selection policy (one of policies)
+            subs: initial subproblems
+            dive: maximal number of consecutive dive steps of the hybrid policy
+        """
+        if policy not in policies:
+            raise ValueError("Unknown selection policy " + str(policy))
+        self.policy = policy
+        self.dive = dive
+        # Sequence number of the next added subproblem
+        self._seq = 0
+        # Entries (priority, seq), the last one is selected
+        self._order = SortedList()
+        # Entries (bound, seq)
+        self._bounds = SortedList()
+        # seq -> (sub, priority, bound)
+        self._subs = {}
+        # Subproblems added since the last pop and the length of the current dive (hybrid policy)
+        self._children = []
+        self._dived = 0
+        self.num_pruned = 0
+        self.update(subs)
+
+    def _priority(self, s, seq):
+        if self.policy == "depth":
+            return s.level, seq
+        elif self.policy == "breadth":
+            return -s.level, -seq
+        else:
+            return -s.bound, s.level, seq
+
+    def add(self, s):
+        """
+        Adds a subproblem (its bound should not change while it is in the list)
+        Args:
+            s: the subproblem
+        """
+        seq = self._seq
+        self._seq += 1
+        priority = self._priority(s, seq)
+        self._subs[seq] = (s, priority, s.bound)
+        self._order.add((priority, seq))
+        self._bounds.add((s.bound, seq))
+        if self.policy == "hybrid":
+            self._children.append(seq)
+
+    def update(self, subs):
+        """
+        Adds subproblems
+        Args:
+            subs: iterable of subproblems
+        """
+        for s in subs:
+            self.add(s)
+
+    extend = update
+
+    def _remove(self, seq):
+        s, priority, bound = self._subs.pop(seq)
+        self._order.remove((priority, seq))
+        self._bounds.remove((bound, seq))
+        return s
+
+    def pop(self):
+        """
+        Removes the subproblem selected by the policy
+
+        Returns:
+            the subproblem
+        """
+        if self.policy == "hybrid" and self._children and self._dived < self.dive:
+            seq = min(self._children, key=lambda i: self._subs[i][2])
+            self._dived += 1
+        else:
+            seq = self._order[-1][1]
+            self._dived = 0
+        self._children = []
+        return self._remove(seq)
+
+    def split(self):
+        """
+        Removes every second subproblem in the selection order starting from the second one (to hand them over to
+        another worker, see bnb_parallel)
+
+        Returns:
+            list of the removed subproblems
+        """
+        entries = self._order[-2::-2]
+        res = []
+        for priority, seq in entries:
+            s, _, bound = self._subs.pop(seq)
+            self._order.remove((priority, seq))
+            self._bounds.remove((bound, seq))
+            res.append(s)
+        if self._children:
+            self._children = [seq for seq in self._children if seq in self._subs]
+        return res
+
+    def prune(self, threshold):
+        """
+        Removes the subproblems with bounds greater or equal to the threshold
+        Args:
+            threshold: the threshold (the record value minus the tolerance)
+
+        Returns:
+            number of removed subproblems
+        """
+        i = self._bounds.bisect_left((threshold,))
+        removed = self._bounds[i:]
+        if not removed:
+            return 0
+        del self._bounds[i:]
+        for _, seq in removed:
+            priority = self._subs.pop(seq)[1]
+            self._order.remove((priority, seq))
+        if self._children:
+            self._children = [seq for seq in self._children if seq in self._subs]
+        self.num_pruned += len(removed)
+        return len(removed)
+
+    def min_bound(self):
+        """
+        Returns:
+            the minimal bound of the open subproblems (None if the list is empty)
+        """
+        if not self._bounds:
+            return None
+        return self._bounds[0][0]
+
+    def __len__(self):
+        return len(self._subs)
+
+    def __iter__(self):
+        return (self._subs[seq][0] for _, seq in self._order)
+
+    def __repr__(self):
+        return "OpenList(" + self.policy + ", " + str(list(self)) + ")"
+
+
+def lower_bound(subs, processor):
+    """
+    Computes the global lower bound of the minimization
+
+    Args:
+        subs: the open list (OpenList)
+        processor: the processor
+
+    Returns:
+        the minimum of the record value and the bounds of the open subproblems
+    """
+    b = subs.min_bound()
+    return processor.rec_v if b is None or processor.rec_v < b else b
+
+
+def bnb(subs, max_steps, processor, gap=None, checkpoint=None, time_limit=None, callback=None, snapshot_steps=None,
+        snapshot_interval=None):
     """
     Main Branch-and-Bound driver
 
     Args:
-        subs: the list of subproblems
+        subs: the list of subproblems (OpenList or any sorted container with pop and update, e.g. SortedKeyList)
         max_steps: mximal number of steps to perform
         processor: the processor
+        gap: stop when the record value exceeds the global lower bound by at most gap (None - solve to the
+            processor's tolerance, requires OpenList otherwise)
+        checkpoint: checkpoint.Checkpointer saving the state of the run periodically and at its end (None - no
+            checkpoints), the run is continued with checkpoint.resume
+        time_limit: stop after the given time (seconds, None - no limit), the open subproblems are left in subs
+        callback: function called with the Progress events of the run (see bnb_iter), None - no events
+        snapshot_steps: steps between the "snapshot" events (None - no snapshots by steps)
+        snapshot_interval: time between the "snapshot" events (seconds, None - no snapshots by time)
+
+    If subs is an OpenList the subproblems dominated by the record (bound >= rec_v - eps) are pruned from it
+    every time the processor improves the record, they are counted in subs.num_pruned.
 
     Returns:
         number of actually performed steps
     """
+    run = bnb_iter(subs, max_steps, processor, gap, checkpoint, time_limit, snapshot_steps, snapshot_interval)
+    while True:
+        try:
+            event = next(run)
+        except StopIteration as stop:
+            return stop.value
+        if callback is not None:
+            callback(event)
+
+
+# Event of a run: kind ("record" - the record is improved, "snapshot" - periodic, "done" - the run stopped), number
+# of performed steps, the record and the global lower bound (None if subs is not an OpenList)
+Progress = namedtuple("Progress", ["kind", "step", "rec_v", "rec_x", "bound"])
+
+
+def bnb_iter(subs, max_steps, processor, gap=None, checkpoint=None, time_limit=None, snapshot_steps=None,
+             snapshot_interval=None):
+    """
+    Branch-and-Bound driver yielding the progress of the run
+
+    Works as bnb, but yields a Progress event every time the record is improved, periodically (if snapshot_steps or
+    snapshot_interval are set) and when the run stops, so the caller can use the best point found so far and
+    continue the search later or abandon it (the subproblems left in subs are all open).
+
+    Args:
+        subs: the list of subproblems (see bnb)
+        max_steps: mximal number of steps to perform
+        processor: the processor
+        gap: stop when the record value exceeds the global lower bound by at most gap (see bnb)
+        checkpoint: checkpoint.Checkpointer (see bnb)
+        time_limit: stop after the given time (seconds, None - no limit)
+        snapshot_steps: steps between the "snapshot" events (None - no snapshots by steps)
+        snapshot_interval: time between the "snapshot" events (seconds, None - no snapshots by time)
+
+    Returns:
+        number of actually performed steps (the value of the StopIteration)
+    """
     steps = 0
+    prune = getattr(subs, "prune", None)
+    has_bound = hasattr(subs, "min_bound")
+    rec_v = processor.rec_v
+    start = time.monotonic()
+    deadline = start + time_limit if time_limit is not None else None
+    next_snapshot = start + snapshot_interval if snapshot_interval is not None else None
+    if checkpoint is not None:
+        checkpoint.begin(processor, max_steps, gap)
+    try:
+        while len(subs) > 0 and steps <= max_steps:
+            if gap is not None and processor.rec_v - lower_bound(subs, processor) <= gap:
+                break
+            s = subs.pop()
+            new_subs = processor.process(s)
+            subs.update(new_subs)
+            steps = steps + 1
+            if processor.rec_v < rec_v:
+                rec_v = processor.rec_v
+                if prune is not None:
+                    prune(rec_v - processor.eps)
+                yield Progress("record", steps, processor.rec_v, processor.rec_x,
+                               lower_bound(subs, processor) if has_bound else None)
+            if checkpoint is not None:
+                checkpoint.step(subs, processor, steps)
+            if snapshot_steps is not None and steps % snapshot_steps == 0:
+                yield Progress("snapshot", steps, processor.rec_v, processor.rec_x,
+                               lower_bound(subs, processor) if has_bound else None)
+            if deadline is not None or next_snapshot is not None:
+                now = time.monotonic()
+                if next_snapshot is not None and now >= next_snapshot:
+                    next_snapshot = now + snapshot_interval
+                    yield Progress("snapshot", steps, processor.rec_v, processor.rec_x,
+                                   lower_bound(subs, processor) if has_bound else None)
+                if deadline is not None and now >= deadline:
+                    break
+    except GeneratorExit:
+        # the run is abandoned between the steps, so the open subproblems are consistent
+        if checkpoint is not None:
+            checkpoint.end(subs, processor, steps)
+        raise
+    if checkpoint is not None:
+        checkpoint.end(subs, processor, steps)
+    yield Progress("done", steps, processor.rec_v, processor.rec_x,
+                   lower_bound(subs, processor) if has_bound else None)
+    return steps
+
+
+def bnb_batch(subs, max_steps, processor, batch=32, gap=None):
+    """
+    Batch-synchronous Branch-and-Bound driver
+
+    Pops up to batch subproblems at once and processes them with one processor.process_batch call (PSLProcessor
+    and PSQEProcessor evaluate and bound all the children with array operations), otherwise works as bnb.
+
+    Args:
+        subs: the list of subproblems (OpenList or any sorted container with pop and update, e.g. SortedKeyList)
+        max_steps: mximal number of processed subproblems
+        processor: the processor with a process_batch method
+        batch: maximal number of subproblems processed at once
+        gap: stop when the record value exceeds the global lower bound by at most gap (None - solve to the
+            processor's tolerance, requires OpenList otherwise)
+
+    Returns:
+        number of actually processed subproblems
+    """
+    steps = 0
+    prune = getattr(subs, "prune", None)
+    rec_v = processor.rec_v
     while len(subs) > 0 and steps <= max_steps:
-        s = subs.pop()
-        new_subs = processor.process(s)
+        if gap is not None and processor.rec_v - lower_bound(subs, processor) <= gap:
+            break
+        k = min(batch, len(subs), max_steps - steps + 1)
+        new_subs = processor.process_batch([subs.pop() for _ in range(k)])
         subs.update(new_subs)
-        steps = steps + 1
+        if prune is not None and processor.rec_v < rec_v:
+            rec_v = processor.rec_v
+            prune(rec_v - processor.eps)
+        steps = steps + k
+    return steps
+
+
+class _Shared:
+    """
+    The state shared by the workers of bnb_parallel
+    """
+
+    def __init__(self, ctx, workers, processor, outstanding, max_steps):
+        self.lock = ctx.Lock()
+        self.max_steps = max_steps
+        # The record, written under the lock only if it is improved
+        self.rec_v = ctx.RawValue('d', processor.rec_v)
+        self.rec_x = ctx.RawValue('d', processor.rec_x if processor.rec_x is not None else float('nan'))
+        # Number of the open subproblems of all the workers, including the ones being transferred
+        self.outstanding = ctx.RawValue('q', outstanding)
+        self.steps = ctx.RawValue('q', 0)
+        self.stop = ctx.RawValue('b', 0)
+        # Per worker: the size of the open list, 1 while it accepts requests, the number of unanswered requests
+        # and 1 when the answer to its own request is being sent
+        self.sizes = ctx.RawArray('q', workers)
+        self.alive = ctx.RawArray('b', [1] * workers)
+        self.pending = ctx.RawArray('q', workers)
+        self.replied = ctx.RawArray('b', workers)
+        self.requests = [ctx.SimpleQueue() for _ in range(workers)]
+        self.inbox = [ctx.SimpleQueue() for _ in range(workers)]
+        self.results = ctx.SimpleQueue()
+
+
+# Pause of a worker waiting for subproblems (seconds)
+_idle_wait = 1e-4
+
+
+def _serve(me, shared, local):
+    # Answers the requests for work with every second open subproblem
+    while shared.pending[me]:
+        thief = shared.requests[me].get()
+        with shared.lock:
+            shared.pending[me] -= 1
+        subs = local.split() if len(local) > 1 else []
+        shared.sizes[me] = len(local)
+        shared.replied[thief] = 1
+        shared.inbox[thief].put(subs)
+
+
+def _steal(me, shared, local):
+    # Requests work from the worker with the most open subproblems, returns False if the run is over
+    while True:
+        if shared.outstanding.value == 0 or shared.stop.value:
+            return False
+        if shared.pending[me]:
+            _serve(me, shared, local)
+        victim = max((j for j in range(len(shared.sizes)) if j != me and shared.alive[j]),
+                     key=lambda j: shared.sizes[j], default=None)
+        if victim is None or shared.sizes[victim] < 2:
+            time.sleep(_idle_wait)
+            continue
+        with shared.lock:
+            if not shared.alive[victim]:
+                continue
+            shared.pending[victim] += 1
+            shared.requests[victim].put(me)
+        # Requests to this worker are answered while waiting, so the workers can not wait for each other
+        while not shared.replied[me]:
+            if shared.pending[me]:
+                _serve(me, shared, local)
+            time.sleep(_idle_wait)
+        subs = shared.inbox[me].get()
+        shared.replied[me] = 0
+        if subs:
+            local.update(subs)
+            shared.sizes[me] = len(local)
+            return True
+
+
+def _worker(me, shared, processor, policy, subs):
+    local = OpenList(policy, subs)
+    shared.sizes[me] = len(local)
+    steps = 0
+    rec_v = processor.rec_v
+    while not shared.stop.value:
+        if shared.pending[me]:
+            _serve(me, shared, local)
+        if len(local) == 0 and not _steal(me, shared, local):
+            break
+        with shared.lock:
+            if shared.steps.value > shared.max_steps:
+                shared.stop.value = 1
+                break
+            shared.steps.value += 1
+        if shared.rec_v.value < processor.rec_v:
+            with shared.lock:
+                processor.rec_v = shared.rec_v.value
+                processor.rec_x = shared.rec_x.value
+        s = local.pop()
+        new_subs = processor.process(s)
+        local.update(new_subs)
+        steps += 1
+        delta = len(new_subs) - 1
+        if processor.rec_v < rec_v:
+            rec_v = processor.rec_v
+            delta -= local.prune(rec_v - processor.eps)
+        with shared.lock:
+            if processor.rec_v < shared.rec_v.value:
+                shared.rec_v.value = processor.rec_v
+                shared.rec_x.value = processor.rec_x
+            shared.outstanding.value += delta
+        shared.sizes[me] = len(local)
+    with shared.lock:
+        shared.alive[me] = 0
+    # The requests sent before the worker stopped accepting them are still answered
+    while shared.pending[me]:
+        thief = shared.requests[me].get()
+        with shared.lock:
+            shared.pending[me] -= 1
+        shared.replied[thief] = 1
+        shared.inbox[thief].put([])
+    shared.results.put((steps, local.num_pruned, list(local)))
+
+
+def bnb_parallel(subs, max_steps, processor, workers=None, policy="depth"):
+    """
+    Parallel Branch-and-Bound driver
+
+    The subproblems are distributed over forked worker processes, each running the loop of bnb on its own OpenList
+    with its own copy of the processor (so the processor's bounds are computed exactly as in bnb). The record is
+    kept in shared memory: the workers take it before each step if it is better than their own and replace it
+    only by a better one. A worker that runs out of subproblems takes every second subproblem of the worker with
+    the most open ones. The shared number of open subproblems (including the ones being transferred) is updated
+    after every step, the run terminates when it drops to zero or when max_steps are performed.
+
+    Args:
+        subs: the list of subproblems (OpenList or any container with pop and update), the subproblems left when
+            max_steps are performed are put back
+        max_steps: mximal number of steps to perform
+        processor: the processor with rec_v, rec_x (floats) and eps attributes and a process method (e.g.
+            PSLProcessor, PSQEProcessor or IntervalProcessor), its record is set to the best one found
+        workers: number of the worker processes (None - the number of CPUs)
+        policy: selection policy of the workers' open lists (see OpenList)
+
+    Returns:
+        number of actually performed steps
+    """
+    ctx = multiprocessing.get_context("fork")
+    if workers is None:
+        workers = os.cpu_count()
+    initial = []
+    while len(subs) > 0:
+        initial.append(subs.pop())
+    if not initial:
+        return 0
+    shared = _Shared(ctx, workers, processor, len(initial), max_steps)
+    rec_v = shared.rec_v.value
+    procs = [ctx.Process(target=_worker, args=(i, shared, processor, policy, initial[i::workers]))
+             for i in range(workers)]
+    for p in procs:
+        p.start()
+    results = [shared.results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    steps = 0
+    for wsteps, pruned, left in results:
+        steps += wsteps
+        subs.update(left)
+        if hasattr(subs, "num_pruned"):
+            subs.num_pruned += pruned
+    if shared.rec_v.value < rec_v:
+        processor.rec_v = shared.rec_v.value
+        processor.rec_x = shared.rec_x.value
     return steps
 
 
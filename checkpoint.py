@@ -0,0 +1,191 @@
+"""Checkpoints of the Branch-and-Bound runs
+
+A checkpoint keeps everything bnb.bnb needs to continue a run: the open subproblems, the processor (with the record,
+the settings and the problem, which is compiled again from its definition when the checkpoint is loaded) and the
+counters. It is pickled to a temporary file that atomically replaces the previous checkpoint, so a killed run always
+leaves a complete checkpoint. Where os.fork is available the periodic checkpoints are written by forked processes
+from the copy-on-write snapshot of the state while the search goes on, so the search pays one fork per checkpoint
+however large the open list is; a checkpoint is skipped if the previous one is still being written.
+"""
+import os
+import pickle
+import time
+import bnb
+
+# Bump when the layout of the checkpoints changes
+checkpoint_format = 1
+
+
+def save(path, state):
+    """
+    Writes a checkpoint atomically
+    Args:
+        path: checkpoint's file
+        state: the state (see load)
+    """
+    tmp = path + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load(path):
+    """
+    Reads a checkpoint
+    Args:
+        path: checkpoint's file
+
+    Returns:
+        the state, dictionary with the keys "subs" (the open subproblems), "processor", "steps" (number of performed
+        steps), "max_steps" and "gap" (the limits of the run)
+
+    Raises:
+        ValueError: if the file is a checkpoint of another format
+    """
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if not isinstance(state, dict) or state.get("format") != checkpoint_format:
+        raise ValueError("Unsupported checkpoint " + str(path))
+    return state
+
+
+class Checkpointer:
+    """ Periodic checkpoints of a bnb.bnb run
+
+    The subproblems (their data) and the processor must be picklable: OpenList or list rather than a sorted container
+    with a lambda key, loggers defined at the module level. The processor is pickled when the run starts, so the
+    errors are raised at once rather than in the background.
+
+    Attributes:
+        path: checkpoint's file
+        interval: minimal time between the checkpoints (seconds, None - only by the steps)
+        every: number of steps between the checkpoints (None - only by the time)
+        background: if True write the periodic checkpoints in forked processes (if os.fork is available)
+        offset: number of steps performed before the run (set by resume)
+        num_written: number of the periodic checkpoints started
+        num_skipped: number of the periodic checkpoints skipped since the previous one was still being written
+        num_failed: number of the background writes that failed
+    """
+
+    def __init__(self, path, interval=60.0, every=None, background=True):
+        """
+        Constructor
+        Args:
+            path: checkpoint's file
+            interval: minimal time between the checkpoints (seconds, None - only by the steps)
+            every: number of steps between the checkpoints (None - only by the time)
+            background: if True write the periodic checkpoints in forked processes
+        """
+        self.path = path
+        self.interval = interval
+        self.every = every
+        self.background = background and hasattr(os, "fork")
+        self.offset = 0
+        self.num_written = 0
+        self.num_skipped = 0
+        self.num_failed = 0
+        self._max_steps = None
+        self._gap = None
+        self._child = None
+        self._last_step = 0
+        self._last_time = time.monotonic()
+
+    def _state(self, subs, processor, steps):
+        return {"format": checkpoint_format, "subs": subs, "processor": processor, "steps": self.offset + steps,
+                "max_steps": self.offset + self._max_steps, "gap": self._gap}
+
+    def _reap(self, block):
+        if self._child is None:
+            return
+        pid, status = os.waitpid(self._child, 0 if block else os.WNOHANG)
+        if pid != 0:
+            self._child = None
+            if status != 0:
+                self.num_failed += 1
+
+    def begin(self, processor, max_steps, gap):
+        """
+        Called by the driver when the run starts
+        Args:
+            processor: the processor
+            max_steps: maximal number of steps of the run
+            gap: the gap the run stops at
+        """
+        pickle.dumps(processor, protocol=pickle.HIGHEST_PROTOCOL)
+        self._max_steps = max_steps
+        self._gap = gap
+        self._last_step = 0
+        self._last_time = time.monotonic()
+
+    def step(self, subs, processor, steps):
+        """
+        Called by the driver after each step, writes a checkpoint if it is due
+        Args:
+            subs: the open subproblems
+            processor: the processor
+            steps: number of steps performed in the run
+        """
+        due = self.every is not None and steps - self._last_step >= self.every
+        if not due and (self.interval is None or time.monotonic() - self._last_time < self.interval):
+            return
+        self._last_step = steps
+        self._last_time = time.monotonic()
+        self._reap(False)
+        if self._child is not None:
+            self.num_skipped += 1
+            return
+        self.num_written += 1
+        if not self.background:
+            save(self.path, self._state(subs, processor, steps))
+            return
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                save(self.path, self._state(subs, processor, steps))
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        self._child = pid
+
+    def end(self, subs, processor, steps):
+        """
+        Called by the driver when the run stops, writes the final checkpoint
+        Args:
+            subs: the open subproblems
+            processor: the processor
+            steps: number of steps performed in the run
+        """
+        self._reap(True)
+        save(self.path, self._state(subs, processor, steps))
+
+
+def resume(path, max_steps=None, interval=60.0, every=None, background=True):
+    """
+    Continues a bnb.bnb run from its checkpoint (the run keeps checkpointing to the same file)
+    Args:
+        path: checkpoint's file
+        max_steps: maximal number of steps of the whole run (None - the limit the run was started with)
+        interval: minimal time between the checkpoints (seconds, None - only by the steps)
+        every: number of steps between the checkpoints (None - only by the time)
+        background: if True write the periodic checkpoints in forked processes
+
+    Returns:
+        tuple (number of steps performed by the whole run, the open subproblems, the processor)
+    """
+    state = load(path)
+    if max_steps is None:
+        max_steps = state["max_steps"]
+    checkpoint = Checkpointer(path, interval, every, background)
+    checkpoint.offset = state["steps"]
+    steps = bnb.bnb(state["subs"], max_steps - state["steps"], state["processor"], gap=state["gap"],
+                    checkpoint=checkpoint)
+    return state["steps"] + steps, state["subs"], state["processor"]
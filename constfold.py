@@ -0,0 +1,119 @@
+"""Constant folding for the correctly rounded evaluators
+
+Replaces the constant subexpressions of a sympy expression (numbers, pi, sqrt(2), 1/3, ...) by symbols bound to
+their interval enclosures computed once, so the compiled evaluators do not convert the literals on every operation
+and the irrational and rational constants are enclosed rigorously instead of being rounded to floats. The
+exponents of the powers are kept as they are since the interval arithmetics dispatch on integer exponents.
+"""
+import sympy as sym
+
+
+def enclosure(c, backend, funs):
+    """
+    Encloses a constant in an interval
+    Args:
+        c: sympy expression without free symbols
+        backend: interval arithmetics module (interval_arithmetics or interval_binary64)
+        funs: elementary functions on the backend's intervals (ia_math_fun or interval_binary64)
+
+    Returns:
+        the backend's interval containing the value of c
+
+    Raises:
+        NotImplementedError: if the constant contains unsupported operations
+    """
+    if c.is_Integer:
+        return backend.convert_to_interval(int(c))
+    if c.is_Float:
+        # A Float is a binary number: floats are converted exactly, longer mantissas through the exact rational
+        if sym.Rational(float(c)) == sym.Rational(c):
+            return backend.convert_to_interval(float(c))
+        c = sym.Rational(c)
+    if c.is_Rational:
+        return backend.convert_to_interval(int(c.p)) / backend.convert_to_interval(int(c.q))
+    if c is sym.pi:
+        return funs.pi_interval()
+    if c is sym.E:
+        return funs.exp(backend.convert_to_interval(1))
+    if c.is_Add:
+        res = enclosure(c.args[0], backend, funs)
+        for arg in c.args[1:]:
+            res = res + enclosure(arg, backend, funs)
+        return res
+    if c.is_Mul:
+        res = enclosure(c.args[0], backend, funs)
+        for arg in c.args[1:]:
+            res = res * enclosure(arg, backend, funs)
+        return res
+    if c.is_Pow:
+        base = enclosure(c.base, backend, funs)
+        if c.exp == sym.Rational(1, 2):
+            return funs.sqrt(base)
+        if c.exp.is_Integer and c.exp > 0:
+            return base ** int(c.exp)
+        if c.exp.is_Integer and c.exp < 0:
+            return backend.convert_to_interval(1) / base ** int(-c.exp)
+        raise NotImplementedError("Unsupported power " + str(c))
+    for name in ("sin", "cos", "exp", "log"):
+        if isinstance(c, getattr(sym, name)):
+            return getattr(funs, name)(enclosure(c.args[0], backend, funs))
+    raise NotImplementedError("Unsupported constant " + str(c))
+
+
+class _Folder:
+    """
+    Replaces the constants of expressions sharing one set of symbols
+    """
+
+    def __init__(self, enclose):
+        self.enclose = enclose
+        self.symbols = {}
+        self.constants = []
+
+    def constant(self, c):
+        if c in self.symbols:
+            return self.symbols[c]
+        if c == 1 or c == -1:
+            # x and -x are cheaper than the products by [1, 1] and [-1, -1]
+            return c
+        try:
+            value = self.enclose(c)
+        except NotImplementedError:
+            return c
+        s = sym.Symbol("_c" + str(len(self.constants)))
+        self.symbols[c] = s
+        self.constants.append((s.name, c, value))
+        return s
+
+    def walk(self, e):
+        if not e.free_symbols:
+            return self.constant(e)
+        if e.is_Atom:
+            return e
+        if e.is_Pow:
+            return sym.Pow(self.walk(e.base), e.exp if e.exp.is_Number else self.walk(e.exp), evaluate=False)
+        args = [arg for arg in e.args if arg.free_symbols]
+        if (e.is_Add or e.is_Mul) and len(args) < len(e.args):
+            # The constant terms (factors) are enclosed together
+            c = e.func(*[arg for arg in e.args if not arg.free_symbols])
+            return e.func(self.constant(c), *[self.walk(arg) for arg in args], evaluate=False)
+        return e.func(*[self.walk(arg) for arg in e.args], evaluate=False)
+
+
+def fold(exprs, enclose):
+    """
+    Replaces the constant subexpressions by the symbols _c0, _c1, ...
+    Args:
+        exprs: sympy expression or tuple of expressions (the equal constants get the same symbol)
+        enclose: function returning the enclosure of a constant, raising NotImplementedError for the constants
+            to keep in the expression
+
+    Returns:
+        tuple (expressions with the symbols, list of (symbol's name, constant, enclosure))
+    """
+    folder = _Folder(enclose)
+    if isinstance(exprs, tuple):
+        res = tuple(folder.walk(e) for e in exprs)
+    else:
+        res = folder.walk(exprs)
+    return res, folder.constants
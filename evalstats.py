@@ -0,0 +1,174 @@
+"""Evaluation accounting
+
+Counts the calls of the objective and its derivatives, separately for point and interval arguments, and
+optionally records the points where the objective was evaluated into a preallocated buffer. The counters are
+installed by UniVarProblem.enable_accounting by wrapping the evaluators, so a problem without accounting calls
+the compiled functions directly and pays nothing.
+"""
+import mmap
+import numbers
+from array import array
+from decimal import Decimal
+
+# Evaluated functions
+kinds = ("f", "df", "ddf")
+
+# Types of point arguments (numbers.Real covers the numpy integer and floating scalars), everything else is counted
+# as an interval
+_point_types = (numbers.Real, Decimal)
+
+
+class EvalStats:
+    """ Evaluation counters
+
+    Attributes:
+        point: dictionary kind -> number of evaluations at points
+        interval: dictionary kind -> number of evaluations on intervals
+        vec: dictionary kind -> number of points evaluated by the vectorized evaluators
+        trace_capacity: maximal number of recorded points
+        trace_size: number of recorded points
+        trace_dropped: number of points not recorded because the buffer was full
+    """
+
+    def __init__(self, trace_capacity=0, trace_path=None):
+        """
+        Constructor
+        Args:
+            trace_capacity: number of objective's evaluation points to record (0 - no tracing)
+            trace_path: if given the points are written to a memory-mapped file of this name instead of memory
+        """
+        self.point = dict.fromkeys(kinds, 0)
+        self.interval = dict.fromkeys(kinds, 0)
+        self.vec = dict.fromkeys(kinds, 0)
+        self.trace_capacity = trace_capacity
+        self.trace_size = 0
+        self.trace_dropped = 0
+        self._mmap = None
+        self._trace = None
+        if trace_capacity > 0:
+            if trace_path is None:
+                self._trace = array('d', bytes(8 * trace_capacity))
+            else:
+                with open(trace_path, "w+b") as f:
+                    f.truncate(8 * trace_capacity)
+                    self._mmap = mmap.mmap(f.fileno(), 8 * trace_capacity)
+                self._trace = memoryview(self._mmap).cast('d')
+
+    def wrap(self, kind, fun, trace=False):
+        """
+        Wraps an evaluator with the counters
+        Args:
+            kind: "f", "df" or "ddf"
+            fun: function of one argument
+            trace: if True record the point arguments
+
+        Returns:
+            the counting function
+        """
+        point = self.point
+        interval = self.interval
+        if trace and self._trace is not None:
+            record = self._record
+
+            def counted(x):
+                if isinstance(x, _point_types):
+                    point[kind] += 1
+                    record(x)
+                else:
+                    interval[kind] += 1
+                return fun(x)
+        else:
+            def counted(x):
+                if isinstance(x, _point_types):
+                    point[kind] += 1
+                else:
+                    interval[kind] += 1
+                return fun(x)
+
+        return counted
+
+    def wrap_fused(self, orders, fun, trace=False):
+        """
+        Wraps a fused evaluator (see UniVarProblem.fused) with the counters
+        Args:
+            orders: derivative orders computed by the evaluator
+            fun: the fused evaluator
+            trace: if True record the point arguments
+
+        Returns:
+            the counting function
+        """
+        names = [kinds[i] for i in orders]
+        point = self.point
+        interval = self.interval
+        record = self._record if trace and self._trace is not None and 0 in orders else None
+
+        def counted(x):
+            if isinstance(x, _point_types):
+                for k in names:
+                    point[k] += 1
+                if record is not None:
+                    record(x)
+            else:
+                for k in names:
+                    interval[k] += 1
+            return fun(x)
+
+        return counted
+
+    def count_vec(self, kind, n):
+        """
+        Accounts a vectorized evaluation
+        Args:
+            kind: "f", "df" or "ddf"
+            n: number of points
+        """
+        self.vec[kind] += n
+
+    def _record(self, x):
+        if self.trace_size < self.trace_capacity:
+            self._trace[self.trace_size] = float(x)
+            self.trace_size += 1
+        else:
+            self.trace_dropped += 1
+
+    def trace(self):
+        """
+        Returns:
+            view of the recorded points
+        """
+        if self._trace is None:
+            return array('d')
+        return self._trace[:self.trace_size]
+
+    def total(self):
+        """
+        Returns:
+            total number of scalar evaluations (points and intervals) of all kinds
+        """
+        return sum(self.point.values()) + sum(self.interval.values())
+
+    def reset(self):
+        """
+        Zeroes the counters and drops the recorded points
+        """
+        for d in (self.point, self.interval, self.vec):
+            for k in kinds:
+                d[k] = 0
+        self.trace_size = 0
+        self.trace_dropped = 0
+
+    def close(self):
+        """
+        Releases the memory-mapped trace buffer
+        """
+        if self._mmap is not None:
+            self._trace.release()
+            self._trace = None
+            self._mmap.close()
+            self._mmap = None
+
+    def __repr__(self):
+        return "f: " + str(self.point["f"]) + "/" + str(self.interval["f"]) + ", df: " + str(
+            self.point["df"]) + "/" + str(self.interval["df"]) + ", ddf: " + str(self.point["ddf"]) + "/" + str(
+            self.interval["ddf"]) + " (point/interval)"
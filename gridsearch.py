@@ -1,6 +1,6 @@
 import numpy as np
 
-def grid_search(f, a, b, s):
+def grid_search(f, a, b, s, vectorized=False):
     """
     Searches for a minimum on a uniform grid
     Args:
@@ -8,11 +8,18 @@ def grid_search(f, a, b, s):
         a: left interval end
         b: right interval end
         s: step size
+        vectorized: if True f takes the array of all grid points at once (e.g. UniVarProblem.objective_vec)
 
     Returns:
         found minimum as a tuple (x*, f(x*))
     """
     points = np.arange(a, b, s)
+    if vectorized:
+        values = f(points)
+        if np.all(np.isnan(values)):
+            return np.nan, np.nan
+        i = np.nanargmin(values)
+        return points[i], values[i]
     xr = np.nan
     fr = np.nan
     for x in points:
@@ -1,4 +1,9 @@
 """This module implements correctly rounded interval functions
+
+The arguments are reduced before the series are summed: exp(x) = 2^k exp(x - k ln 2), ln(x) = e ln 2 + ln(x / 2^e)
+and sin/cos modulo pi / 2, with pi and ln 2 enclosed at the current precision (Machin's formula and the atanh
+series). The number of series terms is chosen from the precision and the reduced argument, and the truncation
+error is added as a rigorous remainder bound.
 """
 import decimal as dec
 import math
@@ -11,605 +16,508 @@ import interval_arithmetics as ia
 def factorial(n):
     """
     Computes interval extension for a factorial function
-    
+
     Parameters
     ----------
-    n : Interval 
-        
+    n : Interval
+
     Returns:
     --------
     The interval that enclose the range of the factorial function
     """
-    a = ia.c_one
-    ia._set_rounding_mode_floor()
-    for i in range(2, int(n.a) + 1):
-        a = a * dec.Decimal(i)
-    b = ia.c_one
-    ia._set_rounding_mode_ceil()
-    for i in range(2, int(n.b) + 1):
-        b = b * dec.Decimal(i)
+    ctx = ia.getcontext()
+    a = ctx.floor.plus(dec.Decimal(math.factorial(int(n.a))))
+    b = ctx.ceil.plus(dec.Decimal(math.factorial(int(n.b))))
     return ia.Interval(a, b)
 
 
+# -------------- Coefficient tables and constants --------
+#  The series coefficients and the constants are enclosed once per precision and reused by all the calls, they are
+#  kept in the cache of the verified context: "tables" - series name -> list of coefficient enclosures (extended on
+#  demand), "constants" - name -> enclosure, "precision" - the precision the values were computed for. The cache is
+#  filled under the lock of the context as the threads sharing it would otherwise append the same coefficients twice
+
+
+def _cache(ctx):
+    cache = ctx.cache
+    prec = ctx.prec
+    if cache.get("precision") != prec:
+        cache.clear()
+        cache.update(precision=prec, tables={}, constants={})
+    return cache
+
+
+def _table(name, size, coefficient):
+    """
+    Returns the cached enclosures coefficient(0), ..., coefficient(size - 1) (and maybe more) of a series
+    """
+    ctx = ia.getcontext()
+    with ctx.lock:
+        table = _cache(ctx)["tables"].setdefault(name, [])
+        for i in range(len(table), size):
+            table.append(coefficient(i))
+    return table
+
+
+def _constant(name, build):
+    """
+    Returns the cached enclosure of a constant
+    """
+    ctx = ia.getcontext()
+    with ctx.lock:
+        constants = _cache(ctx)["constants"]
+        if name not in constants:
+            constants[name] = build()
+        return constants[name]
+
+
+def _dot(v):
+    d = dec.Decimal(v)
+    return ia.Interval(d, d)
+
+
+def _reciprocal(k):
+    return _dot(1) / _dot(k)
+
+
+def _reciprocal_factorial(k):
+    return _dot(1) / factorial(_dot(k))
+
+
+def _magnitude(x):
+    return max(x.a.copy_abs(), x.b.copy_abs())
+
+
+def _remainder(r):
+    return ia.Interval(r.copy_negate(), r)
+
+
+def _negligible():
+    # Terms below this value do not change the result at the current precision
+    return dec.Decimal((0, (1,), -(ia.get_precision() + 3)))
+
+
+def _atan_inv(k):
+    # atan(1 / k) = 1 / k - 1 / 3 k^3 + ..., the alternating series is stopped at a negligible term bounding the
+    # remainder
+    eps = _negligible()
+    s = _dot(0)
+    i = 0
+    while True:
+        t = _reciprocal((2 * i + 1) * k ** (2 * i + 1))
+        if t.b < eps:
+            return s + _remainder(t.b)
+        s = s - t if i % 2 else s + t
+        i += 1
+
+
+def _pi():
+    # Machin's formula pi = 16 atan(1 / 5) - 4 atan(1 / 239)
+    return 16 * _atan_inv(5) - 4 * _atan_inv(239)
+
+
+def _ln2():
+    # ln 2 = 2 atanh(1 / 3) = 2 (1 / 3 + 1 / 3 3^3 + ...), the remainder is below 9 / 8 of the first dropped term
+    eps = _negligible()
+    s = _dot(0)
+    i = 0
+    while True:
+        t = _reciprocal((2 * i + 1) * 3 ** (2 * i + 1))
+        if t.b < eps:
+            return 2 * (s + ia.Interval(ia.c_zero, 2 * t.b))
+        s = s + t
+        i += 1
+
+
+def pi_interval():
+    """
+    Returns the enclosure of pi at the current precision
+    """
+    return _constant("pi", _pi)
+
+
+def _pi05():
+    return _constant("pi05", lambda: pi_interval() / 2)
+
+
+def ln2_interval():
+    """
+    Returns the enclosure of ln 2 at the current precision
+    """
+    return _constant("ln2", _ln2)
+
+
+def _order(mag, first, step, fixed, relative=False):
+    """
+    Chooses the order m = first + j * step of the truncated series: the smallest one such that mag^m / m! is
+    negligible at the current precision (relative to mag if relative is True), estimated in floats since the actual
+    truncation error is bounded rigorously, or first + fixed * step if the number of terms is fixed
+    """
+    if fixed is not None:
+        return first + fixed * step
+    lm = math.log(mag) if mag > 0 else -math.inf
+    if lm == -math.inf:
+        return first
+    target = -(ia.get_precision() + 2) * math.log(10)
+    if relative:
+        target += lm
+    m = first
+    while m * lm - math.lgamma(m + 1) > target:
+        m += step
+    return m
+
+
+# -------------- Numbers of series terms --------
+#  Kept in the verified context (see interval_arithmetics.VerifiedContext), None - chosen automatically from the
+#  precision and the reduced argument
+
+def _terms(name):
+    return ia.getcontext().terms.get(name)
+
+
+def _set_terms(name, number):
+    terms = ia.getcontext().terms
+    old = terms.get(name)
+    terms[name] = number
+    return old
+
+
 # --------------- Exponential ---------------
 
-#     Number of Taylor's series terms for exponential
-#     Notice, that this number will be multiplied by two to bound the exp(x) between the consecutive sums
-#     1 + x + ... + x^(2n - 1) < exp(x) < 1 + x + ... + x^(2n)
-exp_taylor_terms_number = 5
+#     Number of Taylor's series terms for exponential: a number n fixes 2n terms
 
 
 def get_exp_taylor_terms_number():
     """
     Retrieves the number of Taylor's series terms
-    
-    Notice, that this number will be multiplied by two to bound the exp(x) between the consecutive sums
-    1 + x + ... + x^(2n - 1) < exp(x) < 1 + x + ... + x^(2n)
-    
+
     Returns:
     ----------
-    the  value of exp_taylor_terms_number    
+    the  value of exp_taylor_terms_number (None if the number of terms is chosen automatically)
     """
-    global exp_taylor_terms_number
-    return exp_taylor_terms_number
+    return _terms("exp")
 
 
 def set_exp_taylor_terms_number(number):
     """
-    Sets new number of Taylor's series members to approximate the exponential. 
-    
-    Notice, that this number will be multiplied by two to bound the exp(x) between the consecutive sums
-    1 + x + ... + x^(2n - 1) < exp(x) < 1 + x + ... + x^(2n)
-    
+    Sets new number of Taylor's series members to approximate the exponential.
+
+    Notice, that this number will be multiplied by two. The enclosures stay rigorous with any number of terms
+    since the truncation error is bounded, fewer terms give wider enclosures.
+
     Parameters:
     ----------
-    number : new value of exp_taylor_terms_number
-    
+    number : new value of exp_taylor_terms_number, None - choose the number of terms automatically
+
     Returns:
     ----------
     the previous value of exp_taylor_terms_number
     """
-    global exp_taylor_terms_number
-    old = exp_taylor_terms_number
-    exp_taylor_terms_number = number
-    return old
+    return _set_terms("exp", number)
 
 
-# Exponential for x in a range [-1, 0], lower bound, x is a dot interval
-def _exp_f_m1_to_0_lb(x):
-    global exp_taylor_terms_number
-    n = 2 * exp_taylor_terms_number
-    s = ia.Interval(ia.c_one, ia.c_one)
-    for i in range(1, n):
-        ii = ia.Interval(dec.Decimal(i), dec.Decimal(i))
-        term = (x ** i) / factorial(ii)
-        s += term
-    return s.a
-
-
-# Exponential for x in a range [-1, 0], upper bound, x is a dot interval
-def _exp_f_m1_to_0_ub(x):
-    global exp_taylor_terms_number
-    n = 2 * exp_taylor_terms_number + 1
-    s = ia.Interval(ia.c_one, ia.c_one)
-    for i in range(1, n):
-        ii = ia.Interval(dec.Decimal(i), dec.Decimal(i))
-        term = (x ** i) / factorial(ii)
-        s += term
-    return s.b
-
-
-# Exponential for x in a range [-inf, -1), lower bound, x is a dot interval
-def _exp_f_minf_to_m1_lb(x):
-    z = -(x.a.to_integral(rounding=dec.ROUND_FLOOR))
-    ivz = ia.Interval(z, z)
-    ivf = x / ivz
-    etv = _exp_f_m1_to_0_lb(ivf)
-    ietv = ia.Interval(etv, etv)
-    iev = ietv ** int(z)
-    return iev.a
-
-
-# Exponential for x in a range [-inf, -1), upper bound, x is a dot interval
-def _exp_f_minf_to_m1_ub(x):
-    z = -(x.a.to_integral(rounding=dec.ROUND_FLOOR))
-    ivz = ia.Interval(z, z)
-    ivf = x / ivz
-    etv = _exp_f_m1_to_0_ub(ivf)
-    ietv = ia.Interval(etv, etv)
-    iev = ietv ** int(z)
-    return iev.b
-
-
-# Exponential for x in a range (0, +inf], lower bound, x is a dot interval
-def _exp_f_0_to_inf_lb(x):
-    if x.a > ia.c_one:
-        irev = _exp_f_minf_to_m1_ub(-x)
-    else:
-        irev = _exp_f_m1_to_0_ub(-x)
-    ione = ia.Interval(dec.Decimal('1'), dec.Decimal('1'))
-    iev = ione / irev
-    return iev.a
-
-
-# Exponential for x in a range (0, +inf], upper bound, x is a dot interval
-def _exp_f_0_to_inf_ub(x):
-    if x.a > ia.c_one:
-        irev = _exp_f_minf_to_m1_lb(-x)
-    else:
-        irev = _exp_f_m1_to_0_lb(-x)
-    ione = ia.Interval(ia.c_one, ia.c_one)
-    iev = ione / irev
-    return iev.b
-
-
-# Exponential lower bound for x, x is a dot interval
-def _exp_lb(x):
-    if x.a == ia.c_minf:
-        return ia.c_zero
-    elif x.a < ia.c_mone:
-        return _exp_f_minf_to_m1_lb(x)
-    elif ia.c_mone <= x.a < ia.c_zero:
-        return _exp_f_m1_to_0_lb(x)
-    elif x.a == ia.c_zero:
-        return ia.c_one
-    elif x.a == ia.c_inf:
-        return ia.c_inf
-    else:
-        return _exp_f_0_to_inf_lb(x)
-
-
-# Exponential upper bound for x, x is a dot interval
-def _exp_ub(x):
-    if x.b == ia.c_minf:
-        return ia.c_zero
-    elif x.b < ia.c_mone:
-        return _exp_f_minf_to_m1_ub(x)
-    elif ia.c_mone <= x.b < ia.c_zero:
-        return _exp_f_m1_to_0_ub(x)
-    elif x.b == ia.c_zero:
-        return ia.c_one
-    elif x.b == ia.c_inf:
-        return ia.c_inf
+# Exponential of a point
+def _exp_point(xp):
+    if xp == ia.c_minf:
+        return _dot(0)
+    elif xp == ia.c_inf:
+        return ia.Interval(ia.c_inf, ia.c_inf)
+    elif xp == ia.c_zero:
+        return _dot(1)
+    ln2 = ln2_interval()
+    # exp(x) = 2^k exp(r), |r| <= ln 2 / 2
+    k = int(round(float(xp) / math.log(2)))
+    r = _dot(xp) - k * ln2
+    mag = _magnitude(r)
+    fixed = _terms("exp")
+    if fixed is not None:
+        fixed *= 2
+    m = _order(float(mag), 1, 1, fixed)
+    rf = _table("factorial", m + 1, _reciprocal_factorial)
+    # Horner's scheme for 1 + r + ... + r^(m-1) / (m-1)!, the remainder is below e^|r| |r|^m / m! < 2 |r|^m / m!
+    s = rf[m - 1]
+    for i in range(m - 2, -1, -1):
+        s = s * r + rf[i]
+    s = s + _remainder((2 * _dot(mag) ** m * rf[m]).b)
+    if k >= 0:
+        return s * _dot(2 ** k)
     else:
-        return _exp_f_0_to_inf_ub(x)
+        return s / _dot(2 ** -k)
 
 
 def exp(x):
     """
     Computes reliable bounds for exponential.
-    
+
     Parameters:
     -----------
     x : an interval
-    
+
     Returns:
     --------
     Enclosing interval for exp(x)
     """
-    a = _exp_lb(x)
-    b = _exp_ub(x)
-    return ia.Interval(a, b)
+    ea = _exp_point(x.a)
+    eb = ea if x.b == x.a else _exp_point(x.b)
+    return ia.Interval(max(ea.a, ia.c_zero), eb.b)
 
 
 # ------------ Natural logarithm ------------------------
 #  Natural logarithm approximation based on Taylor series of ln ((1+x)/(1-x))
 #
 
-# Number of Taylor expansion terms
-
-log_taylor_terms_number = 5
+# Number of Taylor expansion terms: a number k fixes k + 1 terms
 
 
 def get_log_taylor_terms_number():
     """
     Retrieves number of Taylor's series members to approximate the natural logarithm.
-    
-    Notice, that this number will be multiplied by two to bound the ln(1 + x) between the consecutive sums
-    x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n < ln(1 + x) <  x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n + (x^(2n+1))/(2n+1)
-    
+
     Returns:
     ----------
-    the  value of log_taylor_terms_number    
+    the  value of log_taylor_terms_number (None if the number of terms is chosen automatically)
     """
-    global log_taylor_terms_number
-    return log_taylor_terms_number
+    return _terms("log")
 
 
 def set_log_taylor_terms_number(number):
     """
-    Sets new number of Taylor's series members to approximate the natural logarithm. 
-    
-    Notice, that this number will be multiplied by two to bound the ln(1 + x/1 - x) 
-    
+    Sets new number of Taylor's series members to approximate the natural logarithm.
+
+    The series 2 (z + z^3 / 3 + ... + z^(2k+1) / (2k+1)) of ln ((1 + z) / (1 - z)) is used with k = number. The
+    enclosures stay rigorous with any number of terms since the truncation error is bounded.
+
     Parameters:
     ----------
-    number : new value of ln_taylor_terms_number
-    
+    number : new value of ln_taylor_terms_number, None - choose the number of terms automatically
+
     Returns:
     ----------
     the previous value of ln_taylor_terms_number
     """
-    global log_taylor_terms_number
-    old = log_taylor_terms_number
-    log_taylor_terms_number = number
-    return old
-
-
-# Point x from 1 to infinity
-def _log_f_1_to_inf(xp):
-    x = ia.Interval(xp, xp)
-    inul = ia.Interval(ia.c_zero, ia.c_zero)
-    ione = ia.Interval(ia.c_one, ia.c_one)
-    itwo = ia.Interval(ia.c_two, ia.c_two)
-    z = (x - ione) / (x + ione)
-    s = inul
-    zn = z
-    zq = pow(z, 2)
-    global log_taylor_terms_number
-    k = log_taylor_terms_number
-    for i in range(0, k + 1):
-        ii = ia.Interval(dec.Decimal(2 * i + 1), dec.Decimal(2 * i + 1))
-        s += zn / ii
-        zn *= zq
-    t = ia.Interval(dec.Decimal(2 * k + 3), dec.Decimal(2 * k + 3)) * (ione - zq)
-    su = s + zn / t
-    s *= itwo
-    su *= itwo
-    iret = ia.Interval(s.a, su.b)
-    return iret
-
-
-# Point x from 0 to 1
-def _log_f_0_to_1(xp):
-    x = ia.Interval(xp, xp)
-    inul = ia.Interval(ia.c_zero, ia.c_zero)
-    ione = ia.Interval(ia.c_one, ia.c_one)
-    itwo = ia.Interval(ia.c_two, ia.c_two)
-    z = (x - ione) / (x + ione)
-    s = inul
-    zn = z
-    zq = pow(z, 2)
-    global log_taylor_terms_number
-    k = log_taylor_terms_number
-    for i in range(0, k + 1):
-        ii = ia.Interval(dec.Decimal(2 * i + 1), dec.Decimal(2 * i + 1))
-        s += zn / ii
-        zn *= zq
-    t = ia.Interval(dec.Decimal(2 * k + 3), dec.Decimal(2 * k + 3)) * (ione - zq)
-    su = s + zn / t
-    s *= itwo
-    su *= itwo
-    iret = ia.Interval(su.a, s.b)
-    return iret
+    return _set_terms("log", number)
 
 
 # logarithm for a point
 def _log_point(xp):
     if xp == ia.c_zero:
-        ival = ia.Interval(ia.c_minf, ia.c_minf)
+        return ia.Interval(ia.c_minf, ia.c_minf)
     elif xp == ia.c_one:
-        ival = ia.Interval(ia.c_zero, ia.c_zero)
-    elif xp < ia.c_one:
-        ival = _log_f_0_to_1(xp)
+        return _dot(0)
     elif xp == ia.c_inf:
-        ival = ia.Interval(ia.c_inf, ia.c_inf)
+        return ia.Interval(ia.c_inf, ia.c_inf)
+    ln2 = ln2_interval()
+    # ln(x) = e ln 2 + ln(f), f = x / 2^e is close to 1
+    # any e gives a rigorous enclosure, the estimate from the decimal exponent only keeps f close to 1
+    adj = xp.adjusted()
+    e = int(round((adj + math.log10(float(xp.scaleb(-adj)))) * math.log2(10)))
+    if e >= 0:
+        f = _dot(xp) / _dot(2 ** e)
     else:
-        ival = _log_f_1_to_inf(xp)
-    return ival
+        f = _dot(xp) * _dot(2 ** -e)
+    ione = _dot(1)
+    z = (f - ione) / (f + ione)
+    zq = z ** 2
+    mag = _magnitude(z)
+    fixed = _terms("log")
+    if fixed is not None:
+        n = fixed + 1
+    else:
+        lz = math.log(float(mag)) if mag > 0 else -math.inf
+        target = -(ia.get_precision() + 2) * math.log(10)
+        n = 1
+        while lz > -math.inf and 2 * n * lz > target:
+            n += 1
+    coefs = _table("odd", n + 1, lambda i: _reciprocal(2 * i + 1))
+    # ln(f) = 2 z (1 + z^2 / 3 + ... + z^(2n-2) / (2n-1)) + remainder, the remainder's magnitude is below
+    # 2 |z|^(2n+1) / ((2n+1) (1 - z^2))
+    s = coefs[n - 1]
+    for i in range(n - 2, -1, -1):
+        s = s * zq + coefs[i]
+    mq = _dot(mag) ** 2
+    rem = 2 * _dot(mag) ** (2 * n + 1) * coefs[n] / (ione - mq)
+    return e * ln2 + 2 * z * s + _remainder(rem.b)
 
 
 def log(x: ia.Interval):
     """
     Computes reliable bounds for natural logarithm.
-    
+
     Parameters:
     -----------
     x : an interval
-    
+
     Returns:
     --------
     Enclosing interval for ln(x)
     """
-    loga = _log_point(x.a)
-    logb = _log_point(x.b)
-    iret = ia.Interval(loga.a, logb.b)
-    return iret
-
+    if x.b < ia.c_zero:
+        raise ValueError("math domain error")
+    loga = _log_point(x.a).a if x.a > ia.c_zero else ia.c_minf
+    logb = _log_point(x.b).b
+    return ia.Interval(loga, logb)
 
-# ------------ Natural logarithm ------------------------
 
-#     Number of Taylor's series terms for ln(1 + x)
-#     Notice, that this number will be multiplied by two to bound the ln(1 + x) between the consecutive sums
-#     x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n < ln(1 + x) <  x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n + (x^(2n+1))/(2n+1)
-
-
-# # Lower bound for ln(x), x in (1, 2]
-# def _log_f_1_to_2_lb(x):
-#     global log_taylor_terms_number
-#     n = 2 * log_taylor_terms_number
-#     y = x - ia.Interval(dec.Decimal(1), dec.Decimal(1))
-#     s = y
-#     for i in range(2, n + 1):
-#         ii = ia.Interval(dec.Decimal(i), dec.Decimal(i))
-#         term = (y ** i) / ii
-#         if i % 2 == 0:
-#             s -= term
-#         else: 
-#             s += term
-#     return s.a
-
-# # Upper bound for ln(x), x in (1, 2]
-# def _log_f_1_to_2_ub(x):
-#     global log_taylor_terms_number
-#     n = 2 * log_taylor_terms_number + 1
-#     y = x - ia.Interval(dec.Decimal(1), dec.Decimal(1))
-#     s = y
-#     for i in range(2, n + 1):
-#         ii = ia.Interval(dec.Decimal(i), dec.Decimal(i))
-#         term = (y ** i) / ii
-#         if i % 2 == 0:
-#             s -= term
-#         else: 
-#             s += term
-#     return s.b
-
-# # Lower for ln(x)
-# def _log_lb(x):
-#     return _log_f_1_to_2_lb(x)
-
-# # Upper for ln(x)
-# def _log_ub(x):
-#     return _log_f_1_to_2_ub(x)
-
-
-# def log(x):
-#     """
-#     Computes reliable bounds for logarithm.
-
-#     Parameters:
-#     -----------
-#     x : an interval
-
-#     Returns:
-#     --------
-#     Enclosing interval for ln(x)
-#     """
-#     a = _log_lb(ia.Interval(x.a, x.a))
-#     b = _log_ub(ia.Interval(x.b, x.b))
-#     return ia.Interval(a, b)
-
-
-# ------------ sin ------------------------
-#  Natural sin approximation based on Taylor series
-#
-pi = dec.Decimal(math.pi)
-pi2 = dec.Decimal(2 * math.pi)
-pi05 = dec.Decimal(math.pi / 2)
-# Number of Taylor expansion terms
+# ------------ sin and cos ------------------------
+#  Taylor series on the argument reduced modulo pi / 2
 
-sin_taylor_terms_number = 9
+# Numbers of Taylor expansion terms
 
 
 def get_sin_taylor_terms_number():
     """
-    Retrieves number of Taylor's series members to approximate the natural logarithm.
-
-    Notice, that this number will be multiplied by two to bound the ln(1 + x) between the consecutive sums
-    x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n < ln(1 + x) <  x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n + (x^(2n+1))/(2n+1)
+    Retrieves number of Taylor's series members to approximate the sine
 
     Returns:
     ----------
-    the  value of log_taylor_terms_number
+    the  value of sin_taylor_terms_number (None if the number of terms is chosen automatically)
     """
-    global sin_taylor_terms_number
-    return sin_taylor_terms_number
+    return _terms("sin")
 
 
 def set_sin_taylor_terms_number(number):
     """
-    Sets new number of Taylor's series members to approximate the natural logarithm.
+    Sets new number of Taylor's series members to approximate the sine.
 
-    Notice, that this number will be multiplied by two to bound the ln(1 + x/1 - x)
+    The enclosures stay rigorous with any number of terms since the truncation error is bounded.
 
     Parameters:
     ----------
-    number : new value of ln_taylor_terms_number
+    number : new value of sin_taylor_terms_number, None - choose the number of terms automatically
 
     Returns:
     ----------
-    the previous value of ln_taylor_terms_number
+    the previous value of sin_taylor_terms_number
     """
-    global sin_taylor_terms_number
-    old = sin_taylor_terms_number
-    sin_taylor_terms_number = number
-    return old
-
-
-def _sin_lb(x):
-    ia._set_rounding_mode_floor()
-    global sin_taylor_terms_number
-    n = sin_taylor_terms_number
-    s = ia.Interval(x.a, x.b)
-    flag = False
-    if n % 2 == 1:
-        n += 1
-    for i in range(1, n):
-        ii = ia.Interval(dec.Decimal(2 * i + 1), dec.Decimal(2 * i + 1))
-        term = (x ** (2 * i + 1)) / factorial(ii)
-        if flag:
-            s += term
-            flag = False
-        else:
-            s -= term
-            flag = True
-    return s.a
-
-
-def _sin_ub(x):
-    ia._set_rounding_mode_ceil()
-    global sin_taylor_terms_number
-    n = sin_taylor_terms_number
-    s = ia.Interval(x.a, x.b)
-    flag = False
-    if n % 2 == 1:
-        n += 1
-    for i in range(1, n + 1):
-        ii = ia.Interval(dec.Decimal(2 * i + 1), dec.Decimal(2 * i + 1))
-        term = (x ** (2 * i + 1)) / factorial(ii)
-        if flag:
-            s += term
-            flag = False
-        else:
-            s -= term
-            flag = True
-    return s.b
-
-
-def _sin(xp):
-    xp = xp % pi2
-    if xp < 0:
-        xp2 = xp + pi2
-        if xp2 < -xp:
-            xp = xp2
-    else:
-        xp2 = xp - pi2
-        if -xp2 < xp:
-            xp = xp2
-    x = ia.Interval(xp, xp)
-    return ia.Interval(_sin_lb(x), _sin_ub(x))
-
-
-def sin(x_input: ia.Interval):
-    a = _sin(x_input.a)
-    b = _sin(x_input.b)
-    if ((x_input.a - pi05) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_CEILING) <= (
-            (x_input.b - pi05) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_FLOOR):
-        max_val = dec.Decimal(1)
-    else:
-        max_val = max(a.b, b.b)
-    if ((x_input.a + pi05) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_CEILING) <= (
-            (x_input.b + pi05) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_FLOOR):
-        min_val = dec.Decimal(-1)
-    else:
-        min_val = min(a.a, b.a)
-    return ia.Interval(min_val, max_val)
-
-
-# ------------ cos ------------------------
-#  Natural logarithm approximation based on Taylor series
-#
-
-# Number of Taylor expansion terms
-
-cos_taylor_terms_number = 9
+    return _set_terms("sin", number)
 
 
 def get_cos_taylor_terms_number():
     """
-    Retrieves number of Taylor's series members to approximate the cos
-
-    Notice, that this number will be multiplied by two to bound the ln(1 + x) between the consecutive sums
-    x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n < ln(1 + x) <  x - (x^2)/2 + (x^3)/3 - ... - (x^2n)/2n + (x^(2n+1))/(2n+1)
+    Retrieves number of Taylor's series members to approximate the cosine
 
     Returns:
     ----------
-    the  value of cos_taylor_terms_number
+    the  value of cos_taylor_terms_number (None if the number of terms is chosen automatically)
     """
-    global cos_taylor_terms_number
-    return cos_taylor_terms_number
+    return _terms("cos")
 
 
 def set_cos_taylor_terms_number(number):
     """
-    Sets new number of Taylor's series members to approximate the natural logarithm.
+    Sets new number of Taylor's series members to approximate the cosine.
 
-    Notice, that this number will be multiplied by two to bound the ln(1 + x/1 - x)
+    The enclosures stay rigorous with any number of terms since the truncation error is bounded.
 
     Parameters:
     ----------
-    number : new value of ln_taylor_terms_number
+    number : new value of cos_taylor_terms_number, None - choose the number of terms automatically
 
     Returns:
     ----------
-    the previous value of ln_taylor_terms_number
+    the previous value of cos_taylor_terms_number
     """
-    global cos_taylor_terms_number
-    old = cos_taylor_terms_number
-    cos_taylor_terms_number = number
-    return old
-
-
-def _cos_lb(x):
-    ia._set_rounding_mode_floor()
-    global cos_taylor_terms_number
-    n = cos_taylor_terms_number
-    s = ia.Interval(ia.c_one, ia.c_one)
-    flag = False
-    if n % 2 == 1:
-        n += 1
-    for i in range(1, n):
-        ii = ia.Interval(dec.Decimal(2 * i), dec.Decimal(2 * i))
-        term = (x ** (2 * i)) / factorial(ii)
-        if flag:
-            s += term
-            flag = False
-        else:
-            s -= term
-            flag = True
-    return s.a
-
-
-def _cos_ub(x):
-    ia._set_rounding_mode_ceil()
-    global cos_taylor_terms_number
-    n = cos_taylor_terms_number
-    s = ia.Interval(ia.c_one, ia.c_one)
-    flag = False
-    if n % 2 == 1:
-        n -= 1
-    for i in range(1, n + 1):
-        ii = ia.Interval(dec.Decimal(2 * i), dec.Decimal(2 * i))
-        term = (x ** (2 * i)) / factorial(ii)
-        if flag:
-            s += term
-            flag = False
-        else:
-            s -= term
-            flag = True
-    return s.b
-
-
-def _cos(xp):
-    xp = xp % pi2
-    if xp < 0:
-        xp2 = xp + pi2
-        if xp2 < -xp:
-            xp = xp2
+    return _set_terms("cos", number)
+
+
+# sin(r) = r - r^3 / 3! + ..., the remainder's magnitude is below |r|^(2n+1) / (2n+1)!
+def _sin_series(r, mag):
+    n = max(1, (_order(float(mag), 1, 2, _terms("sin"), relative=True) - 1) // 2)
+    rf = _table("factorial", 2 * n + 2, _reciprocal_factorial)
+    rq = r ** 2
+    s = rf[2 * n - 1] if n % 2 == 1 else -rf[2 * n - 1]
+    for i in range(n - 2, -1, -1):
+        s = s * rq + (rf[2 * i + 1] if i % 2 == 0 else -rf[2 * i + 1])
+    return r * s + _remainder((_dot(mag) ** (2 * n + 1) * rf[2 * n + 1]).b)
+
+
+# cos(r) = 1 - r^2 / 2! + ..., the remainder's magnitude is below |r|^(2n) / (2n)!
+def _cos_series(r, mag):
+    n = max(1, _order(float(mag), 0, 2, _terms("cos")) // 2)
+    rf = _table("factorial", 2 * n + 1, _reciprocal_factorial)
+    rq = r ** 2
+    s = rf[2 * n - 2] if n % 2 == 1 else -rf[2 * n - 2]
+    for i in range(n - 2, -1, -1):
+        s = s * rq + (rf[2 * i] if i % 2 == 0 else -rf[2 * i])
+    return s + _remainder((_dot(mag) ** (2 * n) * rf[2 * n]).b)
+
+
+# sin(x + quadrant pi / 2) for a point x
+def _sin_point(xp, quadrant):
+    if xp.is_infinite():
+        return ia.Interval(ia.c_mone, ia.c_one)
+    pi05 = _pi05()
+    k = int(round(float(xp) / (math.pi / 2)))
+    r = _dot(xp) - k * pi05
+    mag = _magnitude(r)
+    q = (k + quadrant) % 4
+    if q == 0:
+        y = _sin_series(r, mag)
+    elif q == 1:
+        y = _cos_series(r, mag)
+    elif q == 2:
+        y = -_sin_series(r, mag)
     else:
-        xp2 = xp - pi2
-        if -xp2 < xp:
-            xp = xp2
-    x = ia.Interval(xp, xp)
-    return ia.Interval(_cos_lb(x), _cos_ub(x))
-
-
-def cos(x_input: ia.Interval):
-    a = _cos(x_input.a)
-    b = _cos(x_input.b)
-    if (x_input.a / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_CEILING) <= (
-            x_input.b / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_FLOOR):
-        max_val = dec.Decimal(1)
+        y = -_cos_series(r, mag)
+    return ia.Interval(max(y.a, ia.c_mone), min(y.b, ia.c_one))
+
+
+def _contains_shift(x, shift):
+    # True if x may contain a point shift + 2 k pi for an integer k
+    pi2 = _constant("pi2", lambda: 2 * pi_interval())
+    lo = ((_dot(x.a) - shift) / pi2).a
+    hi = ((_dot(x.b) - shift) / pi2).b
+    return lo.to_integral_value(rounding=dec.ROUND_CEILING) <= hi.to_integral_value(rounding=dec.ROUND_FLOOR)
+
+
+def _trig(x_input, quadrant):
+    if x_input.a.is_infinite() or x_input.b.is_infinite():
+        return ia.Interval(ia.c_mone, ia.c_one)
+    a = _sin_point(x_input.a, quadrant)
+    b = a if x_input.b == x_input.a else _sin_point(x_input.b, quadrant)
+    # sin(x + quadrant pi / 2) reaches 1 at pi / 2 - quadrant pi / 2 + 2 k pi and -1 at -pi / 2 - quadrant pi / 2 + 2 k pi
+    pi05 = _pi05()
+    if _contains_shift(x_input, (1 - quadrant) * pi05):
+        max_val = ia.c_one
     else:
         max_val = max(a.b, b.b)
-    if ((x_input.a - pi) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_CEILING) <= (
-            (x_input.b - pi) / pi2).quantize(dec.Decimal('1.'), rounding=dec.ROUND_FLOOR):
-        min_val = dec.Decimal(-1)
+    if _contains_shift(x_input, (-1 - quadrant) * pi05):
+        min_val = ia.c_mone
     else:
         min_val = min(a.a, b.a)
     return ia.Interval(min_val, max_val)
 
 
+def sin(x_input: ia.Interval):
+    """
+    Computes reliable bounds for sine.
+
+    Parameters:
+    -----------
+    x_input : an interval
+
+    Returns:
+    --------
+    Enclosing interval for sin(x)
+    """
+    return _trig(x_input, 0)
+
+
+def cos(x_input: ia.Interval):
+    """
+    Computes reliable bounds for cosine.
+
+    Parameters:
+    -----------
+    x_input : an interval
+
+    Returns:
+    --------
+    Enclosing interval for cos(x)
+    """
+    return _trig(x_input, 1)
+
+
 def sqrt(x_input):
     if isinstance(x_input, ia.Interval):
         return x_input.sqrt()
@@ -3,195 +3,387 @@ import numpy as np
 
 
 class Interval:
+    """ Interval [lo, hi]
+
+    The ends are kept in two slots. Indexing (x[0], x[1]) and the x attribute (which is the interval itself) are
+    supported for the code written against the list-based storage.
+
+    Attributes:
+        lo: lower end
+        hi: upper end
+    """
+    __slots__ = ('lo', 'hi')
 
     def __init__(self, x):
-        self.x = x.copy()
+        """
+        Constructor
+        Args:
+            x: pair [lower end, upper end] (list, tuple or Interval)
+        """
+        self.lo = x[0]
+        self.hi = x[1]
+
+    @property
+    def x(self):
+        return self
+
+    @x.setter
+    def x(self, value):
+        self.lo = value[0]
+        self.hi = value[1]
 
     def __repr__(self):
-        return "[" + str(round(self.x[0], 3)) + ", " + str(round(self.x[1], 3)) + "]"
+        return "[" + str(round(self.lo, 3)) + ", " + str(round(self.hi, 3)) + "]"
 
     def __round__(self, n=3):
-        return Interval([np.round(self.x[0], 3), np.round(self.x[1], 3)])
+        return Interval([np.round(self.lo, 3), np.round(self.hi, 3)])
+
+    def __getitem__(self, item):
+        if item == 0:
+            return self.lo
+        elif item == 1:
+            return self.hi
+        return (self.lo, self.hi)[item]
+
+    def __setitem__(self, key, value):
+        if key == 0 or key == -2:
+            self.lo = value
+        elif key == 1 or key == -1:
+            self.hi = value
+        else:
+            raise IndexError("interval index out of range")
+
+    def __iter__(self):
+        yield self.lo
+        yield self.hi
+
+    def __len__(self):
+        return 2
+
+    def copy(self):
+        return _make(self.lo, self.hi)
 
     def include_zero(self) -> bool:
-        if (self.x[0] > 0 and self.x[1] > 0) or (self.x[0] < 0 and self.x[1] < 0):
+        if (self.lo > 0 and self.hi > 0) or (self.lo < 0 and self.hi < 0):
             return False
         else:
             return True
 
     def mid(self):
-        return 0.5 * (self.x[0] + self.x[1])
+        return 0.5 * (self.lo + self.hi)
 
     def width(self):
-        return self.x[1] - self.x[0]
+        return self.hi - self.lo
 
     def scale(self, factor):
-        m = 0.5 * (self.x[0] + self.x[1])
-        r = 0.5 * (self.x[1] - self.x[0])
-        self.x[0] = m - factor * r
-        self.x[1] = m + factor * r
+        m = 0.5 * (self.lo + self.hi)
+        r = 0.5 * (self.hi - self.lo)
+        self.lo = m - factor * r
+        self.hi = m + factor * r
 
     def isIn(self, other):
-        return (self.x[0] >= other.x[0]) and (self.x[1] <= other.x[1])
+        return (self.lo >= other.lo) and (self.hi <= other.hi)
 
     def isNoIntersec(self, other):
-        return (self.x[0] > other.x[1]) or (self.x[1] < other.x[0])
+        return (self.lo > other.hi) or (self.hi < other.lo)
 
     def intersec(self, other):
-        if self.x[0] > self.x[1]:
-            raise ValueError(other.x[0], other.x[1], "results in wrong bounds:", self.x[0], self.x[1])
-        return Interval([max(self.x[0], other.x[0]), min(self.x[1], other.x[1])])
-
-    def __getitem__(self, item):
-        return self.x[item]
-
-    def __setitem__(self, key, value):
-        self.x.__setitem__(key, value)
+        if self.lo > self.hi:
+            raise ValueError(other.lo, other.hi, "results in wrong bounds:", self.lo, self.hi)
+        return _make(max(self.lo, other.lo), min(self.hi, other.hi))
 
     def __neg__(self):
-        ninterval = Interval(self.x)
-        ninterval.x[0] = - self.x[1]
-        ninterval.x[1] = - self.x[0]
-        return ninterval
+        return _make(-self.hi, -self.lo)
 
     def __add__(self, other):
-        ointerval = valueToInterval(other)
-        ninterval = Interval(self.x)
-        # print(self, other)
-        ninterval.x[0] = self.x[0] + ointerval.x[0]
-        ninterval.x[1] = self.x[1] + ointerval.x[1]
-        return ninterval
+        if type(other) is Interval:
+            return _make(self.lo + other.lo, self.hi + other.hi)
+        if isinstance(other, IntervalArray):
+            return NotImplemented
+        return _make(self.lo + other, self.hi + other)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other):
-        ointerval = valueToInterval(other)
-        ninterval = Interval(self.x)
-        ninterval.x[0] = self.x[0] - ointerval.x[1]
-        ninterval.x[1] = self.x[1] - ointerval.x[0]
-        return ninterval
+        if type(other) is Interval:
+            return _make(self.lo - other.hi, self.hi - other.lo)
+        if isinstance(other, IntervalArray):
+            return NotImplemented
+        return _make(self.lo - other, self.hi - other)
 
     def __rsub__(self, other):
-        ointerval = valueToInterval(other)
-        return ointerval.__sub__(self)
+        return _make(other - self.hi, other - self.lo)
 
     def __pow__(self, other):
-        ninterval = Interval(self.x)
-        u = self.x[0] ** other
-        v = self.x[1] ** other
         if other == 0:
-            ninterval.x[0] = 1
-            ninterval.x[1] = 1
-        elif other % 2 == 0:
-            ninterval.x[1] = max(u, v)
-            if self.x[0] <= 0 and self.x[1] >= 0:
-                ninterval.x[0] = 0
-            else:
-                ninterval.x[0] = min(u, v)
-        else:
-            ninterval.x[0] = u
-            ninterval.x[1] = v
-        return ninterval
+            return _make(1, 1)
+        if other < 0 and other == int(other):
+            return 1 / self.__pow__(-other)
+        u = self.lo ** other
+        v = self.hi ** other
+        if other % 2 == 0:
+            if self.lo <= 0 <= self.hi:
+                return _make(0, max(u, v))
+            return _make(min(u, v), max(u, v))
+        return _make(u, v)
 
     def __mul__(self, other):
-        ointerval = valueToInterval(other)
-        v = [self.x[0] * ointerval.x[0], self.x[0] * ointerval.x[1], self.x[1] * ointerval.x[0],
-             self.x[1] * ointerval.x[1]]
-        b = [min(v), max(v)]
-        return Interval(b)
+        if type(other) is Interval:
+            p1 = self.lo * other.lo
+            p2 = self.lo * other.hi
+            p3 = self.hi * other.lo
+            p4 = self.hi * other.hi
+            return _make(min(p1, p2, p3, p4), max(p1, p2, p3, p4))
+        if isinstance(other, IntervalArray):
+            return NotImplemented
+        p1 = self.lo * other
+        p2 = self.hi * other
+        return _make(p1, p2) if p1 <= p2 else _make(p2, p1)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
 
     def __truediv__(self, other):
-        ointerval = valueToInterval(other)
-        # v = [self.x[0] / ointerval.x[0], self.x[0] / ointerval.x[1], self.x[1] / ointerval.x[0],
-        #      self.x[1] / ointerval.x[1]]
-        # f = [min(v), max(v)]
-        # return Interval(f)
-        if not (valueToInterval(0).isIn(ointerval)):
-            v = [self.x[0] / ointerval.x[0], self.x[0] / ointerval.x[1], self.x[1] / ointerval.x[0],
-                 self.x[1] / ointerval.x[1]]
-            f = [min(v), max(v)]
-            return Interval(f)
+        if type(other) is Interval:
+            bl = other.lo
+            bh = other.hi
+        elif isinstance(other, IntervalArray):
+            return NotImplemented
         else:
-            # print(self, ointerval)
-            c = []
-            a1, a2 = self.x[0], self.x[1]
-            b1, b2 = ointerval.x[0], ointerval.x[1]
-            if b2 == 0:
-                c = self * Interval([-np.inf, 1 / b1])
-            elif b1 == 0:
-                c = self * Interval([1 / b2, np.inf])
-            elif b1 < 0 and b2 > 0:
-                # c = [self*Interval([-np.inf, 1 / b1]), self*Interval([1 / b2, np.inf])]
-                c = Interval([-np.inf, np.inf])
-            # if b2 == 0 and a2 <=0:
-            #     c = [a2/b1, np.inf]
-            # elif a2 < 0 and b1 < 0 and b2 > 0:
-            #     c = [[-np.inf, a2/b2], [a2/b1, np.inf]]
-            # elif a2 <= 0 and b1 == 0:
-            #     c = [-np.inf, a2/b2]
-            # elif a1 >= 0 and b2 == 0:
-            #     c = [-np.inf, a1/b1]
-            # elif a1 > 0 and b1 < 0 and b2 > 0:
-            #     c = [[-np.inf, a1/b1], [a1/b2, np.inf]]
-            # elif a1 >= 0 and b1 == 0:
-            #     c = [a1/b2, np.inf]
-            # elif a1 < 0 and a2 > 0:
-            #     c = [-np.inf, np.inf]
-            # print(c)
-            # print(type(c))
-            return c
+            bl = bh = other
+        return _div(self.lo, self.hi, bl, bh)
+
+    def __rtruediv__(self, other):
+        return _div(other, other, self.lo, self.hi)
 
     def __floordiv__(self, other):
         ointerval = valueToInterval(other)
-        v = [self.x[0] // ointerval.x[0], self.x[0] // ointerval.x[1], self.x[1] // ointerval.x[0],
-             self.x[1] // ointerval.x[1]]
-        b = [min(v), max(v)]
-        return Interval(b)
+        v = [self.lo // ointerval.lo, self.lo // ointerval.hi, self.hi // ointerval.lo, self.hi // ointerval.hi]
+        return _make(min(v), max(v))
+
+    def __abs__(self):
+        if self.hi < 0:
+            return _make(-self.hi, -self.lo)
+        elif self.lo < 0:
+            return _make(0, max(-self.lo, self.hi))
+        else:
+            return _make(self.lo, self.hi)
+
+
+_new = object.__new__
+
+
+def _make(lo, hi):
+    """
+    Creates an interval from its ends without going through the list-based constructor
+    """
+    r = _new(Interval)
+    r.lo = lo
+    r.hi = hi
+    return r
+
+
+def _div(al, ah, bl, bh):
+    if bl > 0 or bh < 0:
+        v1 = al / bl
+        v2 = al / bh
+        v3 = ah / bl
+        v4 = ah / bh
+        return _make(min(v1, v2, v3, v4), max(v1, v2, v3, v4))
+    a = _make(al, ah)
+    if bh == 0:
+        return a * _make(-np.inf, 1 / bl)
+    elif bl == 0:
+        return a * _make(1 / bh, np.inf)
+    else:
+        return _make(-np.inf, np.inf)
+
+
+class IntervalArray:
+    """ Array of intervals
+
+    Stores the lower and upper ends in numpy arrays so the arithmetic and the elementary functions bound many
+    intervals in one call. The operations follow Interval. An IntervalArray can be passed to the objectives
+    lambdified with the functions of this module.
+
+    Attributes:
+        lo: lower ends
+        hi: upper ends
+    """
+    # make numpy scalars and arrays defer to the reflected operators below
+    __array_ufunc__ = None
+
+    def __init__(self, lo, hi):
+        """
+        Constructor
+        Args:
+            lo: lower ends (array-like)
+            hi: upper ends (array-like)
+        """
+        self.lo = np.array(lo, dtype=float)
+        self.hi = np.array(hi, dtype=float)
+
+    def __repr__(self):
+        return "[" + ", ".join(str(Interval([l, h])) for l, h in zip(self.lo, self.hi)) + "]"
+
+    def __len__(self):
+        return len(self.lo)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return Interval([float(self.lo[item]), float(self.hi[item])])
+        return IntervalArray(self.lo[item], self.hi[item])
+
+    def __iter__(self):
+        for l, h in zip(self.lo, self.hi):
+            yield Interval([float(l), float(h)])
+
+    def include_zero(self):
+        return (self.lo <= 0) & (self.hi >= 0)
+
+    def mid(self):
+        return 0.5 * (self.lo + self.hi)
+
+    def width(self):
+        return self.hi - self.lo
+
+    def __neg__(self):
+        return IntervalArray(-self.hi, -self.lo)
+
+    def __add__(self, other):
+        lo, hi = _array_ends(other)
+        return IntervalArray(self.lo + lo, self.hi + hi)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        lo, hi = _array_ends(other)
+        return IntervalArray(self.lo - hi, self.hi - lo)
+
+    def __rsub__(self, other):
+        lo, hi = _array_ends(other)
+        return IntervalArray(lo - self.hi, hi - self.lo)
+
+    def __mul__(self, other):
+        lo, hi = _array_ends(other)
+        return IntervalArray(*_mul_arrays(self.lo, self.hi, lo, hi))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
+    def __truediv__(self, other):
+        lo, hi = _array_ends(other)
+        return IntervalArray(*_div_arrays(self.lo, self.hi, lo, hi))
+
     def __rtruediv__(self, other):
-        ointerval = valueToInterval(other)
-        return ointerval.__truediv__(self)
+        lo, hi = _array_ends(other)
+        return IntervalArray(*_div_arrays(lo, hi, self.lo, self.hi))
+
+    def __pow__(self, other):
+        if other == 0:
+            return IntervalArray(np.ones_like(self.lo), np.ones_like(self.hi))
+        if other < 0 and other == int(other):
+            return 1 / self.__pow__(-other)
+        u = self.lo ** other
+        v = self.hi ** other
+        if other % 2 == 0:
+            lo = np.where(self.include_zero(), 0.0, np.minimum(u, v))
+            return IntervalArray(lo, np.maximum(u, v))
+        return IntervalArray(u, v)
 
     def __abs__(self):
-        if self.x[1] < 0:
-            return Interval([-self.x[1], -self.x[0]])
-        elif self.x[0] < 0:
-            if -self.x[0] > self.x[1]:
-                return Interval([self.x[1], -self.x[0]])
-            else:
-                return Interval([-self.x[0], self.x[1]])
-        else:
-            return Interval([self.x[0], self.x[1]])
+        lo = np.where(self.hi < 0, -self.hi, np.where(self.lo < 0, 0.0, self.lo))
+        hi = np.where(self.hi < 0, -self.lo, np.where(self.lo < 0, np.maximum(-self.lo, self.hi), self.hi))
+        return IntervalArray(lo, hi)
+
 
+def from_intervals(intervals):
+    """
+    Packs intervals into an IntervalArray
+    Args:
+        intervals: sequence of Interval
+
+    Returns:
+        IntervalArray with the same intervals
+    """
+    return IntervalArray([i.lo for i in intervals], [i.hi for i in intervals])
+
+
+def _array_ends(other):
+    if isinstance(other, IntervalArray):
+        return other.lo, other.hi
+    elif isinstance(other, Interval):
+        return other.lo, other.hi
+    else:
+        return other, other
+
+
+def _mul_arrays(al, ah, bl, bh):
+    with np.errstate(invalid='ignore'):
+        p1 = al * bl
+        p2 = al * bh
+        p3 = ah * bl
+        p4 = ah * bh
+    return np.fmin(np.fmin(p1, p2), np.fmin(p3, p4)), np.fmax(np.fmax(p1, p2), np.fmax(p3, p4))
+
+
+def _div_arrays(al, ah, bl, bh):
+    al, ah, bl, bh = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (al, ah, bl, bh)))
+    lo = np.full(al.shape, -np.inf)
+    hi = np.full(al.shape, np.inf)
+    # denominator without zero
+    m = (bl > 0) | (bh < 0)
+    if m.any():
+        q1 = al[m] / bl[m]
+        q2 = al[m] / bh[m]
+        q3 = ah[m] / bl[m]
+        q4 = ah[m] / bh[m]
+        lo[m] = np.minimum(np.minimum(q1, q2), np.minimum(q3, q4))
+        hi[m] = np.maximum(np.maximum(q1, q2), np.maximum(q3, q4))
+    # [b1, 0] -> multiply by [-inf, 1 / b1]
+    m = (bh == 0) & (bl < 0)
+    if m.any():
+        lo[m], hi[m] = _mul_arrays(al[m], ah[m], -np.inf, 1 / bl[m])
+    # [0, b2] -> multiply by [1 / b2, inf]
+    m = (bl == 0) & (bh > 0)
+    if m.any():
+        lo[m], hi[m] = _mul_arrays(al[m], ah[m], 1 / bh[m], np.inf)
+    return lo, hi
 
 def sin(x_input):
-    if isinstance(x_input, Interval):
-        return _sin(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return _sin_array(x_input)
+    elif isinstance(x_input, Interval):
+        return _sin(x_input)
     else:
         return math.sin(x_input)
 
 
 def cos(x_input):
-    if isinstance(x_input, Interval):
-        return _cos(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return _cos_array(x_input)
+    elif isinstance(x_input, Interval):
+        return _cos(x_input)
     else:
         return math.cos(x_input)
 
 
 def exp(x_input):
-    if isinstance(x_input, Interval):
-        return _exp(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return _exp_array(x_input)
+    elif isinstance(x_input, Interval):
+        return _exp(x_input)
     else:
         return math.exp(x_input)
 
 
 def abs(x_input):
-    if isinstance(x_input, Interval):
-        return _abs(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return x_input.__abs__()
+    elif isinstance(x_input, Interval):
+        return _abs(x_input)
     else:
         if x_input < 0:
             return -x_input
@@ -200,15 +392,19 @@ def abs(x_input):
 
 
 def log(x_input):
-    if isinstance(x_input, Interval):
-        return _ln(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return _ln_array(x_input)
+    elif isinstance(x_input, Interval):
+        return _ln(x_input)
     else:
         return math.log(x_input)
 
 
 def sqrt(x_input):
-    if isinstance(x_input, Interval):
-        return _sqrt(x_input.x)
+    if isinstance(x_input, IntervalArray):
+        return _sqrt_array(x_input)
+    elif isinstance(x_input, Interval):
+        return _sqrt(x_input)
     else:
         return math.sqrt(x_input)
 
@@ -246,7 +442,7 @@ def _sin(x):
         a = -1
     else:
         a = min(y)
-    return Interval([a, b])
+    return _make(a, b)
 
 
 def _cos(x):
@@ -265,35 +461,68 @@ def _cos(x):
         a = -1
     else:
         a = min(y)
-    return Interval([a, b])
+    return _make(a, b)
 
 
 def _exp(x):
-    return Interval([math.exp(x[0]), math.exp(x[1])])
+    return _make(math.exp(x[0]), math.exp(x[1]))
 
 
 def _abs(x):
     if x[1] < 0:
-        return Interval([-x[1], -x[0]])
+        return _make(-x[1], -x[0])
     elif x[0] < 0:
-        if -x[0] > x[1]:
-            return Interval([x[1], -x[0]])
-        else:
-            return Interval([-x[0], x[1]])
+        return _make(0, max(-x[0], x[1]))
     else:
-        return Interval([x[0], x[1]])
+        return _make(x[0], x[1])
 
 
 def _log(x, base):
     if base > 1:
-        return Interval([math.log(x[0], base), math.log(x[1], base)])
+        return _make(math.log(x[0], base), math.log(x[1], base))
     else:
-        return Interval([math.log(x[1], base), math.log(x[0], base)])
+        return _make(math.log(x[1], base), math.log(x[0], base))
 
 
 def _sqrt(x):
-    return Interval([math.sqrt(x[0]), math.sqrt(x[1])])
+    return _make(math.sqrt(x[0]), math.sqrt(x[1]))
 
 
 def _ln(x):
-    return Interval([math.log(x[0]), math.log(x[1])])
+    return _make(math.log(x[0]), math.log(x[1]))
+
+
+def _sin_array(x):
+    pi2 = 2 * math.pi
+    pi05 = math.pi / 2
+    y1 = np.sin(x.lo)
+    y2 = np.sin(x.hi)
+    hi = np.where(np.ceil((x.lo - pi05) / pi2) <= np.floor((x.hi - pi05) / pi2), 1.0, np.maximum(y1, y2))
+    lo = np.where(np.ceil((x.lo + pi05) / pi2) <= np.floor((x.hi + pi05) / pi2), -1.0, np.minimum(y1, y2))
+    return IntervalArray(lo, hi)
+
+
+def _cos_array(x):
+    pi2 = 2 * math.pi
+    y1 = np.cos(x.lo)
+    y2 = np.cos(x.hi)
+    hi = np.where(np.ceil(x.lo / pi2) <= np.floor(x.hi / pi2), 1.0, np.maximum(y1, y2))
+    lo = np.where(np.ceil((x.lo - math.pi) / pi2) <= np.floor((x.hi - math.pi) / pi2), -1.0, np.minimum(y1, y2))
+    return IntervalArray(lo, hi)
+
+
+def _exp_array(x):
+    with np.errstate(over='ignore'):
+        return IntervalArray(np.exp(x.lo), np.exp(x.hi))
+
+
+def _sqrt_array(x):
+    if np.any(x.lo < 0):
+        raise ValueError("math domain error")
+    return IntervalArray(np.sqrt(x.lo), np.sqrt(x.hi))
+
+
+def _ln_array(x):
+    if np.any(x.lo <= 0):
+        raise ValueError("math domain error")
+    return IntervalArray(np.log(x.lo), np.log(x.hi))
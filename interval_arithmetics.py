@@ -3,6 +3,8 @@
 """
 
 import decimal as dec
+import numbers
+import threading
 
 # Usefull numerical constants
 
@@ -28,10 +30,129 @@ c_two = dec.Decimal('2')
 c_mtwo = dec.Decimal('-2')
 
 
+class VerifiedContext:
+    """
+    Settings of the correctly rounded evaluations: the precision, the contexts of the directed rounding the interval
+    operations are performed through (so the rounding mode of the thread's decimal context is never changed), the
+    numbers of series terms of the elementary functions (ia_math_fun) and the cache of their coefficients and
+    constants
+
+    The operations use the context of the current thread, set by a with statement:
+
+        with VerifiedContext(50):
+            ...
+
+    which also gives the thread's decimal context the precision of the verified one (for the plain Decimal
+    operations of the callers, e.g. the split points of the subintervals).
+
+    Threads that did not enter a context share the module default one (changed by set_precision), so solves running
+    concurrently should use their own contexts. A context may be entered by several threads.
+
+    Attributes
+    ----------
+    floor, ceil, nearest : decimal contexts rounding to -Infinity, +Infinity and to the nearest
+    terms : dict, elementary function name ('exp', 'log', 'sin', 'cos') -> number of series terms (missing or None -
+        chosen automatically)
+    cache : dict, cached values of ia_math_fun (valid for the precision they were computed at)
+    lock : the lock the threads sharing the context fill the cache under
+    """
+
+    def __init__(self, prec=None, terms=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        prec : number of significant decimal digits, None - the precision of the thread's decimal context
+        terms : dict of the numbers of series terms (copied), None - all chosen automatically
+        """
+        if prec is None:
+            prec = dec.getcontext().prec
+        self.floor = dec.Context(prec=prec, rounding=dec.ROUND_FLOOR)
+        self.ceil = dec.Context(prec=prec, rounding=dec.ROUND_CEILING)
+        self.nearest = dec.Context(prec=prec, rounding=dec.ROUND_HALF_EVEN)
+        self.terms = dict(terms) if terms is not None else {}
+        self.cache = {}
+        self.lock = threading.RLock()
+
+    @property
+    def prec(self):
+        """
+        The number of significant decimal digits of the operations
+        """
+        return self.floor.prec
+
+    @prec.setter
+    def prec(self, prec):
+        for ctx in (self.floor, self.ceil, self.nearest):
+            ctx.prec = prec
+
+    def copy(self):
+        """
+        Returns a context with the same precision and numbers of terms (and an empty cache)
+        """
+        return VerifiedContext(self.prec, self.terms)
+
+    def __reduce__(self):
+        # the cache is not pickled, it is recomputed on demand
+        return VerifiedContext, (self.prec, self.terms)
+
+    def __enter__(self):
+        _local.stack.append((_local.context, dec.getcontext()))
+        _local.context = self
+        dec.setcontext(self.nearest.copy())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.context, dec_context = _local.stack.pop()
+        dec.setcontext(dec_context)
+
+    def __repr__(self):
+        return "VerifiedContext(prec=" + str(self.prec) + ", terms=" + repr(self.terms) + ")"
+
+
+class _Local(threading.local):
+    # Per thread state: the current context and the contexts replaced by the with statements
+
+    def __init__(self):
+        self.context = _default_context
+        self.stack = []
+
+
+# Context of the threads that did not set their own
+_default_context = VerifiedContext()
+
+_local = _Local()
+
+
+def getcontext():
+    """
+    Returns the verified context of the current thread
+    """
+    return _local.context
+
+
+def setcontext(context):
+    """
+    Sets the verified context of the current thread
+
+    Parameters
+    ----------
+    context : VerifiedContext
+    """
+    _local.context = context
+
+
+# 0.5
+_c_half = dec.Decimal('0.5')
+
+
 def set_precision(prec):
     """
     Sets the precision as the number of significant decimal digits in mantissa
     
+    Both the thread's decimal context and the current verified context are updated
+
     Parameters
     ----------
     prec : integer
@@ -39,9 +160,20 @@ def set_precision(prec):
     """
     prev = dec.getcontext().prec
     dec.getcontext().prec = prec
+    getcontext().prec = prec
     return prev
 
 
+def get_precision():
+    """
+    Returns the number of significant decimal digits of the interval operations in the current verified context
+    """
+    return getcontext().prec
+
+
+# The helpers below change the rounding mode of the current context, they are kept for the code doing its own
+# Decimal computations, the interval operations do not use them
+
 def _set_rounding_mode(rounding_mode):
     prev = dec.getcontext().rounding
     dec.getcontext().rounding = rounding_mode
@@ -60,33 +192,69 @@ def _set_rounding_mode_floor():
     return _set_rounding_mode(dec.ROUND_FLOOR)
 
 
-def _my_mul(a, b):
+def _my_mul(a, b, ctx):
     if (a == c_zero) or (b == c_zero):
         return c_zero
     else:
-        return a * b
+        return ctx.multiply(a, b)
 
 
-def _my_div(a, b):
+def _my_div(a, b, ctx):
     if b.is_infinite():
         if a.is_infinite():
             raise ValueError('Infinity by infinity division')
         else:
             return dec.Decimal('0')
-    return a / b
+    return ctx.divide(a, b)
+
+
+def _mul_ends(a1, a2, b1, b2, floor, ceil):
+    # Products giving the ends of [a1, a2] * [b1, b2] selected by the signs of the ends
+    if a1 >= c_zero:
+        if b1 >= c_zero:
+            return _my_mul(a1, b1, floor), _my_mul(a2, b2, ceil)
+        elif b2 <= c_zero:
+            return _my_mul(a2, b1, floor), _my_mul(a1, b2, ceil)
+        else:
+            return _my_mul(a2, b1, floor), _my_mul(a2, b2, ceil)
+    elif a2 <= c_zero:
+        if b1 >= c_zero:
+            return _my_mul(a1, b2, floor), _my_mul(a2, b1, ceil)
+        elif b2 <= c_zero:
+            return _my_mul(a2, b2, floor), _my_mul(a1, b1, ceil)
+        else:
+            return _my_mul(a1, b2, floor), _my_mul(a1, b1, ceil)
+    else:
+        if b1 >= c_zero:
+            return _my_mul(a1, b2, floor), _my_mul(a2, b2, ceil)
+        elif b2 <= c_zero:
+            return _my_mul(a2, b1, floor), _my_mul(a1, b1, ceil)
+        else:
+            return (min(_my_mul(a1, b2, floor), _my_mul(a2, b1, floor)),
+                    max(_my_mul(a1, b1, ceil), _my_mul(a2, b2, ceil)))
 
 
 class Interval:
     """Class for storing interval values and perform interval operations"""
 
     def _convert_to_interval(other):
-        if type(other) == dec.Decimal:
+        # None for the operands of other types, the operators then return NotImplemented (e.g. for jet.Jet)
+        if type(other) == Interval:
+            return other
+        elif type(other) == dec.Decimal:
             return Interval(other, other)
         elif type(other) == int or type(other) == float:
             v = dec.Decimal(other)
             return Interval(v, v)
+        elif isinstance(other, numbers.Integral):
+            v = dec.Decimal(int(other))
+            return Interval(v, v)
+        elif isinstance(other, numbers.Real) and float(other) == other:
+            # numpy floating scalars (e.g. the interval ends read with pandas) are binary floats
+            v = dec.Decimal(float(other))
+            return Interval(v, v)
         else:
-            return other
+            return None
 
     def __init__(self, a: dec.Decimal, b: dec.Decimal):
         """
@@ -104,147 +272,131 @@ class Interval:
         self.b = b
 
     def __neg__(self):
-        _set_rounding_mode_floor()
-        a = -self.b
-        _set_rounding_mode_ceil()
-        b = -self.a
-        return Interval(a, b)
+        c = _local.context
+        return Interval(c.floor.minus(self.b), c.ceil.minus(self.a))
 
     def __eq__(self, other):
         return (self.a == other.a) and (self.b == other.b)
 
     def __add__(self, other):
         nother = Interval._convert_to_interval(other)
-        _set_rounding_mode_floor()
-        a = self.a + nother.a
-        _set_rounding_mode_ceil()
-        b = self.b + nother.b
-        return Interval(a, b)
+        if nother is None:
+            return NotImplemented
+        c = _local.context
+        return Interval(c.floor.add(self.a, nother.a), c.ceil.add(self.b, nother.b))
 
     def __sub__(self, other):
         nother = Interval._convert_to_interval(other)
-        _set_rounding_mode_floor()
-        a = self.a - nother.b
-        _set_rounding_mode_ceil()
-        b = self.b - nother.a
-        return Interval(a, b)
+        if nother is None:
+            return NotImplemented
+        c = _local.context
+        return Interval(c.floor.subtract(self.a, nother.b), c.ceil.subtract(self.b, nother.a))
 
     def __mul__(self, other):
         nother = Interval._convert_to_interval(other)
-        _set_rounding_mode_floor()
-        aa = _my_mul(self.a, nother.a)
-        ab = _my_mul(self.a, nother.b)
-        ba = _my_mul(self.b, nother.a)
-        bb = _my_mul(self.b, nother.b)
-        a = min(aa, ab, ba, bb)
-        _set_rounding_mode_ceil()
-        aa = _my_mul(self.a, nother.a)
-        ab = _my_mul(self.a, nother.b)
-        ba = _my_mul(self.b, nother.a)
-        bb = _my_mul(self.b, nother.b)
-        b = max(aa, ab, ba, bb)
+        if nother is None:
+            return NotImplemented
+        c = _local.context
+        a, b = _mul_ends(self.a, self.b, nother.a, nother.b, c.floor, c.ceil)
         return Interval(a, b)
 
     def __pow__(self, other):
         if isinstance(other, int) and other > c_zero:
             if other == 1:
                 return self
-            _set_rounding_mode_floor()
+            c = _local.context
             if other % 2 == 0:
                 if self.a <= c_zero and self.b >= c_zero:
                     a = c_zero
-                    _set_rounding_mode_ceil()
                     if -self.a < self.b:
-                        b = self.b ** other
+                        b = c.ceil.power(self.b, other)
                     else:
-                        b = self.a ** other
+                        b = c.ceil.power(self.a, other)
                 elif self.a > c_zero:
-                    a = self.a ** other
-                    _set_rounding_mode_ceil()
-                    b = self.b ** other
+                    a = c.floor.power(self.a, other)
+                    b = c.ceil.power(self.b, other)
                 elif self.b < c_zero:
-                    a = self.b ** other
-                    _set_rounding_mode_ceil()
-                    b = self.a ** other
+                    a = c.floor.power(self.b, other)
+                    b = c.ceil.power(self.a, other)
             else:
-                a = self.a ** other
-                _set_rounding_mode_ceil()
-                b = self.b ** other
+                a = c.floor.power(self.a, other)
+                b = c.ceil.power(self.b, other)
             return Interval(a, b)
+        elif isinstance(other, int) and other < 0:
+            # x^-n = 1 / x^n, the lambdified common subexpressions write the denominators so
+            return Interval(c_one, c_one) / self.__pow__(-other)
         elif other == 1 / 2:
             return self.sqrt()
         elif other == 3 / 2:
             return self.__pow__(3).sqrt()
         else:
-            raise TypeError("Power must be a positive integer")
+            raise TypeError("Power must be a nonzero integer")
 
     def sqrt(self):
-        _set_rounding_mode_floor()
-        a = self.a.sqrt()
-        _set_rounding_mode_ceil()
-        b = self.b.sqrt()
-        return Interval(a, b)
+        c = _local.context
+        return Interval(c.floor.sqrt(self.a), c.ceil.sqrt(self.b))
 
     def __truediv__(self, other):
         nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        c = _local.context
         if nother.a == nother.b == c_zero:
             if self.a <= c_zero <= self.b:
                 return Interval(c_minf, c_inf)
             else:
                 return None
         elif nother.a > c_zero or nother.b < c_zero:
-            _set_rounding_mode_floor()
-            ra = c_one / nother.b
-            _set_rounding_mode_ceil()
-            rb = c_one / nother.a
+            ra = c.floor.divide(c_one, nother.b)
+            rb = c.ceil.divide(c_one, nother.a)
             return self.__mul__(Interval(ra, rb))
         elif self.a <= c_zero <= self.b:
             return Interval(c_minf, c_inf)
         elif nother.a == c_zero:
             if self.b < c_zero:
-                _set_rounding_mode_ceil()
-                rb = _my_div(self.b, nother.b)
+                rb = _my_div(self.b, nother.b, c.ceil)
                 return Interval(c_minf, rb)
             elif self.a > c_zero:
-                _set_rounding_mode_floor()
-                ra = _my_div(self.a, nother.b)
+                ra = _my_div(self.a, nother.b, c.floor)
                 return Interval(ra, c_inf)
         elif nother.b == c_zero:
             if self.b < c_zero:
-                _set_rounding_mode_floor()
-                ra = _my_div(self.b, nother.a)
+                ra = _my_div(self.b, nother.a, c.floor)
                 return Interval(ra, c_inf)
             elif self.a > c_zero:
-                _set_rounding_mode_ceil()
-                rb = _my_div(self.a, nother.a)
+                rb = _my_div(self.a, nother.a, c.ceil)
                 return Interval(c_minf, rb)
         else:  # nother.a < 0 < nother.b:
             if self.b < c_zero:
-                _set_rounding_mode_ceil()
-                ra = _my_div(self.b, nother.b)
-                _set_rounding_mode_floor()
-                rb = _my_div(self.b, nother.a)
+                ra = _my_div(self.b, nother.b, c.ceil)
+                rb = _my_div(self.b, nother.a, c.floor)
             elif self.a > c_zero:
-                _set_rounding_mode_ceil()
-                ra = _my_div(self.a, nother.a)
-                _set_rounding_mode_floor()
-                rb = _my_div(self.a, nother.b)
+                ra = _my_div(self.a, nother.a, c.ceil)
+                rb = _my_div(self.a, nother.b, c.floor)
             return [Interval(c_minf, ra), Interval(rb, c_inf)]
 
     def __radd__(self, other):
         nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
         return nother.__add__(self)
 
     def __rsub__(self, other):
         nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
         return nother.__sub__(self)
 
     def __rmul__(self, other):
         nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
         return nother.__mul__(self)
 
     def __rtruediv__(self, other):
         nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
         return nother.__truediv__(self)
 
     def __repr__(self):
@@ -276,7 +428,7 @@ def convert_to_interval(val):
     
     Parameters
     ----------
-    val : Decimal, int, float
+    val : Decimal, int, float (or other real number exactly representable as a float)
     """
     return Interval._convert_to_interval(val)
 
@@ -289,8 +441,8 @@ def mid(ival):
     ----------
     ival : interval
     """
-    _set_rounding_mode_default()
-    return dec.Decimal('0.5') * (ival.a + ival.b)
+    c = _local.context
+    return c.nearest.multiply(_c_half, c.nearest.add(ival.a, ival.b))
 
 
 def mid_interval(ival):
@@ -301,10 +453,9 @@ def mid_interval(ival):
     ----------
     ival : interval
     """
-    _set_rounding_mode_floor()
-    a = dec.Decimal('0.5') * (ival.a + ival.b)
-    _set_rounding_mode_ceil()
-    b = dec.Decimal('0.5') * (ival.a + ival.b)
+    c = _local.context
+    a = c.floor.multiply(_c_half, c.floor.add(ival.a, ival.b))
+    b = c.ceil.multiply(_c_half, c.ceil.add(ival.a, ival.b))
     return Interval(a, b)
 
 
@@ -316,8 +467,7 @@ def wid(ival):
     ----------
     ival : interval
     """
-    _set_rounding_mode_ceil()
-    return ival.b - ival.a
+    return _local.context.ceil.subtract(ival.b, ival.a)
 
 
 def intersect(ival1, ival2):
@@ -369,5 +519,4 @@ def is_dot_interval(x):
     --------
     True if x is a dot interval, False otherwise
     """
-    res = dec.compare(x.a, x.b)
-    return True if res == c_zero else False
+    return x.a == x.b
@@ -0,0 +1,552 @@
+"""This module implements verified interval arithmetics on binary64 floats.
+
+The ends are Python floats. Every operation is computed in round-to-nearest and the result is then moved
+outwards: sums and differences are corrected with the exact error of the TwoSum error-free transform, so exactly
+representable results are not widened, other operations step to the next float (math.nextafter) unless the result
+is known to be exact. The elementary functions widen the libm results by a few ulps. The API follows
+interval_arithmetics, so the two backends are interchangeable in the correctly rounded processors.
+"""
+
+import decimal as dec
+import math
+import numbers
+
+# Usefull numerical constants
+
+# +Infinity
+c_inf = math.inf
+
+# -Infinity
+c_minf = -math.inf
+
+# 0
+c_zero = 0.0
+
+# 1
+c_one = 1.0
+
+# -1
+c_mone = -1.0
+
+# 2
+c_two = 2.0
+
+# -2
+c_mtwo = -2.0
+
+# Integers of larger magnitude may be not representable exactly
+_max_exact_int = 2 ** 53
+
+# Number of ulps the results of the libm elementary functions are widened by
+libm_ulps = 2
+
+
+def _down(x):
+    return math.nextafter(x, -math.inf)
+
+
+def _up(x):
+    return math.nextafter(x, math.inf)
+
+
+def _widen_down(x):
+    for i in range(libm_ulps):
+        x = math.nextafter(x, -math.inf)
+    return x
+
+
+def _widen_up(x):
+    for i in range(libm_ulps):
+        x = math.nextafter(x, math.inf)
+    return x
+
+
+def _add_err(a, b, s):
+    # TwoSum: the exact error a + b - s of the rounded sum s
+    bb = s - a
+    return (a - (s - bb)) + (b - bb)
+
+
+def _add_down(a, b):
+    s = a + b
+    if math.isinf(s) or math.isnan(s):
+        return s
+    return _down(s) if _add_err(a, b, s) < 0 else s
+
+
+def _add_up(a, b):
+    s = a + b
+    if math.isinf(s) or math.isnan(s):
+        return s
+    return _up(s) if _add_err(a, b, s) > 0 else s
+
+
+def _mul_down(a, b):
+    if a == 0 or b == 0:
+        return 0.0
+    p = a * b
+    if math.isinf(a) or math.isinf(b):
+        return p
+    return _down(p)
+
+
+def _mul_up(a, b):
+    if a == 0 or b == 0:
+        return 0.0
+    p = a * b
+    if math.isinf(a) or math.isinf(b):
+        return p
+    return _up(p)
+
+
+def _div_down(a, b):
+    if math.isinf(b):
+        if math.isinf(a):
+            raise ValueError('Infinity by infinity division')
+        return 0.0
+    if a == 0 or math.isinf(a):
+        return a / b
+    return _down(a / b)
+
+
+def _div_up(a, b):
+    if math.isinf(b):
+        if math.isinf(a):
+            raise ValueError('Infinity by infinity division')
+        return 0.0
+    if a == 0 or math.isinf(a):
+        return a / b
+    return _up(a / b)
+
+
+def _pow_down(x, n):
+    # x >= 0, n > 0
+    r = 1.0
+    while n > 0:
+        if n & 1:
+            r = _mul_down(r, x)
+        n >>= 1
+        if n:
+            x = _mul_down(x, x)
+    return r
+
+
+def _pow_up(x, n):
+    # x >= 0, n > 0
+    r = 1.0
+    while n > 0:
+        if n & 1:
+            r = _mul_up(r, x)
+        n >>= 1
+        if n:
+            x = _mul_up(x, x)
+    return r
+
+
+def _odd_pow_down(x, n):
+    return _pow_down(x, n) if x >= 0 else -_pow_up(-x, n)
+
+
+def _odd_pow_up(x, n):
+    return _pow_up(x, n) if x >= 0 else -_pow_down(-x, n)
+
+
+def _sqrt_down(x):
+    if x == 0 or math.isinf(x):
+        return math.sqrt(x)
+    return max(_down(math.sqrt(x)), 0.0)
+
+
+def _sqrt_up(x):
+    if x == 0 or math.isinf(x):
+        return math.sqrt(x)
+    return _up(math.sqrt(x))
+
+
+def _float_down(v):
+    f = float(v)
+    return _down(f) if dec.Decimal(f) > dec.Decimal(v) else f
+
+
+def _float_up(v):
+    f = float(v)
+    return _up(f) if dec.Decimal(f) < dec.Decimal(v) else f
+
+
+class Interval:
+    """Class for storing interval values and perform interval operations"""
+
+    __slots__ = ('a', 'b')
+
+    def _convert_to_interval(other):
+        # None for the operands of other types, the operators then return NotImplemented (e.g. for jet.Jet)
+        if type(other) == Interval:
+            return other
+        elif type(other) == float:
+            return Interval(other, other)
+        elif type(other) == int and -_max_exact_int <= other <= _max_exact_int:
+            v = float(other)
+            return Interval(v, v)
+        elif type(other) == int or type(other) == dec.Decimal:
+            return Interval(_float_down(other), _float_up(other))
+        elif isinstance(other, numbers.Integral):
+            return Interval._convert_to_interval(int(other))
+        elif isinstance(other, numbers.Real) and float(other) == other:
+            # numpy floating scalars (e.g. the interval ends read with pandas) are binary floats
+            v = float(other)
+            return Interval(v, v)
+        else:
+            return None
+
+    def __init__(self, a: float, b: float):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        a : interval's left end
+        b : interval's right end
+
+        """
+        if type(a) != float or type(b) != float:
+            raise TypeError("Interval constructor's arguments must be instances of float")
+        self.a = a
+        self.b = b
+
+    def __neg__(self):
+        return Interval(-self.b, -self.a)
+
+    def __eq__(self, other):
+        return (self.a == other.a) and (self.b == other.b)
+
+    def __add__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return Interval(_add_down(self.a, nother.a), _add_up(self.b, nother.b))
+
+    def __sub__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return Interval(_add_down(self.a, -nother.b), _add_up(self.b, -nother.a))
+
+    def __mul__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        a = min(_mul_down(self.a, nother.a), _mul_down(self.a, nother.b), _mul_down(self.b, nother.a),
+                _mul_down(self.b, nother.b))
+        b = max(_mul_up(self.a, nother.a), _mul_up(self.a, nother.b), _mul_up(self.b, nother.a),
+                _mul_up(self.b, nother.b))
+        return Interval(a, b)
+
+    def __pow__(self, other):
+        if isinstance(other, int) and other > 0:
+            if other == 1:
+                return self
+            if other % 2 == 0:
+                if self.a <= c_zero and self.b >= c_zero:
+                    a = c_zero
+                    b = _pow_up(max(-self.a, self.b), other)
+                elif self.a > c_zero:
+                    a = _pow_down(self.a, other)
+                    b = _pow_up(self.b, other)
+                else:
+                    a = _pow_down(-self.b, other)
+                    b = _pow_up(-self.a, other)
+            else:
+                a = _odd_pow_down(self.a, other)
+                b = _odd_pow_up(self.b, other)
+            return Interval(a, b)
+        elif isinstance(other, int) and other < 0:
+            # x^-n = 1 / x^n, the lambdified common subexpressions write the denominators so
+            return Interval(c_one, c_one) / self.__pow__(-other)
+        elif other == 1 / 2:
+            return self.sqrt()
+        elif other == 3 / 2:
+            return self.__pow__(3).sqrt()
+        else:
+            raise TypeError("Power must be a nonzero integer")
+
+    def sqrt(self):
+        return Interval(_sqrt_down(self.a), _sqrt_up(self.b))
+
+    def __truediv__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        if nother.a == nother.b == c_zero:
+            if self.a <= c_zero <= self.b:
+                return Interval(c_minf, c_inf)
+            else:
+                return None
+        elif nother.a > c_zero or nother.b < c_zero:
+            ra = _div_down(c_one, nother.b)
+            rb = _div_up(c_one, nother.a)
+            return self.__mul__(Interval(ra, rb))
+        elif self.a <= c_zero <= self.b:
+            return Interval(c_minf, c_inf)
+        elif nother.a == c_zero:
+            if self.b < c_zero:
+                return Interval(c_minf, _div_up(self.b, nother.b))
+            elif self.a > c_zero:
+                return Interval(_div_down(self.a, nother.b), c_inf)
+        elif nother.b == c_zero:
+            if self.b < c_zero:
+                return Interval(_div_down(self.b, nother.a), c_inf)
+            elif self.a > c_zero:
+                return Interval(c_minf, _div_up(self.a, nother.a))
+        else:  # nother.a < 0 < nother.b:
+            if self.b < c_zero:
+                ra = _div_up(self.b, nother.b)
+                rb = _div_down(self.b, nother.a)
+            elif self.a > c_zero:
+                ra = _div_up(self.a, nother.a)
+                rb = _div_down(self.a, nother.b)
+            return [Interval(c_minf, ra), Interval(rb, c_inf)]
+
+    def __radd__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return nother.__add__(self)
+
+    def __rsub__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return nother.__sub__(self)
+
+    def __rmul__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return nother.__mul__(self)
+
+    def __rtruediv__(self, other):
+        nother = Interval._convert_to_interval(other)
+        if nother is None:
+            return NotImplemented
+        return nother.__truediv__(self)
+
+    def __repr__(self):
+        return "[" + repr(self.a) + ", " + repr(self.b) + "]"
+
+
+# Some utility function for working with intervals
+
+def convert_to_interval(val):
+    """
+    Returns the narrowest interval containing val
+
+    Parameters
+    ----------
+    val : float, int, Decimal (or other real number exactly representable as a float)
+    """
+    return Interval._convert_to_interval(val)
+
+
+def mid(ival):
+    """
+    Returns the best approximation of the interval central point
+
+    Parameters
+    ----------
+    ival : interval
+    """
+    return 0.5 * ival.a + 0.5 * ival.b
+
+
+def mid_interval(ival):
+    """
+    Returns the narrowest interval, containing the interval central point
+
+    Parameters
+    ----------
+    ival : interval
+    """
+    return Interval(_add_down(0.5 * ival.a, 0.5 * ival.b), _add_up(0.5 * ival.a, 0.5 * ival.b))
+
+
+def wid(ival):
+    """
+    Returns the closest outer approximation of the interval's width
+
+    Parameters
+    ----------
+    ival : interval
+    """
+    return _add_up(ival.b, -ival.a)
+
+
+def intersect(ival1, ival2):
+    """
+    Computes the intersection of intervals
+
+    Parameters
+    ----------
+    ival1 : 1st interval
+    ival2 : 2nd interval
+
+    Returns
+    -------
+    The intersection of intervals ival1 and ival2 (None in there is no intersection)
+    """
+    if ival1.b < ival2.a or ival2.b < ival1.a:
+        return None
+    else:
+        return Interval(max(ival1.a, ival2.a), min(ival1.b, ival2.b))
+
+
+def is_in(x, ival):
+    """
+    Checks whether point x belongs to the interval ival
+
+    Parameters:
+    -----------
+    x : point
+    ival : interval
+
+    Returns:
+    -------
+    True if x lies withing ival, False otherwise
+    """
+    return ival.a <= x <= ival.b
+
+
+def is_dot_interval(x):
+    """
+    Checks whether the given interval is a dot interval, i.e. left end = right end
+
+    Parameters:
+    -----------
+    x : interval
+
+    Returns:
+    --------
+    True if x is a dot interval, False otherwise
+    """
+    return x.a == x.b
+
+
+# ------------ Elementary functions ------------------------
+#  The libm results are widened by libm_ulps and clipped to the range of the function
+
+# Enclosure of pi (math.pi is the float right below pi)
+pi = Interval(math.pi, _up(math.pi))
+
+# Enclosure of pi / 2
+pi05 = pi * 0.5
+
+# Enclosure of 2 pi
+pi2 = pi * 2.0
+
+
+def pi_interval():
+    """
+    Returns the enclosure of pi
+    """
+    return pi
+
+
+def exp(x: Interval):
+    """
+    Computes reliable bounds for the exponential.
+
+    Parameters:
+    -----------
+    x : an interval
+
+    Returns:
+    --------
+    Enclosing interval for exp(x)
+    """
+    try:
+        a = max(_widen_down(math.exp(x.a)), 0.0)
+    except OverflowError:
+        a = _down(math.inf)
+    try:
+        b = _widen_up(math.exp(x.b))
+    except OverflowError:
+        b = math.inf
+    return Interval(a, b)
+
+
+def log(x: Interval):
+    """
+    Computes reliable bounds for natural logarithm.
+
+    Parameters:
+    -----------
+    x : an interval
+
+    Returns:
+    --------
+    Enclosing interval for ln(x)
+    """
+    if x.b < 0:
+        raise ValueError("math domain error")
+    a = _widen_down(math.log(x.a)) if x.a > 0 else -math.inf
+    b = _widen_up(math.log(x.b)) if x.b > 0 else -math.inf
+    return Interval(a, b)
+
+
+def sqrt(x_input):
+    if isinstance(x_input, Interval):
+        return x_input.sqrt()
+    else:
+        return math.sqrt(x_input)
+
+
+def _contains_shift(x, shift):
+    # True if x may contain a point shift + 2 k pi for an integer k
+    lo = ((Interval(x.a, x.a) - shift) / pi2).a
+    hi = ((Interval(x.b, x.b) - shift) / pi2).b
+    return math.ceil(lo) <= math.floor(hi)
+
+
+def _trig(fun, x, max_shift, min_shift):
+    if math.isinf(x.a) or math.isinf(x.b) or x.b - x.a >= pi2.a:
+        return Interval(-1.0, 1.0)
+    fa = fun(x.a)
+    fb = fun(x.b)
+    if _contains_shift(x, max_shift):
+        b = 1.0
+    else:
+        b = min(_widen_up(max(fa, fb)), 1.0)
+    if _contains_shift(x, min_shift):
+        a = -1.0
+    else:
+        a = max(_widen_down(min(fa, fb)), -1.0)
+    return Interval(a, b)
+
+
+def sin(x_input: Interval):
+    """
+    Computes reliable bounds for sine.
+
+    Parameters:
+    -----------
+    x_input : an interval
+
+    Returns:
+    --------
+    Enclosing interval for sin(x)
+    """
+    return _trig(math.sin, x_input, pi05, -pi05)
+
+
+def cos(x_input: Interval):
+    """
+    Computes reliable bounds for cosine.
+
+    Parameters:
+    -----------
+    x_input : an interval
+
+    Returns:
+    --------
+    Enclosing interval for cos(x)
+    """
+    return _trig(math.cos, x_input, Interval(0.0, 0.0), pi)
@@ -0,0 +1,306 @@
+"""Code generator for straight-line interval evaluators
+
+Walks a sympy expression and emits a Python function that computes its natural interval extension on pairs of
+float locals (lower and upper ends) instead of going through interval.Interval operator overloading. Numeric
+subexpressions are folded into constants, common subexpressions are computed once, additions, multiplications
+and powers are inlined. The semantics follow interval.Interval.
+"""
+import math
+import sympy as sym
+import interval as ival
+
+
+def _div(al, ah, bl, bh):
+    if bl > 0 or bh < 0:
+        v1 = al / bl
+        v2 = al / bh
+        v3 = ah / bl
+        v4 = ah / bh
+        return min(v1, v2, v3, v4), max(v1, v2, v3, v4)
+    elif bh == 0 and bl < 0:
+        r = 1 / bl
+        v1 = al * -math.inf
+        v2 = al * r
+        v3 = ah * -math.inf
+        v4 = ah * r
+        return min(v1, v2, v3, v4), max(v1, v2, v3, v4)
+    elif bl == 0 and bh > 0:
+        r = 1 / bh
+        v1 = al * r
+        v2 = al * math.inf
+        v3 = ah * r
+        v4 = ah * math.inf
+        return min(v1, v2, v3, v4), max(v1, v2, v3, v4)
+    else:
+        return -math.inf, math.inf
+
+
+def _sin(l, h):
+    y = ival._sin((l, h))
+    return y.lo, y.hi
+
+
+def _cos(l, h):
+    y = ival._cos((l, h))
+    return y.lo, y.hi
+
+
+def _abs(l, h):
+    if h < 0:
+        return -h, -l
+    elif l < 0:
+        return 0.0, max(-l, h)
+    else:
+        return l, h
+
+
+def namespace():
+    """
+    Returns:
+        the globals required by the generated functions
+    """
+    return {"math": math, "inf": math.inf, "min": min, "max": max, "ival": ival, "_interval": ival._make, "_div": _div,
+            "_sin": _sin, "_cos": _cos, "_abs": _abs, "_exp": math.exp, "_log": math.log, "_sqrt": math.sqrt}
+
+
+class _Generator:
+    """
+    Emits the code of one function
+    """
+
+    def __init__(self, x):
+        self.x = x
+        self.lines = []
+        self.count = 0
+        self.values = {x: ("xl", "xh")}
+
+    def new(self):
+        self.count += 1
+        return "t" + str(self.count) + "l", "t" + str(self.count) + "h"
+
+    def emit(self, line):
+        self.lines.append("    " + line)
+
+    def const(self, c):
+        return repr(float(c))
+
+    def walk(self, e):
+        """
+        Returns a float for a constant subexpression or a pair of names for an interval one
+        """
+        if e in self.values:
+            return self.values[e]
+        if not e.free_symbols:
+            try:
+                v = float(e)
+            except TypeError:
+                raise NotImplementedError("Non-real constant " + str(e))
+            if math.isnan(v) or math.isinf(v):
+                raise NotImplementedError("Non-finite constant " + str(e))
+            return v
+        if e.is_Add:
+            return self.add(e)
+        if e.is_Mul:
+            return self.mul(e)
+        if e.is_Pow:
+            return self.pow(e)
+        if isinstance(e, sym.sin):
+            return self.call("_sin", e.args[0])
+        if isinstance(e, sym.cos):
+            return self.call("_cos", e.args[0])
+        if isinstance(e, sym.Abs):
+            return self.call("_abs", e.args[0])
+        if isinstance(e, sym.exp):
+            return self.monotone("_exp", e.args[0])
+        if isinstance(e, sym.log) and len(e.args) == 1:
+            return self.monotone("_log", e.args[0])
+        raise NotImplementedError("Unsupported expression " + str(e))
+
+    def add(self, e):
+        c = 0.0
+        terms = []
+        for arg in e.args:
+            v = self.walk(arg)
+            if isinstance(v, float):
+                c += v
+            else:
+                terms.append(v)
+        if not terms:
+            return c
+        l, h = self.new()
+        lo = " + ".join(t[0] for t in terms)
+        hi = " + ".join(t[1] for t in terms)
+        if c != 0:
+            lo += " + " + self.const(c)
+            hi += " + " + self.const(c)
+        self.emit(l + " = " + lo)
+        self.emit(h + " = " + hi)
+        return l, h
+
+    def mul_pair(self, u, v):
+        l, h = self.new()
+        self.emit("p1 = " + u[0] + " * " + v[0])
+        self.emit("p2 = " + u[0] + " * " + v[1])
+        self.emit("p3 = " + u[1] + " * " + v[0])
+        self.emit("p4 = " + u[1] + " * " + v[1])
+        self.emit(l + " = min(p1, p2, p3, p4)")
+        self.emit(h + " = max(p1, p2, p3, p4)")
+        return l, h
+
+    def scale(self, u, c):
+        if c == 1:
+            return u
+        l, h = self.new()
+        if c == -1:
+            self.emit(l + " = -" + u[1])
+            self.emit(h + " = -" + u[0])
+        elif c >= 0:
+            self.emit(l + " = " + self.const(c) + " * " + u[0])
+            self.emit(h + " = " + self.const(c) + " * " + u[1])
+        else:
+            self.emit(l + " = " + self.const(c) + " * " + u[1])
+            self.emit(h + " = " + self.const(c) + " * " + u[0])
+        return l, h
+
+    def product(self, factors):
+        c = 1.0
+        res = None
+        for f in factors:
+            v = self.walk(f)
+            if isinstance(v, float):
+                c *= v
+            elif res is None:
+                res = v
+            else:
+                res = self.mul_pair(res, v)
+        return c, res
+
+    def mul(self, e):
+        num = []
+        den = []
+        for arg in e.args:
+            if arg.is_Pow and arg.exp.is_Integer and arg.exp < 0 and arg.free_symbols:
+                den.append(arg.base ** -arg.exp)
+            else:
+                num.append(arg)
+        c, res = self.product(num)
+        if res is None and not den:
+            return c
+        if den:
+            dc, dres = self.product(den)
+            c /= dc
+            if res is None:
+                res = self.reciprocal(dres)
+            else:
+                res = self.div(res, dres)
+        return self.scale(res, c)
+
+    def div(self, u, v):
+        l, h = self.new()
+        self.emit(l + ", " + h + " = _div(" + u[0] + ", " + u[1] + ", " + v[0] + ", " + v[1] + ")")
+        return l, h
+
+    def reciprocal(self, v):
+        return self.div(("1.0", "1.0"), v)
+
+    def pow(self, e):
+        base = e.base
+        n = e.exp
+        if n.free_symbols:
+            raise NotImplementedError("Non-constant exponent in " + str(e))
+        u = self.walk(base)
+        if n.is_Integer or (n.is_Float and float(n) == int(n)):
+            n = int(n)
+            if n < 0:
+                return self.reciprocal(self.int_pow(u, -n))
+            return self.int_pow(u, n)
+        if n == sym.Rational(1, 2):
+            return self.monotone_vals("_sqrt", u)
+        p = float(n)
+        if p < 0:
+            return self.reciprocal(self.real_pow(u, -p))
+        return self.real_pow(u, p)
+
+    def int_pow(self, u, n):
+        if n == 0:
+            return "1.0", "1.0"
+        if n == 1:
+            return u
+        l, h = self.new()
+        self.emit("p1 = " + u[0] + " ** " + str(n))
+        self.emit("p2 = " + u[1] + " ** " + str(n))
+        if n % 2 == 0:
+            self.emit(h + " = max(p1, p2)")
+            self.emit(l + " = 0.0 if " + u[0] + " <= 0 <= " + u[1] + " else min(p1, p2)")
+        else:
+            self.emit(l + " = p1")
+            self.emit(h + " = p2")
+        return l, h
+
+    def real_pow(self, u, p):
+        l, h = self.new()
+        self.emit(l + " = " + u[0] + " ** " + self.const(p))
+        self.emit(h + " = " + u[1] + " ** " + self.const(p))
+        return l, h
+
+    def monotone(self, fun, arg):
+        return self.monotone_vals(fun, self.walk(arg))
+
+    def monotone_vals(self, fun, u):
+        l, h = self.new()
+        self.emit(l + " = " + fun + "(" + u[0] + ")")
+        self.emit(h + " = " + fun + "(" + u[1] + ")")
+        return l, h
+
+    def call(self, fun, arg):
+        u = self.walk(arg)
+        l, h = self.new()
+        self.emit(l + ", " + h + " = " + fun + "(" + u[0] + ", " + u[1] + ")")
+        return l, h
+
+
+def generate(expr, name="_ivalgenerated"):
+    """
+    Generates the source of an interval evaluator
+    Args:
+        expr: sympy expression of x
+        name: name of the generated function
+
+    Returns:
+        the source code of a function taking an interval.Interval and returning an interval.Interval
+
+    Raises:
+        NotImplementedError: if the expression contains unsupported operations
+    """
+    x = sym.symbols('x')
+    g = _Generator(x)
+    g.emit("xl = x.lo")
+    g.emit("xh = x.hi")
+    replacements, reduced = sym.cse([sym.sympify(expr)])
+    consts = {}
+    for s, e in replacements:
+        v = g.walk(e.xreplace(consts))
+        if isinstance(v, float):
+            consts[s] = sym.Float(v)
+        else:
+            g.values[s] = v
+    res = g.walk(reduced[0].xreplace(consts))
+    if isinstance(res, float):
+        res = (g.const(res), g.const(res))
+    g.emit("return _interval(" + res[0] + ", " + res[1] + ")")
+    return "def " + name + "(x):\n" + "\n".join(g.lines) + "\n"
+
+
+def compile_source(source, name="_ivalgenerated"):
+    """
+    Compiles a generated source
+    Args:
+        source: the code produced by generate
+        name: name of the generated function
+
+    Returns:
+        the evaluator
+    """
+    ns = namespace()
+    exec(compile(source, "<" + name + ">", "exec"), ns)
+    return ns[name]
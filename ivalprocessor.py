@@ -5,7 +5,7 @@ import numpy as np
 class IntervalProcessor:
     """    Simple Interval processor that uses interval bounds to prune subproblems
     """
-    def __init__(self, rec_v, rec_x, problem, eps):
+    def __init__(self, rec_v, rec_x, problem, eps, form="natural"):
         """
         Initializes processor
         Args:
@@ -13,14 +13,16 @@ class IntervalProcessor:
             rec_x: record point
             problem: problem to solve
             eps: tolerance
+            form: inclusion form used to bound the objective (see UniVarProblem.enclosure)
         """
+        self.form = form
         self.rec_v = rec_v
         self.rec_x = rec_x
         self.problem = problem
         self.eps = eps
 
     def compute_bounds(self, sub):
-        sub.bound = self.problem.objective(sub.data).x[0]
+        sub.bound = self.problem.enclosure(sub.data, self.form, self.rec_v - self.eps).x[0]
         c = sub.data.mid()
         v = self.problem.objective(c)
         if np.isnan(self.rec_v) or v < self.rec_v:
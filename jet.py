@@ -0,0 +1,185 @@
+"""Second order forward mode automatic differentiation
+
+A jet carries a value together with its first and second derivatives. The components can be plain floats,
+interval.Interval or interval_arithmetics.Interval, so one traversal of the objective yields f, f' and f''
+(or their enclosures) without differentiating the expression symbolically.
+"""
+
+
+class Jet:
+    """ Second order jet
+
+    Attributes:
+        v: value
+        d: first derivative
+        dd: second derivative
+    """
+    __slots__ = ('v', 'd', 'dd')
+
+    def __init__(self, v, d, dd):
+        """
+        Constructor
+        Args:
+            v: value
+            d: first derivative
+            dd: second derivative
+        """
+        self.v = v
+        self.d = d
+        self.dd = dd
+
+    def __repr__(self):
+        return "Jet(" + str(self.v) + ", " + str(self.d) + ", " + str(self.dd) + ")"
+
+    def __neg__(self):
+        return Jet(-self.v, -self.d, -self.dd)
+
+    def __add__(self, other):
+        if isinstance(other, Jet):
+            return Jet(self.v + other.v, self.d + other.d, self.dd + other.dd)
+        return Jet(self.v + other, self.d, self.dd)
+
+    def __radd__(self, other):
+        return Jet(other + self.v, self.d, self.dd)
+
+    def __sub__(self, other):
+        if isinstance(other, Jet):
+            return Jet(self.v - other.v, self.d - other.d, self.dd - other.dd)
+        return Jet(self.v - other, self.d, self.dd)
+
+    def __rsub__(self, other):
+        return Jet(other - self.v, -self.d, -self.dd)
+
+    def __mul__(self, other):
+        if isinstance(other, Jet):
+            return Jet(self.v * other.v, self.d * other.v + self.v * other.d,
+                       self.dd * other.v + 2 * (self.d * other.d) + self.v * other.dd)
+        return Jet(self.v * other, self.d * other, self.dd * other)
+
+    def __rmul__(self, other):
+        return Jet(other * self.v, other * self.d, other * self.dd)
+
+    def __truediv__(self, other):
+        if isinstance(other, Jet):
+            q = self.v / other.v
+            qd = (self.d - q * other.d) / other.v
+            qdd = (self.dd - 2 * (qd * other.d) - q * other.dd) / other.v
+            return Jet(q, qd, qdd)
+        return Jet(self.v / other, self.d / other, self.dd / other)
+
+    def __rtruediv__(self, other):
+        q = other / self.v
+        qd = -(q * self.d) / self.v
+        qdd = -(2 * (qd * self.d) + q * self.dd) / self.v
+        return Jet(q, qd, qdd)
+
+    def __pow__(self, other):
+        if isinstance(other, Jet):
+            raise TypeError("Only constant exponents are supported")
+        n = other
+        if n == int(n):
+            n = int(n)
+            if n == 0:
+                return Jet(1, 0, 0)
+            v = _pow(self.v, n)
+            p1 = _pow(self.v, n - 1)
+            p2 = _pow(self.v, n - 2)
+        else:
+            v = self.v ** n
+            p1 = v / self.v
+            p2 = p1 / self.v
+        d = n * (p1 * self.d)
+        dd = n * (n - 1) * (p2 * self.d ** 2) + n * (p1 * self.dd)
+        return Jet(v, d, dd)
+
+    def __rpow__(self, other):
+        raise TypeError("Only constant exponents are supported")
+
+
+def _pow(v, k):
+    if k == 0:
+        return 1
+    elif k == 1:
+        return v
+    elif k > 0:
+        return v ** k
+    else:
+        return 1 / _pow(v, -k)
+
+
+def variable(x):
+    """
+    Seeds the independent variable
+    Args:
+        x: point or interval
+
+    Returns:
+        the jet (x, 1, 0)
+    """
+    return Jet(x, 1, 0)
+
+
+def unpack(val):
+    """
+    Splits a result of a jet evaluation into components
+    Args:
+        val: a jet or a constant (returned when the expression does not depend on x)
+
+    Returns:
+        tuple (value, first derivative, second derivative)
+    """
+    if isinstance(val, Jet):
+        return val.v, val.d, val.dd
+    else:
+        return val, 0, 0
+
+
+def make_modules(base):
+    """
+    Builds lambdify modules that propagate jets through elementary functions
+    Args:
+        base: dictionary of elementary functions (sin, cos, exp, log, sqrt) acting on jet components
+
+    Returns:
+        dictionary of functions accepting both jets and plain values
+    """
+    sin_b = base["sin"]
+    cos_b = base["cos"]
+    exp_b = base["exp"]
+    log_b = base["log"]
+    sqrt_b = base["sqrt"]
+
+    def sin(u):
+        if not isinstance(u, Jet):
+            return sin_b(u)
+        s = sin_b(u.v)
+        c = cos_b(u.v)
+        return Jet(s, c * u.d, c * u.dd - s * u.d ** 2)
+
+    def cos(u):
+        if not isinstance(u, Jet):
+            return cos_b(u)
+        s = sin_b(u.v)
+        c = cos_b(u.v)
+        return Jet(c, -(s * u.d), -(s * u.dd) - c * u.d ** 2)
+
+    def exp(u):
+        if not isinstance(u, Jet):
+            return exp_b(u)
+        e = exp_b(u.v)
+        return Jet(e, e * u.d, e * (u.dd + u.d ** 2))
+
+    def log(u):
+        if not isinstance(u, Jet):
+            return log_b(u)
+        r = u.d / u.v
+        return Jet(log_b(u.v), r, u.dd / u.v - r ** 2)
+
+    def sqrt(u):
+        if not isinstance(u, Jet):
+            return sqrt_b(u)
+        r = sqrt_b(u.v)
+        rd = u.d / (2 * r)
+        return Jet(r, rd, (u.dd - 2 * rd ** 2) / (2 * r))
+
+    return {"sin": sin, "cos": cos, "exp": exp, "log": log, "sqrt": sqrt}
@@ -9,6 +9,7 @@ import sub as sub
 import ivalprocessor as ivproc
 import psqeprocessor as psproc
 import gridsearch as gs
+import probcache
 
 # from sortedcontainers import SortedList
 from sortedcontainers import SortedKeyList
@@ -22,7 +23,7 @@ def read_problems(fname):
 problems = read_problems("/tmp/shek.csv")
 print(problems)
 name = 'rshekel_3'
-prob = uvpr.UniVarProblem(name, problems.loc[name,'objective'], problems.loc[name,'a'], problems.loc[name,'b'], problems.loc[name,'min_f'], problems.loc[name,'min_x'])
+prob = uvpr.UniVarProblem(name, problems.loc[name,'objective'], problems.loc[name,'a'], problems.loc[name,'b'], problems.loc[name,'min_f'], problems.loc[name,'min_x'], cache = probcache.ProblemCache())
 print("Parsed objective = ", problems.loc[name,'objective'])
 print("Parsed problem = ", prob)
 
@@ -48,7 +49,7 @@ print("steps performed: ", bnb.bnb(sl, cnt, psp))
 print("Record value = ", psp.rec_v, " at ", psp.rec_x);
 print(sl)
 
-true_min = gs.grid_search(prob.objective, prob.a, prob.b, 1e-4)
+true_min = gs.grid_search(prob.objective_vec, prob.a, prob.b, 1e-4, vectorized=True)
 print("Grid search:", true_min)
 
 # while len(sl) > 0:
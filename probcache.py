@@ -0,0 +1,108 @@
+"""On-disk cache of compiled problems
+
+Each entry stores the source code of the generated evaluators of a problem, so the next run can rebuild them
+without parsing, differentiating and lambdifying the objective again. Entries are evicted on an LRU basis.
+"""
+import hashlib
+import json
+import os
+
+# Default location of the cache
+default_cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "univarsolver")
+
+# Bump when the layout of the entries changes
+cache_format = 3
+
+
+class ProblemCache:
+    """ Compiled problems cache
+
+    Attributes:
+        path: directory with the cache entries
+        max_entries: maximal number of entries kept on disk
+    """
+
+    def __init__(self, path=default_cache_dir, max_entries=1024):
+        """
+        Constructor
+        Args:
+            path: directory with the cache entries (created if missing)
+            max_entries: maximal number of entries kept on disk
+        """
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(path, exist_ok=True)
+
+    def key(self, *parts):
+        """
+        Computes the key of an entry
+        Args:
+            parts: values identifying the compiled problem (objective string, evaluation mode, modules, ...)
+
+        Returns:
+            hex digest of the parts
+        """
+        return hashlib.sha256(repr((cache_format,) + parts).encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + ".json")
+
+    def load(self, key):
+        """
+        Loads an entry and marks it as recently used
+        Args:
+            key: the entry's key
+
+        Returns:
+            the stored entry or None if there is no valid entry for the key
+        """
+        fname = self._file(key)
+        try:
+            with open(fname) as f:
+                entry = json.load(f)
+            os.utime(fname)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def store(self, key, entry):
+        """
+        Stores an entry and evicts the least recently used ones if the cache is full
+        Args:
+            key: the entry's key
+            entry: json-serializable entry
+        """
+        fname = self._file(key)
+        tmp = fname + "." + str(os.getpid()) + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, fname)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries above max_entries
+        """
+        try:
+            files = [e for e in os.scandir(self.path) if e.name.endswith(".json")]
+        except OSError:
+            return
+        if len(files) <= self.max_entries:
+            return
+        files.sort(key=lambda e: e.stat().st_mtime)
+        for e in files[:len(files) - self.max_entries]:
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+        for e in os.scandir(self.path):
+            if e.name.endswith(".json"):
+                os.remove(e.path)
@@ -11,17 +11,19 @@ class ProcData:
     The subproblem data used in algorithm
     """
 
-    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, counter: int, period_comp_lip):
+    def __init__(self, sub_interval: ival.Interval, lip: ival.Interval, counter: int, period_comp_lip, ends=None):
         """
         The constructor
         Args:
             sub_interval: the subproblem's interval
             split_point: the point to split interval
+            ends: values at the interval's ends inherited from the parent, [(a, fa, dfa), (b, fb, dfb)]
         """
         self.sub_interval = sub_interval
         self.lip = lip
         self.counter = counter
         self.period_comp_lip = period_comp_lip
+        self.ends = ends if ends is not None else [None, None]
 
 
 class ProcessorReduction:
@@ -47,6 +49,7 @@ class ProcessorReduction:
         self.eps = eps
         self.ddi = problem.ddf(ival.Interval([problem.a, problem.b]))
         self.di = problem.df(ival.Interval([problem.a, problem.b]))
+        self.fdf = problem.fused((0, 1))
         self.estimator = estimator
         self.reduction = reduction
         self.running = True
@@ -68,17 +71,46 @@ class ProcessorReduction:
                 L = max(-data.lip.x[0], data.lip.x[1])
                 data.lip = ival.Interval([-L, L])
 
-    def compute_bounds(self, data: ProcData, under: bool, dfa: float, dfb: float):
+    def point_values(self, x, cached=None):
+        """
+        Evaluates the objective (and its derivative for PSQE) at a point
+        Args:
+            x: the point
+            cached: the values computed earlier (x, f, df) or None
+
+        Returns:
+            tuple (x, f, df), df is None for the Piyavskii estimator
+        """
+        if cached is not None and cached[0] == x and (self.estimator == 1 or cached[2] is not None):
+            return cached
+        if self.estimator == 1:
+            return x, self.problem.objective(x), None
+        fx, dfx = self.fdf(x)
+        return x, fx, dfx
+
+    def end_values(self, data: ProcData):
+        """
+        Returns the values at the ends of the subinterval reusing the ones inherited from the parent
+        Args:
+            data: data of sub_interval
+
+        Returns:
+            tuple (fa, fb, dfa, dfb)
+        """
+        left = self.point_values(data.sub_interval.x[0], data.ends[0])
+        right = self.point_values(data.sub_interval.x[1], data.ends[1])
+        data.ends = [left, right]
+        return left[1], right[1], left[2], right[2]
+
+    def compute_bounds(self, data: ProcData, under: bool, fa: float, fb: float, dfa: float, dfb: float):
         a = data.sub_interval.x[0]
         b = data.sub_interval.x[1]
         if self.estimator == 1:
             return psl.PSL_Bounds(a=a, b=b, alp=data.lip.x[0], bet=data.lip.x[1],
-                                  fa=self.problem.objective(a) - self.rec_v,
-                                  fb=self.problem.objective(b) - self.rec_v, under=under)
+                                  fa=fa - self.rec_v, fb=fb - self.rec_v, under=under)
         else:
             return psqe.PSQE_Bounds(a=a, b=b, alp=data.lip.x[0], bet=data.lip.x[1],
-                                    fa=self.problem.objective(a) - self.rec_v,
-                                    fb=self.problem.objective(b) - self.rec_v,
+                                    fa=fa - self.rec_v, fb=fb - self.rec_v,
                                     dfa=dfa, dfb=dfb, under=under)
 
     def reduction2(self, data: ProcData, dfa: float, dfb: float) -> bool:
@@ -138,16 +170,23 @@ class ProcessorReduction:
                     data.counter = 0
             else:
                 self.update_lipschitz(data)
-        dfa = self.problem.df(data.sub_interval.x[0])
-        dfb = self.problem.df(data.sub_interval.x[1])
-        if self.reduction == 2 and self.reduction2(data=data, dfa=dfa, dfb=dfb):
-            print('reduced!')
-            return []
-        lower_estimator = self.compute_bounds(data=data, under=True, dfa=dfa, dfb=dfb)
+        a = data.sub_interval.x[0]
+        b = data.sub_interval.x[1]
+        fa, fb, dfa, dfb = self.end_values(data)
+        if self.reduction == 2:
+            if self.reduction2(data=data, dfa=dfa, dfb=dfb):
+                print('reduced!')
+                return []
+            if data.sub_interval.x[0] != a:
+                fa = obj(data.sub_interval.x[0])
+            if data.sub_interval.x[1] != b:
+                fb = obj(data.sub_interval.x[1])
+        lower_estimator = self.compute_bounds(data=data, under=True, fa=fa, fb=fb, dfa=dfa, dfb=dfb)
         (split_point, bound_y) = lower_estimator.lower_bound_and_point()
         if bound_y > -self.eps:
             return []
-        f_split = obj(split_point)
+        split_values = self.point_values(split_point)
+        f_split = split_values[1]
         if f_split < self.rec_v:
             self.rec_v = f_split
             self.rec_x = split_point
@@ -161,9 +200,10 @@ class ProcessorReduction:
                 sub_1 = ival.Interval([left_end, split_point])
                 data2 = ProcData(sub_interval=ival.Interval([split_point, right_end]),
                                  lip=copy.deepcopy(data.lip), counter=data.counter,
-                                 period_comp_lip=data.period_comp_lip)
+                                 period_comp_lip=data.period_comp_lip, ends=[split_values, data.ends[1]])
                 lst.append(data2)
                 data.sub_interval = sub_1
+                data.ends = [data.ends[0], split_values]
                 lst.append(data)
             else:
                 data.sub_interval = ival.Interval([left_end, right_end])
@@ -171,8 +211,10 @@ class ProcessorReduction:
         else:
             sub_1 = ival.Interval([sub_interval.x[0], split_point])
             data2 = ProcData(sub_interval=ival.Interval([split_point, sub_interval.x[1]]),
-                             lip=copy.deepcopy(data.lip), counter=data.counter, period_comp_lip=data.period_comp_lip)
+                             lip=copy.deepcopy(data.lip), counter=data.counter, period_comp_lip=data.period_comp_lip,
+                             ends=[split_values, data.ends[1]])
             lst.append(data2)
             data.sub_interval = sub_1
+            data.ends = [data.ends[0], split_values]
             lst.append(data)
         return lst
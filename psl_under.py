@@ -1,6 +1,7 @@
 """
 The piece-wise linear underestimator from Casado, L. G., MartÍnez, J. A., GarcÍa, I., & Sergeyev, Y. D. (2003). New interval analysis support functions using gradient information in a global minimization algorithm. Journal of Global Optimization, 25(4), 345-362.
 """
+import numpy as np
 
 
 class PSL_Under:
@@ -8,7 +9,7 @@ class PSL_Under:
     Piecewise linear underestimator
     """
 
-    def __init__(self, a, b, alp, bet, f):
+    def __init__(self, a, b, alp, bet, fa, fb):
         """
         The piecewise linear estimator constiructor
         Args:
@@ -16,15 +17,15 @@ class PSL_Under:
             b: right interval end
             alp: lower end of the Lipschitzian interval
             bet: upper end of the Lipschitzian interval
-            f: objective
+            fa: objective's value at a
+            fb: objective's value at b
         """
         self.a = a
         self.b = b
         self.alp = alp
         self.bet = bet
-        self.fa = f(a)
-        self.fb = f(b)
-        self.f = f
+        self.fa = fa
+        self.fb = fb
         self.c = (self.fa - self.fb + self.bet * self.b - self.alp * self.a) / (self.bet - self.alp)
 
     def __repr__(self):
@@ -61,4 +62,26 @@ class PSL_Under:
         """
         Returns: Tuple (point c where the best value of objective is achieved (a or b), f(c))
         """
-        return (self.a, self.fa) if self.fa <= self.fb else (self.b, self.fb)
\ No newline at end of file
+        return (self.a, self.fa) if self.fa <= self.fb else (self.b, self.fb)
+
+
+def lower_bounds_and_points(a, b, alp, bet, fa, fb):
+    """
+    The lower bounds of many piecewise linear underestimators (PSL_Under.lower_bound_and_point on arrays)
+    Args:
+        a: left interval ends (numpy array)
+        b: right interval ends
+        alp: lower ends of the Lipschitzian intervals (arrays or scalars)
+        bet: upper ends of the Lipschitzian intervals
+        fa: objective's values at a
+        fb: objective's values at b
+
+    Returns: Tuple (points where the bounds are achieved, lower bounds)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = (fa - fb + bet * b - alp * a) / (bet - alp)
+        # the estimator at c (c belongs to its left piece)
+        vc = fa + alp * (c - a)
+    x = np.where(alp >= 0, a, np.where(bet <= 0, b, c))
+    v = np.where(alp >= 0, fa, np.where(bet <= 0, fb, vc))
+    return x, v
@@ -1,3 +1,4 @@
+import numpy as np
 import sub as sb
 import interval as ival
 import psl_under as ps
@@ -6,15 +7,19 @@ class PSLData:
     """
     The subproblem data used on PSL subproblems
     """
-    def __init__(self, ival, split_point):
+    def __init__(self, ival, split_point, fa=None, fb=None):
         """
         The constructor
         Args:
             ival: the subproblem's interval
             split_point: the point to split interval
+            fa: objective's value at the left end (None - not computed yet)
+            fb: objective's value at the right end (None - not computed yet)
         """
         self.ival = ival
         self.split_point = split_point
+        self.fa = fa
+        self.fb = fb
 
 
 class PSLProcessor:
@@ -48,7 +53,11 @@ class PSLProcessor:
         if self.use_symm_lipint:
             L = max(-di[0], di[1])
             di = ival.Interval([-L,L])
-        psl = ps.PSL_Under(sub.data.ival[0], sub.data.ival[1], di[0], di[1], self.problem.objective)
+        if sub.data.fa is None:
+            sub.data.fa = self.problem.objective(sub.data.ival[0])
+        if sub.data.fb is None:
+            sub.data.fb = self.problem.objective(sub.data.ival[1])
+        psl = ps.PSL_Under(sub.data.ival[0], sub.data.ival[1], di[0], di[1], sub.data.fa, sub.data.fb)
         sub.data.split_point, sub.bound = psl.lower_bound_and_point()
         x, v = psl.record_and_point()
         if v < self.rec_v:
@@ -67,12 +76,66 @@ class PSLProcessor:
         """
         lst = []
         if sub.bound < self.rec_v - self.eps:
-            sub_1 = sb.Sub(sub.level + 1, 0, PSLData(ival.Interval([sub.data.ival.x[0], sub.data.split_point]), None))
+            c = sub.data.split_point
+            fc = self.problem.objective(c)
+            sub_1 = sb.Sub(sub.level + 1, 0, PSLData(ival.Interval([sub.data.ival.x[0], c]), None, sub.data.fa, fc))
             self.compute_bounds(sub_1)
-            sub_2 = sb.Sub(sub.level + 1, 0, PSLData(ival.Interval([sub.data.split_point, sub.data.ival.x[1]]), None))
+            sub_2 = sb.Sub(sub.level + 1, 0, PSLData(ival.Interval([c, sub.data.ival.x[1]]), None, fc, sub.data.fb))
             self.compute_bounds(sub_2)
             if sub_1.bound < self.rec_v - self.eps:
                 lst.append(sub_1)
             if sub_2.bound < self.rec_v - self.eps:
                 lst.append(sub_2)
         return lst
+
+    def process_batch(self, subs):
+        """
+        Process several subproblems at once
+
+        The objective is evaluated at all the split points and the bounds of all the children are computed in
+        single array calls. The children are the ones process would generate, but all of them are compared
+        with the record found in the whole batch.
+        Args:
+            subs: list of subproblems to process
+
+        Returns:
+            list of generated subproblems
+
+        """
+        subs = [s for s in subs if s.bound < self.rec_v - self.eps]
+        if not subs:
+            return []
+        n = len(subs)
+        c = np.array([s.data.split_point for s in subs], dtype=float)
+        fc = self.problem.objective_vec(c)
+        # the left children followed by the right ones
+        a = np.concatenate(([s.data.ival.x[0] for s in subs], c))
+        b = np.concatenate((c, [s.data.ival.x[1] for s in subs]))
+        fa = np.concatenate(([s.data.fa for s in subs], fc))
+        fb = np.concatenate((fc, [s.data.fb for s in subs]))
+        if self.global_lipint:
+            alp, bet = self.di[0], self.di[1]
+        else:
+            di = self.problem.df_enclosures(ival.IntervalArray(a, b))
+            alp, bet = di.lo, di.hi
+        if self.use_symm_lipint:
+            L = np.maximum(-alp, bet)
+            alp, bet = -L, L
+        points, bounds = ps.lower_bounds_and_points(a, b, alp, bet, fa, fb)
+        self._update_record(a, b, fa, fb)
+        a, b, fa, fb, points, bounds = (v.tolist() for v in (a, b, fa, fb, points, bounds))
+        lst = []
+        for i, s in enumerate(subs):
+            for j in (i, i + n):
+                if bounds[j] < self.rec_v - self.eps:
+                    lst.append(sb.Sub(s.level + 1, bounds[j],
+                                      PSLData(ival.Interval([a[j], b[j]]), points[j], fa[j], fb[j])))
+        return lst
+
+    def _update_record(self, a, b, fa, fb):
+        # record_and_point of the children's underestimators
+        v = np.where(fa <= fb, fa, fb)
+        i = np.argmin(v)
+        if v[i] < self.rec_v:
+            self.rec_x = float(a[i] if fa[i] <= fb[i] else b[i])
+            self.rec_v = float(v[i])
@@ -1,4 +1,5 @@
 # Piecewise smooth quadratic estimators
+import numpy as np
 
 
 class PSQE_Under:
@@ -6,7 +7,7 @@ class PSQE_Under:
     Piecewise quadratic underestimator
     """
 
-    def __init__(self, a, b, alp, bet, f, df):
+    def __init__(self, a, b, alp, bet, fa, fb, dfa, dfb):
         """
         The smooth piecewise quadratic estimator constiructor
         Args:
@@ -14,19 +15,19 @@ class PSQE_Under:
             b: right interval end
             alp: lower end of the Lipschitzian interval for derivative
             bet: upper end of the Lipschitzian interval for derivative
-            f: objective
-            df: objective's derivative
+            fa: objective's value at a
+            fb: objective's value at b
+            dfa: objective's derivative at a
+            dfb: objective's derivative at b
         """
         self.a = a
         self.b = b
         self.alp = alp
         self.bet = bet
-        self.fa = f(a)
-        self.fb = f(b)
-        self.dfa = df(a)
-        self.dfb = df(b)
-        self.f = f
-        self.df = df
+        self.fa = fa
+        self.fb = fb
+        self.dfa = dfa
+        self.dfb = dfb
 
         delt = (self.dfb - self.dfa - alp * (b - a)) / (bet - alp)
         # print("delt = ", delt)
@@ -198,3 +199,58 @@ class PSQE_Under:
         # if d3 >= 0:
         #     return self.root_third_left(d3)
         return None
+
+
+def _estimators(a, b, c, d, alp, bet, fa, fb, dfa, dfb, x):
+    # PSQE_Under.estimator on arrays
+    return np.where(x < c, fa + dfa * (x - a) + 0.5 * alp * (x - a) ** 2,
+                    np.where(x < d, fa + dfa * (c - a) + 0.5 * alp * (c - a) ** 2 + (dfa + alp * (c - a)) * (
+                            x - c) + 0.5 * bet * (x - c) ** 2,
+                             fb + dfb * (x - b) + 0.5 * alp * (x - b) ** 2))
+
+
+def _estimators_derivatives(a, b, c, d, alp, bet, dfa, dfb, x):
+    # PSQE_Under.estimators_derivative on arrays
+    return np.where(x < c, dfa + alp * (x - a),
+                    np.where(x < d, dfa + alp * (c - a) + bet * (x - c), dfb + alp * (x - b)))
+
+
+def _argmins(x1, df1, x2, df2):
+    # PSQE_Under.find_argmin on arrays, nan stands for None
+    xs = np.where((df1 <= 0) & (0 <= df2), x1 + (-df1) * (x2 - x1) / (df2 - df1), np.nan)
+    return np.where((df1 == 0) & (df2 == 0), 0.5 * (x1 + x2), xs)
+
+
+def lower_bounds_and_points(a, b, alp, bet, fa, fb, dfa, dfb):
+    """
+    The lower bounds of many piecewise quadratic underestimators (PSQE_Under.lower_bound_and_point on arrays)
+    Args:
+        a: left interval ends (numpy array)
+        b: right interval ends
+        alp: lower ends of the Lipschitzian intervals for derivative (arrays or scalars)
+        bet: upper ends of the Lipschitzian intervals for derivative
+        fa: objective's values at a
+        fb: objective's values at b
+        dfa: objective's derivatives at a
+        dfb: objective's derivatives at b
+
+    Returns: Tuple (points where the bounds are achieved, lower bounds)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delt = (dfb - dfa - alp * (b - a)) / (bet - alp)
+        c = ((delt - a) * dfa + (b - delt) * dfb + 0.5 * delt ** 2 * (bet - alp) + alp * delt * (
+                b - a) + 0.5 * alp * (a ** 2 - b ** 2) + fa - fb) / (delt * (bet - alp))
+        d = c + delt
+        x_list = [a, c, d, b]
+        df_list = [_estimators_derivatives(a, b, c, d, alp, bet, dfa, dfb, x) for x in x_list]
+        check = [np.broadcast_to(a, np.shape(c)), np.broadcast_to(b, np.shape(c))]
+        for i in range(3):
+            check.append(_argmins(x_list[i], df_list[i], x_list[i + 1], df_list[i + 1]))
+        check = np.array(check)
+        values = _estimators(a, b, c, d, alp, bet, fa, fb, dfa, dfb, check)
+    # the first minimal value as in the scalar version: the missing minimizers and the nan values do not count
+    # unless the value at a is nan
+    values[1:][np.isnan(values[1:])] = np.inf
+    i = np.argmin(values, axis=0)
+    cols = np.arange(values.shape[1])
+    return check[i, cols], values[i, cols]
@@ -1,3 +1,4 @@
+import numpy as np
 import sub as sb
 import interval as ival
 import psqe_under as ps
@@ -6,15 +7,23 @@ class PSQEData:
     """
     The subproblem data used on PSQE subproblems
     """
-    def __init__(self, ival, split_point):
+    def __init__(self, ival, split_point, fa=None, fb=None, dfa=None, dfb=None):
         """
         The constructor
         Args:
             ival: the subproblem's interval
             split_point: the point to split interval
+            fa: objective's value at the left end (None - not computed yet)
+            fb: objective's value at the right end (None - not computed yet)
+            dfa: derivative's value at the left end
+            dfb: derivative's value at the right end
         """
         self.ival = ival
         self.split_point = split_point
+        self.fa = fa
+        self.fb = fb
+        self.dfa = dfa
+        self.dfb = dfb
 
 
 class PSQEProcessor:
@@ -40,6 +49,17 @@ class PSQEProcessor:
         self.problem = problem
         self.eps = eps
         self.ddi = problem.ddf(ival.Interval([problem.a, problem.b]))
+        self.fdf = problem.fused((0, 1))
+
+    def __getstate__(self):
+        # the fused evaluator is rebuilt from the problem
+        state = dict(self.__dict__)
+        del state["fdf"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.fdf = self.problem.fused((0, 1))
 
     def compute_bounds(self, sub):
         if self.global_lipint:
@@ -49,7 +69,14 @@ class PSQEProcessor:
         if self.use_symm_lipint:
             L = max(-ddi.x[0], ddi.x[1])
             ddi = ival.Interval([-L,L])
-        psqe = ps.PSQE_Under(sub.data.ival[0], sub.data.ival[1], ddi[0], ddi[1], self.problem.objective, self.problem.df)
+        data = sub.data
+        a = data.ival[0]
+        b = data.ival[1]
+        if data.fa is None:
+            data.fa, data.dfa = self.fdf(a)
+        if data.fb is None:
+            data.fb, data.dfb = self.fdf(b)
+        psqe = ps.PSQE_Under(a, b, ddi[0], ddi[1], data.fa, data.fb, data.dfa, data.dfb)
         sub.data.split_point, sub.bound = psqe.lower_bound_and_point()
         x, v = psqe.record_and_point()
         if v < self.rec_v:
@@ -69,12 +96,72 @@ class PSQEProcessor:
         """
         lst = []
         if sub.bound < self.rec_v - self.eps:
-            sub_1 = sb.Sub(sub.level + 1, 0, PSQEData(ival.Interval([sub.data.ival.x[0], sub.data.split_point]), None))
+            data = sub.data
+            c = data.split_point
+            fc, dfc = self.fdf(c)
+            sub_1 = sb.Sub(sub.level + 1, 0,
+                           PSQEData(ival.Interval([data.ival.x[0], c]), None, data.fa, fc, data.dfa, dfc))
             self.compute_bounds(sub_1)
-            sub_2 = sb.Sub(sub.level + 1, 0, PSQEData(ival.Interval([sub.data.split_point, sub.data.ival.x[1]]), None))
+            sub_2 = sb.Sub(sub.level + 1, 0,
+                           PSQEData(ival.Interval([c, data.ival.x[1]]), None, fc, data.fb, dfc, data.dfb))
             self.compute_bounds(sub_2)
             if sub_1.bound < self.rec_v - self.eps:
                 lst.append(sub_1)
             if sub_2.bound < self.rec_v - self.eps:
                 lst.append(sub_2)
         return lst
+
+    def process_batch(self, subs):
+        """
+        Process several subproblems at once
+
+        The objective and its derivative are evaluated at all the split points and the bounds of all the children
+        are computed in single array calls. The children are the ones process would generate, but all of them are
+        compared with the record found in the whole batch.
+        Args:
+            subs: list of subproblems to process
+
+        Returns:
+            list of generated subproblems
+
+        """
+        subs = [s for s in subs if s.bound < self.rec_v - self.eps]
+        if not subs:
+            return []
+        n = len(subs)
+        c = np.array([s.data.split_point for s in subs], dtype=float)
+        fc = self.problem.objective_vec(c)
+        dfc = self.problem.df_vec(c)
+        # the left children followed by the right ones
+        a = np.concatenate(([s.data.ival.x[0] for s in subs], c))
+        b = np.concatenate((c, [s.data.ival.x[1] for s in subs]))
+        fa = np.concatenate(([s.data.fa for s in subs], fc))
+        fb = np.concatenate((fc, [s.data.fb for s in subs]))
+        dfa = np.concatenate(([s.data.dfa for s in subs], dfc))
+        dfb = np.concatenate((dfc, [s.data.dfb for s in subs]))
+        if self.global_lipint:
+            alp, bet = self.ddi[0], self.ddi[1]
+        else:
+            ddi = self.problem.ddf_enclosures(ival.IntervalArray(a, b))
+            alp, bet = ddi.lo, ddi.hi
+        if self.use_symm_lipint:
+            L = np.maximum(-alp, bet)
+            alp, bet = -L, L
+        points, bounds = ps.lower_bounds_and_points(a, b, alp, bet, fa, fb, dfa, dfb)
+        self._update_record(a, b, fa, fb)
+        a, b, fa, fb, dfa, dfb, points, bounds = (v.tolist() for v in (a, b, fa, fb, dfa, dfb, points, bounds))
+        lst = []
+        for i, s in enumerate(subs):
+            for j in (i, i + n):
+                if bounds[j] < self.rec_v - self.eps:
+                    lst.append(sb.Sub(s.level + 1, bounds[j],
+                                      PSQEData(ival.Interval([a[j], b[j]]), points[j], fa[j], fb[j], dfa[j], dfb[j])))
+        return lst
+
+    def _update_record(self, a, b, fa, fb):
+        # record_and_point of the children's underestimators
+        v = np.where(fa <= fb, fa, fb)
+        i = np.argmin(v)
+        if v[i] < self.rec_v:
+            self.rec_x = float(a[i] if fa[i] <= fb[i] else b[i])
+            self.rec_v = float(v[i])
@@ -0,0 +1,131 @@
+"""Expression rewriting against the interval dependency problem
+
+Interval evaluation treats every occurrence of x as an independent variable, so the natural extension of e.g.
+x^2 - x on [-2, 2] is [-2, 6] while x (x - 1) gives [-6, 6] and (x - 1/2)^2 - 1/4 gives the exact range
+[-1/4, 6]. This module builds equivalent forms of an expression (Horner form of the polynomial parts, completed
+squares, factored out common terms, partial fractions) and picks the one with the narrowest enclosure on the
+feasible interval.
+"""
+import math
+import sympy as sym
+import interval as ival
+
+# Elementary functions of interval.Interval used to evaluate the candidates
+_modules = [{"sin": ival.sin, "cos": ival.cos, "exp": ival.exp, "log": ival.log, "sqrt": ival.sqrt}]
+
+x = sym.symbols('x')
+
+# Minimal relative reduction of the enclosure's width for a rewritten form to be chosen
+min_gain = 1e-6
+
+
+def _is_poly(e, min_deg, max_deg=None):
+    if not e.is_Add or not e.has(x) or not e.is_polynomial(x):
+        return False
+    deg = sym.degree(e, x)
+    return deg >= min_deg and (max_deg is None or deg <= max_deg)
+
+
+def horner(expr):
+    """
+    Rewrites the polynomial sums of degree two and higher in Horner form
+    """
+    return expr.replace(lambda e: _is_poly(e, 2), lambda e: sym.horner(e, wrt=x))
+
+
+def _square(e):
+    a, b, c = sym.Poly(e, x).all_coeffs()
+    return a * (x + b / (2 * a)) ** 2 + (c - b ** 2 / (4 * a))
+
+
+def complete_square(expr):
+    """
+    Rewrites the quadratic sums a x^2 + b x + c as a (x + b / 2a)^2 + c - b^2 / 4a
+    """
+    return expr.replace(lambda e: _is_poly(e, 2, 2), _square)
+
+
+def factor_x(expr):
+    """
+    Factors out the common terms (in particular the repeated powers of x) of the sums
+    """
+    return sym.factor_terms(expr)
+
+
+def rational(expr):
+    """
+    Puts a rational function over a common denominator and writes both polynomials in Horner form
+    """
+    if not expr.is_rational_function(x):
+        return expr
+    num, den = sym.fraction(sym.cancel(expr))
+    return horner(num) / horner(den)
+
+
+def partial_fractions(expr):
+    """
+    Decomposes a rational function into partial fractions
+    """
+    if not expr.is_rational_function(x) or expr.is_polynomial(x):
+        return expr
+    return sym.apart(expr, x)
+
+
+# Rewriting rules tried by best_form
+rules = (("horner", horner), ("square", complete_square), ("factor", factor_x), ("rational", rational),
+         ("apart", partial_fractions))
+
+
+def width(expr, a, b):
+    """
+    Computes the width of the natural interval extension of an expression
+    Args:
+        expr: sympy expression of x
+        a: left end of the interval
+        b: right end of the interval
+
+    Returns:
+        the width (inf if the extension is unbounded or can not be evaluated)
+    """
+    try:
+        y = sym.lambdify(x, expr, modules=_modules)(ival.Interval([a, b]))
+    except (ArithmeticError, ValueError, TypeError):
+        return math.inf
+    if not isinstance(y, ival.Interval):
+        return 0.0
+    w = y.x[1] - y.x[0]
+    return math.inf if math.isnan(w) else w
+
+
+def best_form(expr, a, b):
+    """
+    Chooses the form of an expression with the narrowest enclosure on [a, b]
+    Args:
+        expr: sympy expression of x
+        a: left end of the interval
+        b: right end of the interval
+
+    Returns:
+        tuple (the chosen expression, report), the report is a dictionary with the name of the chosen form ("form"),
+        the widths of the original and chosen enclosures ("original_width", "width") and the widths of all the
+        candidates ("widths")
+    """
+    w0 = width(expr, a, b)
+    report = {"form": "original", "original_width": w0, "width": w0, "widths": {"original": w0}}
+    if not expr.has(x):
+        return expr, report
+    best = expr
+    for name, rule in rules:
+        try:
+            e = rule(expr)
+        except (sym.PolynomialError, NotImplementedError):
+            continue
+        if e == expr:
+            continue
+        w = width(e, a, b)
+        report["widths"][name] = w
+        if w < report["width"] * (1 - min_gain):
+            best = e
+            report["form"] = name
+            report["width"] = w
+    return best, report
@@ -8,7 +8,6 @@ import decimal as dec
 import interval_arithmetics as ival_corr
 import bnb as bnb
 import sub as sub
-from sortedcontainers import SortedKeyList
 from collections import namedtuple
 import sys
 import processor_reduction
@@ -24,7 +23,8 @@ def get_initial_recval(prob, known_record):
         return float('inf')
 
 
-def psl(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=True, known_record=False):
+def psl(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=True, known_record=False,
+         policy="depth", gap=None, time_limit=None, callback=None):
     """
     Runs quadratic minorant solver
     :param prob: problem to solver
@@ -33,21 +33,26 @@ def psl(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_in
     :param epsilon: tolerance (default 1e-2)
     :param global_lipschitz_interval: if True - use global Lipshitz constant or interval computed for the initial interval (default True)
     :param known_record: if True, use the known optimum as a record (default False)
+    :param policy: subproblems selection policy, one of bnb.policies (default "depth")
+    :param gap: stop when the record is within gap from the global lower bound (default None - solve to epsilon)
+    :param time_limit: stop after the given number of seconds (default None - no limit)
+    :param callback: function called with the bnb.Progress events of the run (default None)
     :return: the testing results 
     :rtype: TestResult
     """
     psp = pslproc.PSLProcessor(rec_v=get_initial_recval(prob, known_record), rec_x=None, problem=prob, eps=epsilon,
                                global_lipint=global_lipschitz_interval, use_symm_lipint=sym)
-    sl = SortedKeyList(key=lambda s: s.level)
+    sl = bnb.OpenList(policy)
     subp = sub.Sub(0, 0, pslproc.PSLData(ival.Interval([prob.a, prob.b]), 0))
     psp.compute_bounds(subp)
     sl.add(subp)
     cnt = max_steps
-    steps = bnb.bnb(sl, cnt, psp)
+    steps = bnb.bnb(sl, cnt, psp, gap=gap, time_limit=time_limit, callback=callback)
     return TestResult(nsteps=steps, record_value=psp.rec_v)
 
 
-def psqe(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=True, known_record=False):
+def psqe(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_interval=True, known_record=False,
+          policy="depth", gap=None, time_limit=None, callback=None):
     """
     Runs quadratic minorant solver
     :param prob: problem to solver
@@ -56,6 +61,10 @@ def psqe(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_i
     :param epsilon: tolerance (default 1e-2)
     :param global_lipschitz_interval: if True - use global Lipshitz constant or interval computed for the initial interval (default True)
     :param known_record: if True, use the known optimum as a record (default False)
+    :param policy: subproblems selection policy, one of bnb.policies (default "depth")
+    :param gap: stop when the record is within gap from the global lower bound (default None - solve to epsilon)
+    :param time_limit: stop after the given number of seconds (default None - no limit)
+    :param callback: function called with the bnb.Progress events of the run (default None)
     :return: the testing results 
     :rtype: TestResult
     """
@@ -73,12 +82,12 @@ def psqe(prob, sym=True, max_steps=sys.maxsize, epsilon=1e-2, global_lipschitz_i
                 psp.rec_x = psp.problem.b
         psp.rec_v = psp.problem.objective(psp.rec_x)
         return TestResult(nsteps=1, record_value=psp.rec_v)
-    sl = SortedKeyList(key=lambda s: s.level)
+    sl = bnb.OpenList(policy)
     subp = sub.Sub(0, 0, psqproc.PSQEData(ival.Interval([prob.a, prob.b]), 0))
     psp.compute_bounds(subp)
     sl.add(subp)
     cnt = max_steps
-    steps = bnb.bnb(sl, cnt, psp)
+    steps = bnb.bnb(sl, cnt, psp, gap=gap, time_limit=time_limit, callback=callback)
     return TestResult(nsteps=steps, record_value=psp.rec_v)
 
 
@@ -0,0 +1,67 @@
+import decimal as dec
+import os
+import sys
+import threading
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "FZCP"))
+import ia_math_fun as iaf
+import interval_arithmetics as ia
+import solv_fzcp as sfzcp
+import uvarprob as uvpr
+
+backends = ("decimal", "binary64")
+
+
+def test_negative_powers():
+    # Casado #11: the fused evaluators write the denominator as x**(-2)
+    for backend in backends:
+        prob = uvpr.UniVarProblem("11", "(x+1)^3/x^2-7.1", 0.2, 7, 0, 0, correctly=True, backend=backend)
+        res = sfzcp.correctly(prob, estimator=2)
+        crossing = res.first_crossing_zero_point[0]
+        assert 1.36 < float(crossing.a) <= float(crossing.b) < 1.37, (backend, res)
+
+
+def test_numpy_ends():
+    # the problems built from pandas tables have numpy.float64 ends
+    for backend in backends:
+        prob = uvpr.UniVarProblem("11", "(x+1)^3/x^2-7.1", np.float64(0.2), np.float64(7), 0, 0, correctly=True,
+                                  backend=backend)
+        res = sfzcp.correctly(prob, estimator=2)
+        crossing = res.first_crossing_zero_point[0]
+        assert 1.36 < float(crossing.a) <= float(crossing.b) < 1.37, (backend, res)
+
+
+def test_shared_context_cache():
+    # the threads sharing a verified context fill its coefficient tables concurrently, an entry appended twice
+    # shifts the coefficients the later (longer) series read
+    x = ia.Interval(dec.Decimal("0.3465"), dec.Decimal("0.4"))
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            ctx = ia.VerifiedContext(300)
+            start = threading.Barrier(8)
+
+            def run():
+                with ctx:
+                    start.wait()
+                    iaf.exp(x)
+
+            threads = [threading.Thread(target=run) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            with ctx:
+                table = [(c.a, c.b) for c in ctx.cache["tables"]["factorial"]]
+                assert table == [(c.a, c.b) for c in map(iaf._reciprocal_factorial, range(len(table)))]
+    finally:
+        sys.setswitchinterval(switch)
+
+if __name__ == "__main__":
+    test_negative_powers()
+    test_numpy_ends()
+    test_shared_context_cache()
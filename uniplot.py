@@ -23,11 +23,7 @@ def plot_problem(prob,  tips=default_graphic_tips, npoints=1000, legend=2):
     #     colors = ['r-', 'b-', 'g-', 'y-', 'm-', 'c-']
     step = (prob.b - prob.a) / npoints
     ta = np.arange(prob.a, prob.b + step, step)
-    num_points = len(ta)
-    fta = np.empty([num_points])
-
-    for i in range(num_points):
-        fta[i] = prob.objective(ta[i])
+    fta = prob.objective_vec(ta)
     lb = np.amin(fta)
     ub = np.amax(fta)
     d = (ub - lb) * 0.1
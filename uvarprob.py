@@ -1,6 +1,61 @@
+import builtins
+import contextlib
+import inspect
+import math
+import numpy as np
 import sympy as sym
+import constfold
+import evalstats
 import ia_math_fun as iaf
 import interval as ival
+import interval_arithmetics as ia
+import interval_binary64 as ib
+import ivalcodegen
+import jet
+import rewrite as rw
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Interval arithmetics of the correctly rounded evaluations: name -> (interval module, elementary functions module)
+backends = {"decimal": (ia, iaf), "binary64": (ib, ib)}
+
+# Inclusion forms supported by UniVarProblem.enclosure (from the cheapest to the most expensive)
+inclusion_forms = ("natural", "mean_value", "taylor")
+
+# The "adaptive" enclosure evaluates all the forms every adaptive_probe_period-th call and otherwise only the forms
+# giving the largest lower bound in at least adaptive_share of the comparisons
+adaptive_probe_period = 16
+adaptive_share = 0.1
+
+
+def _dispatch(point_f, ival_f):
+    """
+    Combines a point evaluator with an interval.Interval evaluator
+    """
+    if ival_f is None:
+        return point_f
+
+    def fun(x):
+        if type(x) is ival.Interval:
+            return ival_f(x)
+        return point_f(x)
+
+    return fun
+
+
+def _in_context(context, fun):
+    """
+    Makes an evaluator run in a verified context (interval_arithmetics.VerifiedContext)
+    """
+
+    def fun_ctx(x):
+        with context:
+            return fun(x)
+
+    return fun_ctx
 
 
 class UniVarProblem:
@@ -16,10 +71,19 @@ class UniVarProblem:
         b: right interval end
         min_f: global minumum function's value
         min_x: global minimum point
-        logger: logging function
+        logger: logging function called with each point or interval the objective is evaluated at (None - no logging)
+        stats: evalstats.EvalStats with the evaluation counts, None if accounting is disabled
+        ad: if True derivatives are computed by forward mode automatic differentiation
+        jit: True if the float point evaluations run numba-compiled code
+        backend: interval arithmetics module of the correctly rounded evaluations (interval_arithmetics or
+            interval_binary64), None if the problem is not correctly rounded
+        context: interval_arithmetics.VerifiedContext the evaluations on the decimal backend run in, None for the
+            other problems
     """
 
-    def __init__(self, name, objective, a, b, min_f, min_x, logger=lambda x: x, preproc=False, correctly=False):
+    def __init__(self, name, objective, a, b, min_f, min_x, logger=None, preproc=False, correctly=False,
+                 ad=False, cache=None, vec_logger=None, ival_codegen=True, rewrite=False, jit=False, backend="decimal",
+                 context=None):
         """ Constructor
         Args:
             name: name of a test example
@@ -28,22 +92,54 @@ class UniVarProblem:
             b: right end of a feasible interval
             min_f: global minimum (best known) value
             min_x: global minimum (best known) point
+            logger: function called with each argument of the objective, None - no logging (prefer
+                enable_accounting for counting evaluations)
+            ad: if True compute df and ddf with jets propagated through the objective instead of symbolic
+                derivatives (sym_df and sym_ddf are then built only on demand)
+            cache: probcache.ProblemCache to load the compiled evaluators from (and store them to), None - no caching
+            vec_logger: logging function called once per vectorized objective evaluation with the whole array
+            ival_codegen: if True evaluate interval.Interval arguments with generated straight-line code
+                (see ivalcodegen) instead of interval operator overloading
+            rewrite: if True evaluate the objective and its derivatives on interval.Interval arguments in the forms
+                with the narrowest enclosures on [a, b] (see rewrite); point evaluations and correctly rounded
+                problems use the original expressions
+            jit: if True and numba is installed compile the evaluations at float points to native code (the
+                objective, and in the symbolic mode also the derivatives and the fused evaluators); other arguments
+                and a missing numba fall back to the lambdified functions (see the jit attribute)
+            backend: interval arithmetics of the correctly rounded problems, "decimal" (interval_arithmetics on
+                Decimal ends) or "binary64" (interval_binary64, outward rounded floats, much faster)
+            context: interval_arithmetics.VerifiedContext (precision, numbers of series terms) of the evaluations on
+                the decimal backend, None - the context current at the construction; problems solved concurrently
+                should have their own contexts
         """
+        # The constructor's arguments, the evaluators are compiled again from them when the problem is unpickled
+        self._args = (name, str(objective), a, b, min_f, min_x, logger, preproc, correctly, ad, cache, vec_logger,
+                      ival_codegen, rewrite, jit, backend, context)
         self.name = name
-        self.sym_objective = sym.sympify(objective)
-        x = sym.symbols('x')
-        if preproc and self.sym_objective.subs(x, a) < 0:
-            self.sym_objective = -self.sym_objective
-
-        self.sym_df = self.sym_objective.diff()
-        self.sym_ddf = self.sym_df.diff()
+        self.a = a
+        self.b = b
+        self.min_f = min_f
+        self.min_x = min_x
+        self._objective_str = str(objective)
+        self._sym_objective = None
+        self._sym_df = None
+        self._sym_ddf = None
+        self.backend = None
+        self.context = None
+        self._funs = None
         if correctly:
-            module_sin = {"sin": iaf.sin}
-            module_cos = {"cos": iaf.cos}
-            module_exp = {"exp": iaf.exp}
+            if backend not in backends:
+                raise ValueError("Unknown interval backend " + str(backend))
+            self.backend, funs = backends[backend]
+            self._funs = funs
+            if self.backend is ia:
+                self.context = context if context is not None else ia.getcontext()
+            module_sin = {"sin": funs.sin}
+            module_cos = {"cos": funs.cos}
+            module_exp = {"exp": funs.exp}
             # module_abs = {"abs": abs}
-            module_log = {"log": iaf.log}
-            module_sqrt = {"sqrt": iaf.sqrt}
+            module_log = {"log": funs.log}
+            module_sqrt = {"sqrt": funs.sqrt}
         else:
             module_sin = {"sin": ival.sin}
             module_cos = {"cos": ival.cos}
@@ -52,24 +148,526 @@ class UniVarProblem:
             module_log = {"log": ival.log}
             module_sqrt = {"sqrt": ival.sqrt}
 
-        obj_f = sym.lambdify(x, self.sym_objective,
-                             modules=[module_sin, module_cos, module_exp, module_log, module_sqrt])
+        self._modules = [module_sin, module_cos, module_exp, module_log, module_sqrt]
+        base = {}
+        for module in self._modules:
+            base.update(module)
+        self._jet_modules = [jet.make_modules(base)]
 
-        def obj_log(x):
-            logger(x)
-            return obj_f(x)
+        self._cache = cache
+        self._entry = None
+        if cache is not None:
+            self._key = cache.key(self._objective_str, bool(correctly), bool(ad), bool(preproc), a if preproc else None,
+                                  (a, b) if rewrite else None, bool(ival_codegen), sym.__version__,
+                                  sorted((k, f.__module__ + "." + f.__qualname__) for k, f in base.items()))
+            self._entry = cache.load(self._key)
+        self._dirty = self._entry is None
+        if self._entry is None:
+            x = sym.symbols('x')
+            self._sym_objective = sym.sympify(objective)
+            negate = bool(preproc and self._sym_objective.subs(x, a) < 0)
+            if negate:
+                self._sym_objective = -self._sym_objective
+            self._entry = {"negate": negate, "sources": {}, "rewrite": {}, "constants": {}}
 
-        #         self.objective = sym.lambdify(x, self.sym_objective)
-        #         self.objective = obj_f
-        self.objective = obj_log
-        self.df = sym.lambdify(x, self.sym_df,
-                               modules=[module_sin, module_cos, module_exp, module_log, module_sqrt])
-        self.ddf = sym.lambdify(x, self.sym_ddf,
-                                modules=[module_sin, module_cos, module_exp, module_log, module_sqrt])
-        self.a = a
-        self.b = b
-        self.min_f = min_f
-        self.min_x = min_x
+        obj_f = self._compile("objective", lambda: self.sym_objective, self._modules)
+        use_codegen = ival_codegen and not correctly
+        self._rewrite = rewrite and not correctly
+        self._rewritten = {}
+        obj_i = self._interval_evaluator("objective", lambda: self.sym_objective, use_codegen)
+
+        self.jit = bool(jit and numba is not None and not correctly)
+        if self.jit:
+            obj_f = self._jit("objective", lambda: self.sym_objective, obj_f)
+        self.objective = _dispatch(obj_f, obj_i)
+        if self.context is not None:
+            self.objective = _in_context(self.context, self.objective)
+        if logger is not None:
+            obj_nolog = self.objective
+
+            def obj_log(x):
+                logger(x)
+                return obj_nolog(x)
+
+            self.objective = obj_log
+        self.logger = logger
+        self.vec_logger = vec_logger
+        self._fused = {}
+        self.stats = None
+        self._vec_funs = [None, None, None]
+        self.form_stats = {form: 0 for form in inclusion_forms}
+        self._adaptive_calls = 0
+        self.ad = ad
+        if ad:
+            self._jet_f = self._compile("jet", lambda: self.sym_objective, self._jet_modules)
+            jet_f = self._jet_f
+
+            def df_ad(x):
+                return jet.unpack(jet_f(jet.variable(x)))[1]
+
+            def ddf_ad(x):
+                return jet.unpack(jet_f(jet.variable(x)))[2]
+
+            self.df = df_ad
+            self.ddf = ddf_ad
+            if self._rewrite:
+                self.df = _dispatch(self.df, self._interval_evaluator("df", lambda: self.sym_df, use_codegen))
+                self.ddf = _dispatch(self.ddf, self._interval_evaluator("ddf", lambda: self.sym_ddf, use_codegen))
+        else:
+            self.df = self._compile("df", lambda: self.sym_df, self._modules)
+            self.ddf = self._compile("ddf", lambda: self.sym_ddf, self._modules)
+            if self.jit:
+                self.df = self._jit("df", lambda: self.sym_df, self.df)
+                self.ddf = self._jit("ddf", lambda: self.sym_ddf, self.ddf)
+            self.df = _dispatch(self.df, self._interval_evaluator("df", lambda: self.sym_df, use_codegen))
+            self.ddf = _dispatch(self.ddf, self._interval_evaluator("ddf", lambda: self.sym_ddf, use_codegen))
+        if self.context is not None:
+            self.df = _in_context(self.context, self.df)
+            self.ddf = _in_context(self.context, self.ddf)
+        self._evaluators = (self.objective, self.df, self.ddf)
+        self._save()
+
+    def with_backend(self, backend):
+        """
+        Returns the correctly rounded version of the problem on an interval backend
+        Args:
+            backend: "decimal" or "binary64"
+
+        Returns:
+            the problem itself if it is already evaluated on the backend, otherwise a new problem with the same
+            objective (negated if it was negated by the preprocessing) and the same settings of the evaluators
+            (including the verified context)
+        """
+        if backend not in backends:
+            raise ValueError("Unknown interval backend " + str(backend))
+        if self.backend is backends[backend][0]:
+            return self
+        return UniVarProblem(self.name, self.sym_objective, self.a, self.b, self.min_f, self.min_x, correctly=True,
+                             ad=self.ad, cache=self._cache, backend=backend, context=self.context)
+
+    def _compile(self, name, build, modules, **kwargs):
+        """
+        Returns the evaluator stored under the given name, lambdifying the expression if it is not yet compiled
+
+        In the correctly rounded problems the constant subexpressions are replaced by their enclosures (see
+        constfold), the constants are stored with the source to enclose them again when it is loaded.
+
+        Args:
+            name: evaluator's name
+            build: function returning the sympy expression (or tuple of expressions) to compile
+            modules: lambdify modules
+            kwargs: extra lambdify arguments
+
+        Returns:
+            the compiled function
+        """
+        sources = self._entry["sources"]
+        constants = self._entry["constants"]
+        if name not in sources:
+            expr = build()
+            values = {}
+            if self.backend is not None:
+                with self._context():
+                    expr, folded = constfold.fold(expr, self._enclose)
+                constants[name] = [(cname, sym.srepr(c)) for cname, c, _ in folded]
+                values = {cname: v for cname, _, v in folded}
+            fun = sym.lambdify(sym.symbols('x'), expr, modules=modules, **kwargs)
+            # lambdify binds the free symbols to themselves
+            fun.__globals__.update(values)
+            sources[name] = inspect.getsource(fun)
+            self._dirty = True
+            return fun
+        namespace = dict(vars(math))
+        namespace.update({"math": math, "builtins": builtins, "range": range})
+        for module in modules:
+            if module == "numpy":
+                namespace.update(vars(np))
+                namespace["numpy"] = np
+            elif module != "math":
+                namespace.update(module)
+        with self._context():
+            for cname, c in constants.get(name, []):
+                namespace[cname] = self._enclose(sym.sympify(c))
+        return self._load(name, "_lambdifygenerated", namespace)
+
+    def _context(self):
+        return self.context if self.context is not None else contextlib.nullcontext()
+
+    def _enclose(self, c):
+        return constfold.enclosure(c, self.backend, self._funs)
+
+    def _compile_ival(self, name, build):
+        """
+        Returns the generated interval evaluator stored under the given name, generating it if necessary
+        Args:
+            name: evaluator's name
+            build: function returning the sympy expression
+
+        Returns:
+            the evaluator or None if the expression is constant or not supported by the generator
+        """
+        sources = self._entry["sources"]
+        if name not in sources:
+            expr = build()
+            src = None
+            if expr.free_symbols:
+                try:
+                    src = ivalcodegen.generate(expr)
+                except NotImplementedError:
+                    pass
+            sources[name] = src
+            self._dirty = True
+        if sources[name] is None:
+            return None
+        return self._load(name, "_ivalgenerated", ivalcodegen.namespace())
+
+    def _jit(self, name, build, fallback, nvalues=1):
+        """
+        Compiles the evaluation at float points to native code
+        Args:
+            name: evaluator's name
+            build: function returning the sympy expression (or tuple of expressions)
+            fallback: evaluator for other arguments (and for floats if numba can not compile the expression)
+            nvalues: number of returned values (more than one for fused evaluators)
+
+        Returns:
+            the evaluator
+        """
+        if nvalues == 1:
+            signature = numba.float64(numba.float64)
+        else:
+            signature = numba.types.UniTuple(numba.float64, nvalues)(numba.float64)
+        try:
+            native = numba.njit(signature)(self._compile(name + "_math", build, ["math"]))
+        except numba.core.errors.NumbaError:
+            return fallback
+
+        def fun(x):
+            if type(x) is float:
+                return native(x)
+            return fallback(x)
+
+        return fun
+
+    def _interval_evaluator(self, name, build, codegen):
+        """
+        Returns the evaluator for interval.Interval arguments
+        Args:
+            name: name of the function ("objective", "df" or "ddf")
+            build: function returning the sympy expression
+            codegen: if True try to generate straight-line code
+
+        Returns:
+            the evaluator or None if the point evaluator should be used for intervals as well
+        """
+        if self._rewrite:
+            build = self._rewriter(name, build)
+        ival_f = self._compile_ival(name + "_ival", build) if codegen else None
+        if ival_f is None and self._rewrite and self._entry["rewrite"][name]["form"] != "original":
+            ival_f = self._compile(name + "_rewritten", build, self._modules)
+        return ival_f
+
+    def _rewriter(self, name, build):
+        """
+        Wraps an expression builder so that it returns the rewritten expression and records the report
+        """
+        def rewritten():
+            if name not in self._rewritten:
+                self._rewritten[name], self._entry["rewrite"][name] = rw.best_form(build(), self.a, self.b)
+                self._dirty = True
+            return self._rewritten[name]
+
+        if name not in self._entry["rewrite"]:
+            rewritten()
+        return rewritten
+
+    @property
+    def rewrite_report(self):
+        """ Dictionary function's name -> rewriting report (see rewrite.best_form), empty if rewriting is off """
+        return self._entry.get("rewrite", {}) if self._rewrite else {}
+
+    def _load(self, name, fname, namespace):
+        exec(compile(self._entry["sources"][name], "<univarsolver-" + name + ">", "exec"), namespace)
+        return namespace[fname]
+
+    def _save(self):
+        """
+        Writes newly compiled evaluators to the cache
+        """
+        if self._cache is not None and self._dirty:
+            self._cache.store(self._key, self._entry)
+        self._dirty = False
+
+    @property
+    def sym_objective(self):
+        """ The objective in sympy format (parsed on first access when the problem is loaded from the cache) """
+        if self._sym_objective is None:
+            self._sym_objective = sym.sympify(self._objective_str)
+            if self._entry["negate"]:
+                self._sym_objective = -self._sym_objective
+        return self._sym_objective
+
+    @property
+    def sym_df(self):
+        """ The first derivative in sympy format (computed on first access) """
+        if self._sym_df is None:
+            self._sym_df = self.sym_objective.diff()
+        return self._sym_df
+
+    @property
+    def sym_ddf(self):
+        """ The second derivative in sympy format (computed on first access) """
+        if self._sym_ddf is None:
+            self._sym_ddf = self.sym_df.diff()
+        return self._sym_ddf
+
+    def fused(self, orders=(0, 1, 2)):
+        """ Fused evaluator for the objective and its derivatives
+
+        All requested expressions are compiled into a single function after a common subexpression elimination
+        pass, so shared subterms are computed once per call. Evaluators are built lazily and cached per subset.
+        In the automatic differentiation mode all values come from a single jet traversal of the objective.
+
+        Args:
+            orders: derivative orders to compute (0 - objective, 1 - first derivative, 2 - second derivative)
+
+        Returns:
+            function of x returning a tuple of values in the order given by orders
+        """
+        orders = tuple(orders)
+        fun = self._fused.get(orders)
+        if fun is None:
+            if self.ad:
+                jet_f = self._jet_f
+
+                def fused_f(x):
+                    vals = jet.unpack(jet_f(jet.variable(x)))
+                    return tuple(vals[i] for i in orders)
+            else:
+                exprs = [lambda: self.sym_objective, lambda: self.sym_df, lambda: self.sym_ddf]
+                name = "fused" + "".join(str(i) for i in orders)
+                build = lambda: tuple(exprs[i]() for i in orders)
+                fused_f = self._compile(name, build, self._modules, cse=True)
+                if self.jit:
+                    fused_f = self._jit(name, build, fused_f, len(orders))
+                self._save()
+            if self.context is not None:
+                fused_f = _in_context(self.context, fused_f)
+            fun = fused_f
+            if 0 in orders and self.logger is not None:
+                logger = self.logger
+
+                def fused_log(x):
+                    logger(x)
+                    return fused_f(x)
+
+                fun = fused_log
+            if self.stats is not None:
+                fun = self.stats.wrap_fused(orders, fun, trace=True)
+            self._fused[orders] = fun
+        return fun
+
+    def enable_accounting(self, trace_capacity=0, trace_path=None):
+        """
+        Starts counting the evaluations of the objective and its derivatives
+
+        The evaluators (and the fused ones built later) are replaced by counting wrappers, so processors must be
+        created after this call. Without accounting the compiled functions are called directly.
+
+        Args:
+            trace_capacity: number of objective's evaluation points to record (0 - no tracing)
+            trace_path: file for a memory-mapped trace buffer, None - keep the trace in memory
+
+        Returns:
+            the evalstats.EvalStats collecting the counts
+        """
+        self.disable_accounting()
+        self.stats = evalstats.EvalStats(trace_capacity, trace_path)
+        f, df, ddf = self._evaluators
+        self.objective = self.stats.wrap("f", f, trace=True)
+        self.df = self.stats.wrap("df", df)
+        self.ddf = self.stats.wrap("ddf", ddf)
+        self._fused = {}
+        return self.stats
+
+    def disable_accounting(self):
+        """
+        Restores the evaluators without counters
+
+        Returns:
+            the evalstats.EvalStats with the collected counts or None if accounting was not enabled
+        """
+        stats = self.stats
+        self.stats = None
+        self.objective, self.df, self.ddf = self._evaluators
+        self._fused = {}
+        return stats
+
+    def _vec(self, order, xs):
+        fun = self._vec_funs[order]
+        if fun is None:
+            exprs = [lambda: self.sym_objective, lambda: self.sym_df, lambda: self.sym_ddf]
+            fun = self._compile(["objective_vec", "df_vec", "ddf_vec"][order], exprs[order], ["numpy"])
+            self._save()
+            self._vec_funs[order] = fun
+        res = fun(xs)
+        if np.shape(res) != xs.shape:
+            res = np.full(xs.shape, res, dtype=float)
+        return res
+
+    def objective_vec(self, xs):
+        """
+        Evaluates the objective at many points in one NumPy call
+        Args:
+            xs: array of points
+
+        Returns:
+            array of objective's values (floating point, also for correctly rounded problems)
+        """
+        xs = np.asarray(xs, dtype=float)
+        if self.vec_logger is not None:
+            self.vec_logger(xs)
+        if self.stats is not None:
+            self.stats.count_vec("f", xs.size)
+        return self._vec(0, xs)
+
+    def df_vec(self, xs):
+        """
+        Evaluates the first derivative at many points in one NumPy call
+        Args:
+            xs: array of points
+
+        Returns:
+            array of derivative's values
+        """
+        xs = np.asarray(xs, dtype=float)
+        if self.stats is not None:
+            self.stats.count_vec("df", xs.size)
+        return self._vec(1, xs)
+
+    def ddf_vec(self, xs):
+        """
+        Evaluates the second derivative at many points in one NumPy call
+        Args:
+            xs: array of points
+
+        Returns:
+            array of second derivative's values
+        """
+        xs = np.asarray(xs, dtype=float)
+        if self.stats is not None:
+            self.stats.count_vec("ddf", xs.size)
+        return self._vec(2, xs)
+
+    def _enclosures(self, order, xs):
+        if self.backend is not None or self.ad or self._rewrite:
+            # these evaluators accept only interval.Interval
+            fun = [self.objective, self.df, self.ddf][order]
+            return ival.from_intervals([ival.valueToInterval(fun(x)) for x in xs])
+        if self.stats is not None:
+            self.stats.count_vec(["f", "df", "ddf"][order], len(xs))
+        res = self._evaluators[order](xs)
+        if not isinstance(res, ival.IntervalArray):
+            res = ival.IntervalArray(np.full(len(xs), float(res)), np.full(len(xs), float(res)))
+        return res
+
+    def df_enclosures(self, xs):
+        """
+        Encloses the first derivative's ranges on many intervals in one call
+        Args:
+            xs: interval.IntervalArray
+
+        Returns:
+            interval.IntervalArray of the enclosures (natural interval extensions)
+        """
+        return self._enclosures(1, xs)
+
+    def ddf_enclosures(self, xs):
+        """
+        Encloses the second derivative's ranges on many intervals in one call
+        Args:
+            xs: interval.IntervalArray
+
+        Returns:
+            interval.IntervalArray of the enclosures (natural interval extensions)
+        """
+        return self._enclosures(2, xs)
+
+    def enclosure(self, x, form="natural", threshold=None):
+        """
+        Encloses the range of the objective on an interval
+        Args:
+            x: interval.Interval
+            form: "natural" - natural interval extension,
+                  "mean_value" - centered form f(c) + df(x) (x - c),
+                  "taylor" - second order form f(c) + df(c) (x - c) + ddf(x) (x - c)^2 / 2,
+                  "best" - always evaluates all the forms above and intersects them,
+                  "adaptive" - starts with the natural extension and evaluates the costlier forms only while the
+                               lower bound is below the threshold and only the forms that gave the largest lower
+                               bound in at least adaptive_share of the comparisons; every adaptive_probe_period-th
+                               call evaluates all the forms to keep the comparisons up to date
+                  "best" and the probes of "adaptive" count in form_stats for each form how many times it gave the
+                  largest lower bound (ties go to the cheaper form)
+            threshold: lower bound sufficient to discard the interval, e.g. the record value minus the tolerance
+                (used by "adaptive", None - no such bound)
+
+        Returns:
+            interval.Interval enclosing the objective's range on x
+        """
+        if form == "natural":
+            return self.objective(x)
+        elif form == "mean_value":
+            return self._mean_value_form(x)
+        elif form == "taylor":
+            return self._taylor_form(x)
+        elif form == "best":
+            return self._intersect([self.objective(x), self._mean_value_form(x), self._taylor_form(x)], True)
+        elif form == "adaptive":
+            return self._adaptive_form(x, threshold)
+        else:
+            raise ValueError("Unknown inclusion form " + str(form))
+
+    def _intersect(self, encls, count):
+        lo = max(e.x[0] for e in encls)
+        hi = min(e.x[1] for e in encls)
+        if count:
+            for i, e in enumerate(encls):
+                if e.x[0] == lo:
+                    self.form_stats[inclusion_forms[i]] += 1
+                    break
+        return ival.Interval([lo, hi])
+
+    def _adaptive_form(self, x, threshold):
+        self._adaptive_calls += 1
+        probe = self._adaptive_calls % adaptive_probe_period == 1
+        total = sum(self.form_stats.values())
+        encls = [self.objective(x)]
+        for form, fun in (("mean_value", self._mean_value_form), ("taylor", self._taylor_form)):
+            if not probe:
+                if threshold is not None and max(e.x[0] for e in encls) >= threshold:
+                    break
+                if self.form_stats[form] < adaptive_share * total:
+                    continue
+            encls.append(fun(x))
+        if len(encls) == 1:
+            return encls[0]
+        return self._intersect(encls, probe)
+
+    def _mean_value_form(self, x):
+        c = x.mid()
+        return self.df(x) * (x - c) + self.objective(c)
+
+    def _taylor_form(self, x):
+        c = x.mid()
+        fc, dfc = self.fused((0, 1))(c)
+        d = x - c
+        return 0.5 * self.ddf(x) * d ** 2 + dfc * d + fc
+
+    def __reduce__(self):
+        """
+        Pickles the problem as its constructor's arguments (the loggers must be picklable, the accounting is not kept)
+        """
+        return UniVarProblem, self._args
 
     def __repr__(self):
         return self.name + ": " + str(self.sym_objective) + " -> min, " + str(self.a) + " <= x <= " + str(